@@ -5,12 +5,23 @@ Includes pricing engine integration for Infosys discounts
 """
 
 import os
+import asyncio
+import copy
+import gzip
 import logging
 import hashlib
+import threading
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any, Tuple
 from datetime import datetime, timezone
+from urllib.parse import quote
+import orjson
 from algoliasearch.search.client import SearchClientSync
+from algoliasearch.search.config import SearchConfig
+from algoliasearch.http.exceptions import RequestException
+from algoliasearch.http.request_options import RequestOptions
+from algoliasearch.http.transporter_sync import TransporterSync
+from algoliasearch.http.verb import Verb
 import pandas as pd
 import io
 import aiofiles
@@ -27,20 +38,71 @@ PRODUCTS_INDEX = "omnisupply_products"
 PRODUCTS_INDEX_PRICE_ASC = "omnisupply_products_price_asc"
 PRODUCTS_INDEX_PRICE_DESC = "omnisupply_products_price_desc"
 
+# Records per save_objects call; a failed batch is skipped and counted, not retried whole
+ALGOLIA_BATCH_SIZE = 1000
+# save_objects calls in flight at once (each in a worker thread, the client is blocking)
+ALGOLIA_UPLOAD_CONCURRENCY = 8
+
+# Write bodies at least this large (record batches) are sent gzip-compressed
+ALGOLIA_GZIP_MIN_BYTES = 4096
+
+# Quiet period after the last upload before product grouping rescans the index
+PRODUCT_GROUPING_DELAY_SECONDS = 30
+
+
+class GzipTransporterSync(TransporterSync):
+    """Transporter that gzips large write request bodies (Content-Encoding: gzip).
+
+    Catalog JSON compresses to roughly a fifth of its size. If the API ever answers
+    415 Unsupported Media Type, the request is resent as plain JSON and compression
+    stays off for this client.
+    """
+
+    compress = True
+
+    def request(self, verb, path, request_options, use_read_transporter):
+        data = request_options.data
+        if not (
+            self.compress and verb != Verb.GET and not use_read_transporter
+            and isinstance(data, (str, bytes)) and len(data) >= ALGOLIA_GZIP_MIN_BYTES
+        ):
+            return super().request(verb, path, request_options, use_read_transporter)
+        compressed = copy.copy(request_options)
+        compressed.headers = {**request_options.headers, "content-encoding": "gzip"}
+        compressed.data = gzip.compress(data.encode("utf-8") if isinstance(data, str) else data, compresslevel=6)
+        try:
+            return super().request(verb, path, compressed, use_read_transporter)
+        except RequestException as e:
+            if e.status_code != 415:
+                raise
+            logger.warning("Algolia rejected a gzip request body; sending uncompressed from now on")
+            self.compress = False
+            return super().request(verb, path, request_options, use_read_transporter)
+
+
 # Initialize Algolia client
 algolia_client = None
+# Client config and base request options (credentials, timeouts) for pre-encoded batch requests
+algolia_config = None
+algolia_request_options = None
+# Batch requests run in worker threads; TransporterSync keeps per-request state (hosts, timeout,
+# lazily created session), so each thread gets its own transporter instead of sharing the client's
+batch_transporters = threading.local()
 
 
 def init_algolia():
     """Initialize Algolia client and configure indices"""
-    global algolia_client
+    global algolia_client, algolia_config, algolia_request_options
     
     if not ALGOLIA_APP_ID or not ALGOLIA_ADMIN_KEY:
         logger.warning("Algolia credentials not configured")
         return False
     
     try:
-        algolia_client = SearchClientSync(ALGOLIA_APP_ID, ALGOLIA_ADMIN_KEY)
+        config = SearchConfig(ALGOLIA_APP_ID, ALGOLIA_ADMIN_KEY)
+        algolia_config = config
+        algolia_client = SearchClientSync.create_with_config(config, GzipTransporterSync(config))
+        algolia_request_options = RequestOptions(config)
         
         # Configure index settings for optimal search
         index_settings = {
@@ -73,6 +135,7 @@ def init_algolia():
                 "filterOnly(availability)",
                 "filterOnly(in_stock)",
                 "filterOnly(has_image)",
+                "filterOnly(product_group_id)",
                 "price",
                 "selling_price",
                 "danone_preferred_price"
@@ -497,6 +560,26 @@ async def index_products_from_file(
     Index products from an uploaded Excel file to Algolia.
     Automatically detects supplier format and applies pricing.
     """
+    # Read Excel file
+    try:
+        df = pd.read_excel(io.BytesIO(file_content))
+    except Exception as e:
+        logger.error(f"Failed to index products from file: {e}")
+        return {"success": False, "error": str(e)}
+    return await index_product_chunks([df], filename, supplier, countries)
+
+
+async def index_product_chunks(
+    chunks: Iterable[pd.DataFrame],
+    filename: str,
+    supplier: str,
+    countries: List[str] = None
+) -> Dict:
+    """
+    Index products from a supplier file read in chunks (see scalable_ingestion.stream_file_chunks).
+    Each chunk is transformed, priced and saved before the next one is read, so only one
+    chunk of the file is held in memory at a time.
+    """
     global algolia_client
     
     if not algolia_client:
@@ -505,62 +588,64 @@ async def index_products_from_file(
     if not algolia_client:
         return {"success": False, "error": "Algolia not configured"}
     
+    # Determine supplier and transform function
+    supplier_lower = supplier.lower()
+    if "fastenal" in supplier_lower:
+        transform_func = transform_fastenal_product
+        supplier_name = "Fastenal"
+    elif "grainger" in supplier_lower:
+        transform_func = transform_grainger_product
+        supplier_name = "Grainger"
+    elif "motion" in supplier_lower:
+        transform_func = transform_motion_product
+        supplier_name = "Motion"
+    else:
+        # Generic transformation based on column names
+        transform_func = transform_fastenal_product
+        supplier_name = supplier
+    
     try:
-        # Read Excel file
-        df = pd.read_excel(io.BytesIO(file_content))
-        logger.info(f"Read {len(df)} rows from {filename}")
-        
-        # Determine supplier and transform function
-        supplier_lower = supplier.lower()
-        if "fastenal" in supplier_lower:
-            transform_func = transform_fastenal_product
-            supplier_name = "Fastenal"
-        elif "grainger" in supplier_lower:
-            transform_func = transform_grainger_product
-            supplier_name = "Grainger"
-        elif "motion" in supplier_lower:
-            transform_func = transform_motion_product
-            supplier_name = "Motion"
-        else:
-            # Generic transformation based on column names
-            transform_func = transform_fastenal_product
-            supplier_name = supplier
+        row_count = 0
+        valid_count = 0
+        total_indexed = 0
+        total_failed = 0
         
-        # Transform products
-        products = []
-        for _, row in df.iterrows():
-            try:
-                product = transform_func(row.to_dict(), countries or ["USA"])
-                if product.get("product_name"):
-                    products.append(product)
-            except Exception as e:
-                logger.warning(f"Failed to transform row: {e}")
+        for df in chunks:
+            row_count += len(df)
+            
+            # Transform products
+            products = []
+            for row in frame_records(df):
+                try:
+                    product = transform_func(row, countries or ["USA"])
+                    if product.get("product_name"):
+                        products.append(product)
+                except Exception as e:
+                    logger.warning(f"Failed to transform row: {e}")
+                    continue
+            if not products:
                 continue
+            valid_count += len(products)
+            
+            # Apply pricing calculations
+            products = await apply_pricing_to_products(products, None)
+            
+            # Batch save to Algolia
+            indexed_count, failed_count = await save_in_batches(products)
+            total_indexed += indexed_count
+            total_failed += failed_count
+            logger.info(f"Indexed {indexed_count} products ({total_indexed} so far)")
         
-        if not products:
+        logger.info(f"Read {row_count} rows from {filename}")
+        if not valid_count:
             return {"success": False, "error": "No valid products found in file"}
         
-        # Apply pricing calculations
-        products = await apply_pricing_to_products(products, None)
-        
-        # Batch save to Algolia (500 at a time)
-        batch_size = 500
-        total_indexed = 0
-        
-        for i in range(0, len(products), batch_size):
-            batch = products[i:i + batch_size]
-            try:
-                algolia_client.save_objects(PRODUCTS_INDEX, batch)
-                total_indexed += len(batch)
-                logger.info(f"Indexed batch {i//batch_size + 1}: {len(batch)} products")
-            except Exception as e:
-                logger.error(f"Failed to index batch: {e}")
-        
         logger.info(f"Successfully indexed {total_indexed} products from {supplier_name}")
         
         return {
             "success": True,
             "indexed_count": total_indexed,
+            "failed_count": total_failed,
             "supplier": supplier_name,
             "countries": countries or ["USA"],
             "filename": filename
@@ -592,13 +677,16 @@ async def index_products(products: List[Dict], supplier: str) -> Dict:
             return {"success": False, "error": "No valid products to index"}
         
         # Batch save
-        algolia_client.save_objects(PRODUCTS_INDEX, valid_products)
+        indexed_count, failed_count = await save_in_batches(valid_products)
         
-        logger.info(f"Indexed {len(valid_products)} products from {supplier}")
+        logger.info(f"Indexed {indexed_count} products from {supplier}")
         
+        if not indexed_count:
+            return {"success": False, "error": "All batches failed to index", "failed_count": failed_count}
         return {
             "success": True,
-            "indexed_count": len(valid_products),
+            "indexed_count": indexed_count,
+            "failed_count": failed_count,
             "supplier": supplier
         }
         
@@ -607,6 +695,56 @@ async def index_products(products: List[Dict], supplier: str) -> Dict:
         return {"success": False, "error": str(e)}
 
 
+def frame_records(df: pd.DataFrame) -> List[Dict]:
+    """Rows of df as dicts of native Python values, converted column by column
+    (same values as df.to_dict("records"), without its per-cell boxing)"""
+    columns = [str(column) for column in df.columns]
+    return [dict(zip(columns, row)) for row in zip(*(df[column].tolist() for column in df.columns))]
+
+
+def batch_transporter() -> GzipTransporterSync:
+    """This thread's transporter for batch requests, created on first use"""
+    transporter = getattr(batch_transporters, "transporter", None)
+    if transporter is None or transporter.config is not algolia_config:
+        transporter = batch_transporters.transporter = GzipTransporterSync(algolia_config)
+    return transporter
+
+
+def post_batch(index_name: str, records: List[Dict]) -> None:
+    """Add or replace records with one batch request, encoded by orjson straight from the dicts
+    (save_objects first copies every record through the SDK's body_serializer and stdlib json)"""
+    body = orjson.dumps(
+        {"requests": [{"action": "addObject", "body": record} for record in records]},
+        default=str, option=orjson.OPT_SERIALIZE_NUMPY,
+    )
+    batch_transporter().request(
+        verb=Verb.POST,
+        path="/1/indexes/{}/batch".format(quote(index_name, safe="")),
+        request_options=algolia_request_options.merge(data=body),
+        use_read_transporter=False,
+    )
+
+
+async def save_in_batches(products: List[Dict]) -> Tuple[int, int]:
+    """Save products ALGOLIA_BATCH_SIZE at a time, up to ALGOLIA_UPLOAD_CONCURRENCY batches in
+    parallel; returns (indexed, failed) record counts"""
+    semaphore = asyncio.Semaphore(ALGOLIA_UPLOAD_CONCURRENCY)
+    
+    async def save(batch: List[Dict]) -> None:
+        async with semaphore:
+            await asyncio.to_thread(post_batch, PRODUCTS_INDEX, batch)
+    
+    batches = [products[i:i + ALGOLIA_BATCH_SIZE] for i in range(0, len(products), ALGOLIA_BATCH_SIZE)]
+    indexed_count = failed_count = 0
+    for batch, outcome in zip(batches, await asyncio.gather(*(save(b) for b in batches), return_exceptions=True)):
+        if isinstance(outcome, Exception):
+            failed_count += len(batch)
+            logger.error(f"Failed to index batch: {outcome}")
+        else:
+            indexed_count += len(batch)
+    return indexed_count, failed_count
+
+
 async def update_product_grouping():
     """Update product grouping to identify lowest prices across suppliers"""
     global algolia_client
@@ -654,14 +792,50 @@ async def update_product_grouping():
         logger.error(f"Failed to update product grouping: {e}")
 
 
+# Set by every upload; the single grouping task runs once per quiet period
+_grouping_pending = asyncio.Event()
+_grouping_task: Optional[asyncio.Task] = None
+
+
+async def _run_product_grouping() -> None:
+    """Wait out bursts of uploads, then regroup; repeats if uploads arrived during the run"""
+    while _grouping_pending.is_set():
+        while _grouping_pending.is_set():
+            _grouping_pending.clear()
+            await asyncio.sleep(PRODUCT_GROUPING_DELAY_SECONDS)
+        await update_product_grouping()
+
+
+def schedule_product_grouping() -> None:
+    """Debounced, single-flight update_product_grouping: at most one run at a time,
+    back-to-back uploads coalesce into one run after PRODUCT_GROUPING_DELAY_SECONDS"""
+    global _grouping_task
+    _grouping_pending.set()
+    if _grouping_task is None or _grouping_task.done():
+        _grouping_task = asyncio.create_task(_run_product_grouping())
+
+
+# Attributes a catalog result card / quick-view needs; detail pages ask for ["*"]
+SEARCH_HIT_ATTRIBUTES = [
+    "objectID", "product_name", "brand", "part_number", "sku", "short_description", "category",
+    "supplier", "vendor", "price", "list_price", "selling_price", "discount_percentage",
+    "danone_preferred_price", "customer_savings_percent", "availability", "in_stock", "stock_quantity",
+    "stock_available", "images", "primary_image", "use_placeholder", "unit", "uom", "moq", "unspsc_code",
+    "infoshop_part_number", "mfg_part_number", "partner_part_number", "is_lowest_price", "supplier_count",
+    "product_group_id"
+]
+SEARCH_HIGHLIGHT_ATTRIBUTES = ["product_name", "brand", "description", "infoshop_part_number", "mfg_part_number"]
+
+
 def search_products(
     query: str,
     filters: Dict = None,
     page: int = 0,
     hits_per_page: int = 24,
-    sort_by: str = None
+    sort_by: str = None,
+    attributes_to_retrieve: List[str] = None
 ) -> Dict:
-    """Search products with Algolia"""
+    """Search products with Algolia; attributes_to_retrieve trims the hits (None keeps the index default)"""
     global algolia_client
     
     if not algolia_client:
@@ -703,19 +877,24 @@ def search_products(
         
         filter_string = " AND ".join(filter_parts) if filter_parts else ""
         
+        search_params = {
+            "query": query,
+            "page": page,
+            "hitsPerPage": hits_per_page,
+            "filters": filter_string,
+            "facets": ["brand", "category", "supplier", "vendor", "country", "in_stock", "has_image"],
+            "attributesToHighlight": SEARCH_HIGHLIGHT_ATTRIBUTES,
+            "getRankingInfo": True
+        }
+        if attributes_to_retrieve and "*" not in attributes_to_retrieve:
+            # Highlighting an attribute that is not retrieved would still ship its full text
+            search_params["attributesToRetrieve"] = attributes_to_retrieve
+            search_params["attributesToHighlight"] = [a for a in SEARCH_HIGHLIGHT_ATTRIBUTES if a in attributes_to_retrieve]
+        elif attributes_to_retrieve:
+            search_params["attributesToRetrieve"] = ["*"]
+        
         # Execute search
-        response = algolia_client.search_single_index(
-            index_name,
-            {
-                "query": query,
-                "page": page,
-                "hitsPerPage": hits_per_page,
-                "filters": filter_string,
-                "facets": ["brand", "category", "supplier", "vendor", "country", "in_stock", "has_image"],
-                "attributesToHighlight": ["product_name", "brand", "description", "infoshop_part_number", "mfg_part_number"],
-                "getRankingInfo": True
-            }
-        )
+        response = algolia_client.search_single_index(index_name, search_params)
         
         # Convert Hit objects to dicts using model_dump()
         hits_as_dicts = []
@@ -746,8 +925,8 @@ def search_products(
         return {"hits": [], "nbHits": 0, "error": str(e)}
 
 
-def get_facet_values(facet_name: str, query: str = "") -> List[Dict]:
-    """Get all values for a specific facet"""
+def get_facet_values(facet_name: str, query: str = "", max_hits: int = 100) -> List[Dict]:
+    """Get the max_hits most frequent values of a facet (100 is Algolia's maximum)"""
     global algolia_client
     
     if not algolia_client:
@@ -762,7 +941,7 @@ def get_facet_values(facet_name: str, query: str = "") -> List[Dict]:
             facet_name,
             {
                 "facetQuery": query,
-                "maxFacetHits": 100
+                "maxFacetHits": max_hits
             }
         )
         return response.facet_hits
@@ -771,6 +950,60 @@ def get_facet_values(facet_name: str, query: str = "") -> List[Dict]:
         return []
 
 
+def get_product_with_related(object_id: str, group_id: str = None, limit: int = 10) -> Tuple[Optional[Dict], List[Dict]]:
+    """A product and up to limit other suppliers' offers in its product group.
+    With the caller's group_id hint (opt-in) both lookups go out as one multi-query request;
+    without it (or if the hint is stale) the group is only known after fetching the product,
+    so it takes two round trips."""
+    global algolia_client
+    
+    if not algolia_client:
+        init_algolia()
+    
+    if not algolia_client:
+        return None, []
+    
+    def group_query(gid: str) -> Dict:
+        return {
+            "indexName": PRODUCTS_INDEX,
+            "filters": f'product_group_id:"{gid}"',
+            "hitsPerPage": limit + 1,
+            "attributesToHighlight": []
+        }
+    
+    def related_hits(result) -> List[Dict]:
+        hits = [hit.to_dict() for hit in result.actual_instance.hits]
+        return [hit for hit in hits if hit.get("objectID") != object_id][:limit]
+    
+    if group_id:
+        response = algolia_client.search({"requests": [
+            {
+                "indexName": PRODUCTS_INDEX,
+                "filters": f'objectID:"{object_id}"',
+                "hitsPerPage": 1,
+                "attributesToRetrieve": ["*"],
+                "attributesToHighlight": []
+            },
+            group_query(group_id)
+        ]})
+        product_result, group_result = response.results
+        product_hits = product_result.actual_instance.hits
+        if not product_hits:
+            return None, []
+        product = product_hits[0].to_dict()
+        if product.get("product_group_id") == group_id:
+            return product, related_hits(group_result)
+    else:
+        product = algolia_client.get_object(PRODUCTS_INDEX, object_id)
+        if not product:
+            return None, []
+    
+    if not product.get("product_group_id"):
+        return product, []
+    response = algolia_client.search({"requests": [group_query(product["product_group_id"])]})
+    return product, related_hits(response.results[0])
+
+
 def get_index_stats() -> Dict:
     """Get statistics about the Algolia index"""
     global algolia_client
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Bake CDN Image URLs into the Reference Data Blob
+=================================================
+
+Resolves image references in data/reference.json against the current CDN
+manifests in server.py, so the runtime only decodes plain URL strings:
+- services rows get an image_url column (SERVICE_IMAGE_URLS by category)
+- InfoCoin rewards' image_url keys become REWARD_IMAGE_URLS values
+
+Safe to re-run; already resolved URLs are left as they are.
+
+Usage: python bake_catalog.py
+"""
+
+import json
+from typing import Dict, List
+
+from catalog_service import CATALOG_DATA_DIR
+from server import DEFAULT_SERVICE_IMAGE, REWARD_IMAGE_URLS, SERVICE_IMAGE_URLS
+
+REFERENCE_PATH = CATALOG_DATA_DIR / "reference.json"
+
+
+def bake_services(fields: List[str], rows: List[List]) -> None:
+    """Append (or refresh) the image_url column of the services rows"""
+    if "image_url" not in fields:
+        fields.append("image_url")
+        for row in rows:
+            row.append(None)
+    category_at, image_at = fields.index("category"), fields.index("image_url")
+    for row in rows:
+        row[image_at] = SERVICE_IMAGE_URLS.get(row[category_at], DEFAULT_SERVICE_IMAGE)
+
+
+def bake_rewards(rewards: List[Dict]) -> None:
+    """Replace reward image keys with their CDN URLs"""
+    for reward in rewards:
+        reward["image_url"] = REWARD_IMAGE_URLS.get(reward["image_url"], reward["image_url"])
+
+
+def dump_blob(blob: Dict) -> str:
+    """Blob JSON with one section key per line and one row per line"""
+    lines = ["{"]
+    sections = list(blob.items())
+    for i, (key, value) in enumerate(sections):
+        comma = "," if i < len(sections) - 1 else ""
+        if key == "fields" or not isinstance(value, list):
+            lines.append(f"  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}{comma}")
+            continue
+        lines.append(f"  {json.dumps(key)}: [")
+        lines.extend(
+            f"    {json.dumps(row, ensure_ascii=False)}{',' if j < len(value) - 1 else ''}"
+            for j, row in enumerate(value)
+        )
+        lines.append(f"  ]{comma}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    with open(REFERENCE_PATH, encoding="utf-8") as f:
+        blob = json.load(f)
+    bake_services(blob["fields"], blob["services"])
+    bake_rewards(blob["infocoin_rewards"])
+    REFERENCE_PATH.write_text(dump_blob(blob), encoding="utf-8")
+    print(f"Baked {len(blob['services'])} services and {len(blob['infocoin_rewards'])} rewards into {REFERENCE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,612 @@
+"""
+Static Catalog Service
+Serves the curated IT and vendor product catalogs and the IT services catalog
+shown on OMNISupply search
+
+Features:
+- Preparsed JSON blobs (one shard per product subcatalog under data/products/, plus
+  data/services.json) memory-mapped and decoded once per process with orjson; rows
+  are stored as value arrays under one shared field header
+- Subcatalogs and the derived index are built lazily on first access, or up front in
+  a pre-fork master (warm_catalog) so workers share them copy-on-write
+- String interning for low-cardinality catalog fields (brand, category, image URL, ...)
+  and identical availability records shared as one dict
+- Flyweight specifications: one shared key schema per spec layout, interned values in
+  tuples, and identical spec sets hash-consed to one object
+- Inverted indexes (brand, category) intersected smallest-first
+- Inverted word-token index over the search text (posting lists intersected
+  smallest-first, sorted tokens for prefix ranges), with (query, filters) results
+  memoized per index
+- Column-oriented pandas frame (categorical brand / category / warehouse, pre-lowercased
+  text) for vectorised search scoring, plus one joined lowercase search string per row
+  for substring matches
+- NamedTuple rows (CatalogRow) for per-row field access in handler loops
+- Encoded (body, ETag) responses kept in an LRU + TTL cache (ResponseCache)
+- Static bodies (reference lists) precompressed once with gzip and Brotli and served as
+  is to clients that accept the encoding
+- Column view of the searchable services (lowercased text, category codes, base
+  prices) filtered with vectorised masks; response dicts are built only for hits
+"""
+
+import gc
+import re
+import gzip
+import sys
+import mmap
+import time
+import bisect
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import zip_longest
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Any, NamedTuple, Optional, Tuple
+
+import brotli
+import numpy as np
+import orjson
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CATALOG BLOB
+# =============================================================================
+
+CATALOG_DATA_DIR = Path(__file__).parent / "data"
+# One shard file per product subcatalog, so loading one never decodes the others
+PRODUCT_SHARD_DIR = CATALOG_DATA_DIR / "products"
+SERVICES_BLOB_PATH = CATALOG_DATA_DIR / "services.json"
+
+
+def load_catalog_blob(path: Path) -> Dict[str, Any]:
+    """Decode a catalog blob in a single orjson pass straight from a read-only memory map"""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def make_product(fields: Tuple[str, ...], row: List[Any]) -> Dict:
+    """Build one product dict from a blob row aligned with the blob's field header"""
+    return dict(zip(fields, row))
+
+
+def build_products(blob: Dict[str, Any], section: str) -> List[Dict]:
+    """Expand one catalog section of the blob into product dicts"""
+    fields = tuple(sys.intern(field) for field in blob["fields"])
+    return [make_product(fields, row) for row in blob[section]]
+
+
+# Low-cardinality fields repeated across rows (products and services)
+INTERNED_FIELDS = (
+    "brand", "category", "unspsc_code", "unspsc_name", "image_url",
+    "supplier_name", "supplier_color", "pricing_model", "unit_of_measure", "country",
+)
+
+
+def intern_catalog_strings(products: List[Dict]) -> None:
+    """Intern repeated low-cardinality strings so duplicates share one object"""
+    for product in products:
+        for key in INTERNED_FIELDS:
+            if isinstance(product.get(key), str):
+                product[key] = sys.intern(product[key])
+        availability = product.get("availability")
+        if availability and isinstance(availability.get("warehouse"), str):
+            availability["warehouse"] = sys.intern(availability["warehouse"])
+
+
+# Encoded availability record -> the one dict shared by every row with identical availability
+_CANONICAL_AVAILABILITY: Dict[bytes, Dict] = {}
+
+
+def share_availability(products: List[Dict]) -> None:
+    """Hash-cons identical availability records (regions become interned tuples) across rows"""
+    for product in products:
+        availability = product.get("availability")
+        if not isinstance(availability, dict):
+            continue
+        if isinstance(availability.get("regions"), list):
+            availability["regions"] = tuple(sys.intern(region) for region in availability["regions"])
+        key = orjson.dumps(availability, option=orjson.OPT_SORT_KEYS)
+        product["availability"] = _CANONICAL_AVAILABILITY.setdefault(key, availability)
+
+
+# =============================================================================
+# SPECIFICATION FLYWEIGHT
+# =============================================================================
+
+# Spec key layout -> (shared key tuple, field positions); one entry per distinct set of spec labels
+_SPEC_SCHEMAS: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Dict[str, int]]] = {}
+
+
+class ProductSpecs(Mapping):
+    """Read-only specifications backed by a shared key schema and a tuple of values"""
+
+    __slots__ = ("schema", "values_", "_positions")
+
+    def __init__(self, specs: Dict[str, Any]):
+        keys = tuple(specs)
+        entry = _SPEC_SCHEMAS.get(keys)
+        if entry is None:
+            schema = tuple(sys.intern(key) for key in keys)
+            entry = _SPEC_SCHEMAS[keys] = (schema, {key: i for i, key in enumerate(schema)})
+        self.schema, self._positions = entry
+        # Spec values such as "Windows 11 Pro" or "3 Years On-Site" repeat across products
+        self.values_ = tuple(sys.intern(v) if isinstance(v, str) else v for v in specs.values())
+
+    def __getitem__(self, key: str) -> Any:
+        return self.values_[self._positions[key]]
+
+    def __iter__(self):
+        return iter(self.schema)
+
+    def __len__(self) -> int:
+        return len(self.schema)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self.schema, self.values_))
+
+
+    def _canonical_key(self) -> Tuple:
+        return (self.schema, self.values_)
+
+
+# (schema, values) -> the one ProductSpecs shared by every product with identical specs
+_CANONICAL_SPECS: Dict[Tuple, ProductSpecs] = {}
+
+
+def pack_specifications(products: List[Dict]) -> None:
+    """Replace each product's specifications dict with a shared (hash-consed) ProductSpecs flyweight"""
+    for product in products:
+        specs = product.get("specifications")
+        if specs and not isinstance(specs, ProductSpecs):
+            packed = ProductSpecs(specs)
+            product["specifications"] = _CANONICAL_SPECS.setdefault(packed._canonical_key(), packed)
+
+
+def get_spec(product: Dict, field: str, default: Any = None) -> Any:
+    """Look up one specification value on a catalog product"""
+    return (product.get("specifications") or {}).get(field, default)
+
+
+def spec_dict(product: Any) -> Dict[str, Any]:
+    """Plain dict copy of a product's (dict or CatalogRow) specifications, for response payloads"""
+    specs = (product.specifications if isinstance(product, CatalogRow) else product.get("specifications")) or {}
+    return specs.to_dict() if isinstance(specs, ProductSpecs) else dict(specs)
+
+
+# =============================================================================
+# LAZY SUBCATALOGS
+# =============================================================================
+
+# Module attribute -> (blob, section). Each subcatalog is built on first access (PEP 562)
+#   IT_PRODUCTS_CATALOG  - detailed IT products catalog
+#   NEW_VENDOR_PRODUCTS  - new vendor products (Donaldson, Avantor, Markem-Imaje)
+#   IT_SERVICES_CATALOG  - detailed IT services catalog
+SUBCATALOG_SECTIONS = {
+    "IT_PRODUCTS_CATALOG": (PRODUCT_SHARD_DIR / "it_products.json", "it_products"),
+    "NEW_VENDOR_PRODUCTS": (PRODUCT_SHARD_DIR / "new_vendor_products.json", "new_vendor_products"),
+    "IT_SERVICES_CATALOG": (SERVICES_BLOB_PATH, "it_services"),
+}
+
+# Decoded blobs by path, kept until every section of the blob has been built
+_CATALOG_BLOBS: Dict[Path, Dict[str, Any]] = {}
+
+
+def _build_subcatalog(path: Path, section: str) -> List[Dict]:
+    blob = _CATALOG_BLOBS.get(path)
+    if blob is None:
+        blob = _CATALOG_BLOBS[path] = load_catalog_blob(path)
+    products = build_products(blob, section)
+    del blob[section]
+    if blob.keys() <= {"fields"}:
+        del _CATALOG_BLOBS[path]
+    intern_catalog_strings(products)
+    share_availability(products)
+    pack_specifications(products)
+    logger.info(f"Loaded {len(products)} rows from {path.name} section '{section}'")
+    return products
+
+
+def __getattr__(name: str) -> Any:
+    source = SUBCATALOG_SECTIONS.get(name)
+    if source is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    products = globals()[name] = _build_subcatalog(*source)
+    return products
+
+
+def get_subcatalog(name: str) -> List[Dict]:
+    """Subcatalog by module attribute name, building it on first use"""
+    products = globals().get(name)
+    return products if products is not None else __getattr__(name)
+
+
+# =============================================================================
+# SERIALIZED RESPONSES
+# =============================================================================
+
+# Default entry bound and freshness window of a ResponseCache
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_TTL_SECONDS = 60
+# Static bodies at least this large are also kept compressed; smaller ones are sent as is
+PRECOMPRESS_MIN_BYTES = 1024
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, ProductSpecs):
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_catalog(payload: Any) -> bytes:
+    """orjson-encode catalog data, including ProductSpecs flyweights"""
+    return orjson.dumps(payload, default=_json_default)
+
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag derived from the response bytes"""
+    return f'"{hashlib.sha256(body).hexdigest()}"'
+
+
+def dumps_with_etag(payload: Any) -> Tuple[bytes, str]:
+    """Serialize a payload once with orjson and derive a strong ETag from the bytes"""
+    body = dumps_catalog(payload)
+    return body, etag_for(body)
+
+
+# ETag -> {content-coding: (compressed body, etag of that representation)}
+PRECOMPRESSED_BODIES: Dict[str, Dict[str, Tuple[bytes, str]]] = {}
+
+
+def precompress(rendered: Tuple[bytes, str]) -> Tuple[bytes, str]:
+    """Compress a static (body, etag) once per supported content-coding; returns it unchanged"""
+    body, etag = rendered
+    if len(body) >= PRECOMPRESS_MIN_BYTES and etag not in PRECOMPRESSED_BODIES:
+        encodings = {
+            "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+            "br": brotli.compress(body, quality=11),
+        }
+        PRECOMPRESSED_BODIES[etag] = {
+            coding: (data, f'{etag[:-1]}-{coding}"') for coding, data in encodings.items()
+        }
+    return rendered
+
+
+def accepted_encoding(accept_encoding: str, available) -> Optional[str]:
+    """Preferred available content-coding (br before gzip) the Accept-Encoding header allows"""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        params = params.replace(" ", "")
+        try:
+            weight = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            weight = 1.0
+        if weight > 0:
+            accepted.add(coding.strip().lower())
+    for coding in ("br", "gzip"):
+        if coding in available and (coding in accepted or "*" in accepted):
+            return coding
+    return None
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with a TTL for already-encoded (body, etag) responses"""
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Tuple[bytes, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[bytes, str]]:
+        """Cached response for key, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                return entry[1]
+        return None
+
+    def put(self, key: Hashable, rendered: Tuple[bytes, str]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, rendered)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_render(self, key: Hashable, render: Callable[[], Tuple[bytes, str]]) -> Tuple[bytes, str]:
+        rendered = self.get(key)
+        if rendered is None:
+            # Render outside the lock; a concurrent miss on the same key just renders twice
+            rendered = render()
+            self.put(key, rendered)
+        return rendered
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# =============================================================================
+# PRODUCT CATALOG INDEX
+# =============================================================================
+
+# Bumped whenever the derived index is rebuilt, so cached responses can be keyed on it
+CATALOG_VERSION = 1
+
+# Text columns a product search term is matched against
+SEARCH_TEXT_FIELDS = ("name", "brand", "category", "short_description", "full_description")
+SEARCH_TEXT_SEPARATOR = "\x00"
+SEARCH_CACHE_SIZE = 1024
+WORD_PATTERN = re.compile(r"\w+")
+
+def _group_rows(keys) -> Dict[Any, List[int]]:
+    groups: Dict[Any, List[int]] = defaultdict(list)
+    for row, key in enumerate(keys):
+        groups[key].append(row)
+    return dict(groups)
+
+
+def intersect_rows(row_lists: List[List[int]]) -> List[int]:
+    """Sorted rows present in every list; starts from the smallest and stops once empty"""
+    ordered = sorted(row_lists, key=len)
+    result = set(ordered[0])
+    for rows in ordered[1:]:
+        if not result:
+            break
+        result.intersection_update(rows)
+    return sorted(result)
+
+
+class CatalogRow(NamedTuple):
+    """Immutable attribute-access view of one product's top-level fields for per-row loops"""
+
+    id: str
+    name: str
+    brand: str
+    category: str
+    sku: str
+    unspsc_code: str
+    base_price: float
+    image_url: str
+    short_description: str
+    full_description: str
+    specifications: Any
+    availability: Dict[str, Any]
+    rating: float
+    reviews_count: int
+
+    @classmethod
+    def from_product(cls, product: Dict) -> "CatalogRow":
+        return cls(*(product.get(field) for field in cls._fields))
+
+
+class ProductCatalogIndex:
+    """Read-only lookup structures derived once from the static product catalog"""
+
+    def __init__(self, products: List[Dict], version: int, display_order: Optional[List[int]] = None):
+        self.products = products
+        self.version = version
+        # Row order used when listing search results (defaults to catalog order), and each row's position in it
+        self.display_order = tuple(display_order) if display_order is not None else tuple(range(len(products)))
+        self.display_rank = [0] * len(products)
+        for position, row in enumerate(self.display_order):
+            self.display_rank[row] = position
+
+        # Inverted indexes for equality filters; keys are lowercased to match case-insensitively
+        self.rows_by_brand = _group_rows(p["brand"].lower() for p in products)
+        self.rows_by_category = _group_rows(p["category"].lower() for p in products)
+
+        self.frame = self._build_frame()
+        # Tuple rows for handlers that read fields per row (attribute access, no per-row dict)
+        self.rows = [CatalogRow.from_product(p) for p in products]
+        # Word token -> posting list over the search text, and every suffix of every token
+        # sorted (a suffix array over the vocabulary) so the tokens containing a word are one
+        # bisect range instead of a scan of all tokens
+        self.text_postings = self._build_text_postings()
+        self.text_tokens = sorted(self.text_postings)
+        by_suffix = sorted(
+            (token[i:], k) for k, token in enumerate(self.text_tokens) for i in range(len(token))
+        )
+        self.token_suffixes = [suffix for suffix, _ in by_suffix]
+        self.suffix_token_ids = [k for _, k in by_suffix]
+        # All search text fields of a row joined into one lowercase string; the separator never
+        # occurs in catalog text, so a substring match cannot straddle two fields
+        self.search_text = pd.Series(
+            [SEARCH_TEXT_SEPARATOR.join(fields) for fields in zip(
+                *(self.frame[f"{field}_lower"] for field in SEARCH_TEXT_FIELDS)
+            )],
+            dtype=object,
+        )
+        self.search_rows = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._search_rows)
+
+    def _build_frame(self) -> pd.DataFrame:
+        """Flatten the catalog into columns (availability.* -> availability_*), row-aligned with self.products"""
+        frame = pd.json_normalize(
+            [{k: v for k, v in p.items() if k != "specifications"} for p in self.products], sep="_"
+        )
+        for column in ("brand", "category", "availability_warehouse"):
+            if column in frame:
+                frame[column] = frame[column].astype("category")
+        for column in ("base_price", "rating"):
+            if column in frame:
+                frame[column] = frame[column].astype(np.float32)
+        # Lowercased once here instead of on every search request
+        for column in ("name", "short_description", "full_description", "brand", "category", "sku"):
+            frame[f"{column}_lower"] = [str(p.get(column, "")).lower() for p in self.products]
+        return frame
+
+    def match_scores(self, phrase: str, terms: List[str]) -> List[Tuple[int, int]]:
+        """(row, score) pairs with score > 0 for the agent's weighted phrase / term match"""
+        frame = self.frame
+
+        def hits(column: str, needle: str) -> np.ndarray:
+            return frame[column].str.contains(needle, regex=False).to_numpy(dtype=np.int32)
+
+        # Exact phrase match (highest priority); SKU / part number matches rank just below name
+        scores = 100 * hits("name_lower", phrase) + 90 * hits("sku_lower", phrase) + 80 * hits("brand_lower", phrase)
+        # Term-by-term matching
+        for term in terms:
+            scores += (
+                30 * hits("name_lower", term) + 25 * hits("brand_lower", term) + 20 * hits("category_lower", term)
+                + 10 * hits("short_description_lower", term) + 35 * hits("sku_lower", term)
+            )
+        rows = np.flatnonzero(scores > 0)
+        return list(zip(rows.tolist(), scores[rows].tolist()))
+
+    def text_mask(self, term: str) -> np.ndarray:
+        """Rows whose name, brand, category or descriptions contain the lowercased term"""
+        if SEARCH_TEXT_SEPARATOR in term:
+            return np.zeros(len(self.search_text), dtype=np.bool_)
+        return self.search_text.str.contains(term, regex=False).to_numpy(dtype=np.bool_)
+
+    def _build_text_postings(self) -> Dict[str, List[int]]:
+        """Lowercased word token -> sorted rows containing it in any search text field"""
+        postings: Dict[str, set] = defaultdict(set)
+        for field in SEARCH_TEXT_FIELDS:
+            for row, text in enumerate(self.frame[f"{field}_lower"]):
+                for token in WORD_PATTERN.findall(text):
+                    postings[token].add(row)
+        return {token: sorted(rows) for token, rows in postings.items()}
+
+    def word_rows(self, word: str) -> List[int]:
+        """Rows with a token containing word: the suffixes starting with word form one bisect range"""
+        start = bisect.bisect_left(self.token_suffixes, word)
+        end = bisect.bisect_left(self.token_suffixes, word + "\U0010ffff", start)
+        token_ids = set(self.suffix_token_ids[start:end])
+        if len(token_ids) == 1:
+            return self.text_postings[self.text_tokens[token_ids.pop()]]
+        return sorted({row for k in token_ids for row in self.text_postings[self.text_tokens[k]]})
+
+    def text_rows(self, term: str) -> List[int]:
+        """Rows whose search text contains the lowercased term (same matches as text_mask)
+
+        A run of word characters can only occur inside one token, so each word of the
+        term is looked up in the token index and the posting lists are intersected;
+        only multi-word or punctuated terms are re-checked against the text itself.
+        """
+        words = WORD_PATTERN.findall(term)
+        if not words:
+            return np.flatnonzero(self.text_mask(term)).tolist()
+        rows = intersect_rows([self.word_rows(word) for word in words])
+        if len(words) == 1 and words[0] == term:
+            return rows
+        if SEARCH_TEXT_SEPARATOR in term:
+            return []
+        search_text = self.search_text.to_numpy()
+        return [row for row in rows if term in search_text[row]]
+
+    def select_rows(self, category: Optional[str] = None, brand: Optional[str] = None) -> Optional[List[int]]:
+        """Sorted rows matching the category and brand filters, or None when neither applies"""
+        row_lists = []
+        if category and category != "all":
+            row_lists.append(self.rows_by_category.get(category.lower(), []))
+        if brand and brand != "all":
+            row_lists.append(self.rows_by_brand.get(brand.lower(), []))
+        return intersect_rows(row_lists) if row_lists else None
+
+    def _search_rows(self, term: str, category: Optional[str] = None, brand: Optional[str] = None) -> Tuple[int, ...]:
+        """Rows in display order matching a lowercased substring search and category / brand"""
+        row_lists = []
+        selected = self.select_rows(category=category, brand=brand)
+        if selected is not None:
+            row_lists.append(selected)
+        if term:
+            row_lists.append(self.text_rows(term))
+        if not row_lists:
+            return self.display_order
+        # Order only the matches by display position instead of walking the whole display order
+        return tuple(sorted(intersect_rows(row_lists), key=self.display_rank.__getitem__))
+
+
+PRODUCT_INDEX: Optional[ProductCatalogIndex] = None
+
+
+def _build_product_index() -> ProductCatalogIndex:
+    it_products = get_subcatalog("IT_PRODUCTS_CATALOG")
+    vendor_products = get_subcatalog("NEW_VENDOR_PRODUCTS")
+    # Interleave for variety: 1 industrial (vendor), 1 IT, 1 industrial, ...
+    vendor_rows = range(len(it_products), len(it_products) + len(vendor_products))
+    display_order = [
+        row for pair in zip_longest(vendor_rows, range(len(it_products))) for row in pair if row is not None
+    ]
+    return ProductCatalogIndex(it_products + vendor_products, CATALOG_VERSION, display_order)
+
+
+def get_product_index() -> ProductCatalogIndex:
+    """Current derived index over IT_PRODUCTS_CATALOG + NEW_VENDOR_PRODUCTS, built on first use"""
+    global PRODUCT_INDEX
+    if PRODUCT_INDEX is None:
+        PRODUCT_INDEX = _build_product_index()
+    return PRODUCT_INDEX
+
+
+def refresh_product_index() -> ProductCatalogIndex:
+    """Rebuild the derived index after the catalog lists have been mutated"""
+    global PRODUCT_INDEX, CATALOG_VERSION
+    CATALOG_VERSION += 1
+    PRODUCT_INDEX = _build_product_index()
+    return PRODUCT_INDEX
+
+
+def warm_catalog() -> ProductCatalogIndex:
+    """Build every subcatalog and the index up front, for a pre-fork master (e.g. gunicorn --preload)"""
+    for name in SUBCATALOG_SECTIONS:
+        get_subcatalog(name)
+    index = get_product_index()
+    # Workers share these objects copy-on-write; freezing them keeps the cyclic GC from
+    # writing to (and so copying) their pages in every worker
+    gc.freeze()
+    return index
+
+
+# =============================================================================
+# SERVICE SEARCH COLUMNS
+# =============================================================================
+
+# Text columns a service search term is matched against
+SERVICE_SEARCH_FIELDS = ("name", "category", "short_description")
+
+
+class ServiceSearchIndex:
+    """Column view (lowercased text, category codes, base price) of the searchable services"""
+
+    def __init__(self, services: List[Dict]):
+        self.services = services
+        self.text_columns = {
+            field: pd.Series([str(s.get(field) or "").lower() for s in services], dtype=object)
+            for field in SERVICE_SEARCH_FIELDS
+        }
+        categories = pd.Categorical(self.text_columns["category"])
+        self.category_code_of = {name: code for code, name in enumerate(categories.categories)}
+        self.category_codes = categories.codes.astype(np.int32)
+        self.base_prices = np.array([s.get("base_price") or 0 for s in services], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.services)
+
+    def search_rows(self, term: str = "", category: Optional[str] = None,
+                    min_price: Optional[float] = None, max_price: Optional[float] = None) -> List[int]:
+        """Rows (catalog order) matching the lowercased term, category and base price range"""
+        mask = np.ones(len(self.services), dtype=np.bool_)
+        if term:
+            hits = np.zeros(len(self.services), dtype=np.bool_)
+            for column in self.text_columns.values():
+                hits |= column.str.contains(term, regex=False).to_numpy(dtype=np.bool_)
+            mask &= hits
+        if category:
+            code = self.category_code_of.get(category.lower())
+            if code is None:
+                return []
+            mask &= self.category_codes == code
+        if min_price is not None:
+            mask &= self.base_prices >= min_price
+        if max_price is not None:
+            mask &= self.base_prices <= max_price
+        return np.flatnonzero(mask).tolist()
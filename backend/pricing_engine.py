@@ -374,6 +374,7 @@ async def save_supplier_contract(
     """Save or update supplier contract with category discounts"""
     contract_data = {
         "supplier_name": supplier_name,
+        "supplier_name_lc": supplier_name.lower(),
         "category_discounts": category_discounts,
         "countries": countries or ["Global"],
         "contract_file": contract_file,
@@ -384,7 +385,7 @@ async def save_supplier_contract(
     }
     
     result = await db.supplier_contracts.update_one(
-        {"supplier_name": {"$regex": f"^{supplier_name}$", "$options": "i"}},
+        {"supplier_name_lc": supplier_name.lower()},
         {"$set": contract_data},
         upsert=True
     )
@@ -12,17 +12,26 @@ Flow:
 
 import os
 import uuid
+import asyncio
 import logging
 import hashlib
 import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
-from xml.etree import ElementTree as ET
-from xml.dom import minidom
+from typing import Dict, List, Optional, Any, Tuple, Union
+from lxml import etree as ET
 import urllib.parse
 
 logger = logging.getLogger(__name__)
 
+# cXML requests carry a DOCTYPE: never load it, expand entities or touch the network.
+# Shared by every request (parsing happens on the event loop thread); indentation
+# whitespace is dropped so .find() walks element nodes only.
+CXML_PARSER = ET.XMLParser(
+    resolve_entities=False, no_network=True, load_dtd=False, huge_tree=False, remove_blank_text=True
+)
+
 # PunchOut Configuration - Production Settings for Danone/Coupa
 PUNCHOUT_CONFIG = {
     "shared_secret": os.environ.get("PUNCHOUT_SHARED_SECRET", "OmniSup!y#2026$Coupa$8472"),
@@ -38,8 +47,23 @@ PUNCHOUT_CONFIG = {
     "catalog_url": "https://infoshop.omnisupply.io",
 }
 
-# Active PunchOut sessions (in production, use Redis/database)
-punchout_sessions: Dict[str, Dict] = {}
+# Sessions persist in MongoDB; each worker keeps the ones it recently used for this long
+# (short, so a cart changed through another worker is picked up soon)
+PUNCHOUT_SESSION_CACHE_SECONDS = 300
+
+# session_token -> (cache expiry on the monotonic clock, session), oldest expiry first
+punchout_sessions: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+
+# Audit log entries are written behind the request in batches of up to this many
+PUNCHOUT_LOG_BATCH_SIZE = 256
+# Longest an entry waits for its batch to fill before it is written anyway
+PUNCHOUT_LOG_FLUSH_SECONDS = 0.25
+# Entries beyond this backlog are dropped rather than slowing PunchOut requests down
+PUNCHOUT_LOG_QUEUE_SIZE = 10_000
+
+# Entries to write; None asks the writer to stop once everything queued before it is written
+punchout_log_queue: "asyncio.Queue[Optional[Dict]]" = asyncio.Queue(maxsize=PUNCHOUT_LOG_QUEUE_SIZE)
+_punchout_log_task: Optional[asyncio.Task] = None
 
 
 def generate_session_token() -> str:
@@ -54,7 +78,7 @@ def generate_payload_id() -> str:
     return f"{timestamp}.{unique}@infoshop.com"
 
 
-def parse_punchout_setup_request(xml_content: str) -> Dict:
+def parse_punchout_setup_request(xml_content: Union[str, bytes]) -> Dict:
     """
     Parse incoming cXML PunchOutSetupRequest from Coupa
     
@@ -72,7 +96,10 @@ def parse_punchout_setup_request(xml_content: str) -> Dict:
         }
     """
     try:
-        root = ET.fromstring(xml_content)
+        # Bytes: lxml rejects str input that carries an encoding declaration
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode("utf-8")
+        root = ET.fromstring(xml_content, parser=CXML_PARSER)
         
         # Extract Header information
         header = root.find(".//Header")
@@ -299,7 +326,7 @@ def create_punchout_session(
     """
     session_token = generate_session_token()
     
-    punchout_sessions[session_token] = {
+    cache_punchout_session(session_token, {
         "buyer_cookie": buyer_cookie,
         "browser_form_post_url": browser_form_post_url,
         "from_identity": from_identity,
@@ -308,20 +335,35 @@ def create_punchout_session(
         "cart_items": [],
         "created_at": datetime.now(timezone.utc).isoformat(),
         "expires_at": None,  # Could add expiration
-    }
+    })
     
     logger.info(f"Created PunchOut session: {session_token[:16]}...")
     return session_token
 
 
+def cache_punchout_session(session_token: str, session: Dict) -> None:
+    """Keep a session in this worker's cache for PUNCHOUT_SESSION_CACHE_SECONDS, dropping expired entries"""
+    now = time.monotonic()
+    punchout_sessions[session_token] = (now + PUNCHOUT_SESSION_CACHE_SECONDS, session)
+    punchout_sessions.move_to_end(session_token)
+    while punchout_sessions:
+        expires, _ = next(iter(punchout_sessions.values()))
+        if expires > now:
+            break
+        punchout_sessions.popitem(last=False)
+
+
 def get_punchout_session(session_token: str) -> Optional[Dict]:
-    """Get PunchOut session by token"""
-    return punchout_sessions.get(session_token)
+    """Get PunchOut session by token from this worker's cache"""
+    entry = punchout_sessions.get(session_token)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return entry[1]
 
 
 def update_punchout_cart(session_token: str, cart_items: List[Dict]) -> bool:
     """Update the cart items in a PunchOut session"""
-    session = punchout_sessions.get(session_token)
+    session = get_punchout_session(session_token)
     if session:
         session["cart_items"] = cart_items
         return True
@@ -330,7 +372,8 @@ def update_punchout_cart(session_token: str, cart_items: List[Dict]) -> bool:
 
 def close_punchout_session(session_token: str) -> Optional[Dict]:
     """Close and remove a PunchOut session, returning the session data"""
-    return punchout_sessions.pop(session_token, None)
+    entry = punchout_sessions.pop(session_token, None)
+    return entry[1] if entry else None
 
 
 # MongoDB storage for production (optional)
@@ -352,7 +395,18 @@ async def get_punchout_session_from_db(db, session_token: str) -> Optional[Dict]
     return session
 
 
-async def log_punchout_transaction(
+async def load_punchout_session(db, session_token: str, fresh: bool = False) -> Optional[Dict]:
+    """Session from this worker's cache, else from MongoDB (then cached for the next requests).
+    fresh=True always reads MongoDB, for steps that must see changes made through other workers."""
+    session = None if fresh else get_punchout_session(session_token)
+    if session is None:
+        session = await get_punchout_session_from_db(db, session_token)
+        if session is not None:
+            cache_punchout_session(session_token, session)
+    return session
+
+
+def log_punchout_transaction(
     db,
     transaction_type: str,
     session_token: str,
@@ -360,12 +414,65 @@ async def log_punchout_transaction(
     status: str,
     details: Dict = None
 ):
-    """Log PunchOut transactions for auditing"""
-    await db.punchout_logs.insert_one({
-        "transaction_type": transaction_type,
-        "session_token": session_token[:16] + "...",
-        "buyer_identity": buyer_identity,
-        "status": status,
-        "details": details or {},
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    })
+    """Queue a PunchOut transaction for the audit log (written in batches)"""
+    global _punchout_log_task
+    try:
+        punchout_log_queue.put_nowait({
+            "transaction_type": transaction_type,
+            "session_token": session_token[:16] + "...",
+            "buyer_identity": buyer_identity,
+            "status": status,
+            "details": details or {},
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        })
+    except asyncio.QueueFull:
+        logger.warning(f"PunchOut log queue full, dropping {transaction_type} entry")
+        return
+    if _punchout_log_task is None or _punchout_log_task.done():
+        _punchout_log_task = asyncio.create_task(_write_punchout_logs(db))
+
+
+def _take_punchout_logs(batch: List[Dict]) -> Tuple[List[Dict], bool]:
+    """Top the batch up from the queue without waiting; also whether the stop marker was reached"""
+    while len(batch) < PUNCHOUT_LOG_BATCH_SIZE and not punchout_log_queue.empty():
+        entry = punchout_log_queue.get_nowait()
+        if entry is None:
+            return batch, True
+        batch.append(entry)
+    return batch, False
+
+
+async def _insert_punchout_logs(db, batch: List[Dict]):
+    if not batch:
+        return
+    try:
+        await db.punchout_logs.insert_many(batch, ordered=False)
+    except Exception as e:
+        logger.error(f"Failed to write {len(batch)} PunchOut log entries: {e}")
+
+
+async def _write_punchout_logs(db):
+    """Drain the log queue: wait for an entry, let the batch fill briefly, insert it; until the stop marker"""
+    while True:
+        entry = await punchout_log_queue.get()
+        if entry is None:
+            return
+        if punchout_log_queue.qsize() < PUNCHOUT_LOG_BATCH_SIZE - 1:
+            await asyncio.sleep(PUNCHOUT_LOG_FLUSH_SECONDS)
+        batch, stop = _take_punchout_logs([entry])
+        await _insert_punchout_logs(db, batch)
+        if stop:
+            return
+
+
+async def flush_punchout_logs(db):
+    """Let the background writer finish everything queued, then stop it (on shutdown)"""
+    global _punchout_log_task
+    if _punchout_log_task is not None and not _punchout_log_task.done():
+        await punchout_log_queue.put(None)
+        await _punchout_log_task
+    _punchout_log_task = None
+    # Anything left behind by a writer that is no longer running
+    while not punchout_log_queue.empty():
+        batch, _ = _take_punchout_logs([])
+        await _insert_punchout_logs(db, batch)
@@ -21,6 +21,7 @@ import os
 import io
 import gc
 import csv
+import codecs
 import uuid
 import asyncio
 import logging
@@ -142,11 +143,51 @@ def remove_job(job_id: str):
 # FILE HANDLING - CHUNKED READING
 # ============================================
 
+# File signatures of the spreadsheet containers (OOXML zip, legacy OLE2); other text is read as CSV
+FILE_FORMAT_BY_MAGIC = {
+    b'PK\x03\x04': '.xlsx',
+    b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1': '.xls',
+}
+SPREADSHEET_FORMATS = ('.xlsx', '.xls', '.csv')
+EXCEL_FORMATS = ('.xlsx', '.xls')
+
+# In-memory parser per sniffed format
+FRAME_READERS = {
+    '.csv': pd.read_csv,
+    '.xlsx': pd.read_excel,
+    '.xls': pd.read_excel,
+}
+
+
+def sniff_file_format(head: bytes) -> Optional[str]:
+    """'.xlsx' / '.xls' / '.csv' from a file's first 8 bytes, None for other binary data"""
+    for magic, ext in FILE_FORMAT_BY_MAGIC.items():
+        if head.startswith(magic):
+            return ext
+    try:
+        # Incremental decode: a multi-byte character cut off at the end is not an error
+        text = codecs.getincrementaldecoder('utf-8')().decode(head)
+    except UnicodeDecodeError:
+        return None
+    return '.csv' if all(ch.isprintable() or ch in '\t\r\n\ufeff' for ch in text) else None
+
+
+def file_format(filepath: str) -> Optional[str]:
+    """Sniffed format of a file on disk (the name's extension is not trusted)"""
+    with open(filepath, 'rb') as f:
+        return sniff_file_format(f.read(8))
+
+
+def read_frame(content: bytes, ext: str) -> pd.DataFrame:
+    """Parse a whole uploaded spreadsheet of a sniffed format held in memory"""
+    return FRAME_READERS[ext](io.BytesIO(content))
+
+
 def count_file_rows(filepath: str) -> int:
     """
     Efficiently count rows in a file without loading into memory
     """
-    ext = Path(filepath).suffix.lower()
+    ext = file_format(filepath)
     
     if ext == '.csv':
         # Fast line counting for CSV
@@ -157,10 +198,11 @@ def count_file_rows(filepath: str) -> int:
         # For Excel, we need to read with openpyxl in read-only mode
         try:
             from openpyxl import load_workbook
-            wb = load_workbook(filepath, read_only=True, data_only=True)
-            ws = wb.active
-            count = ws.max_row - 1  # Subtract header
-            wb.close()
+            # A file object, so openpyxl does not insist on an Excel file extension
+            with open(filepath, 'rb') as f:
+                wb = load_workbook(f, read_only=True, data_only=True)
+                count = wb.active.max_row - 1  # Subtract header
+                wb.close()
             return count
         except Exception as e:
             logger.warning(f"Could not count Excel rows efficiently: {e}")
@@ -191,7 +233,6 @@ def stream_excel_chunks(filepath: str, chunk_size: int = 5000) -> Generator[pd.D
     For very large Excel files (>100k rows), we convert to CSV first
     because pandas Excel reading is memory-intensive.
     """
-    ext = Path(filepath).suffix.lower()
     row_count = count_file_rows(filepath)
     
     # For small files, read directly
@@ -210,28 +251,29 @@ def stream_excel_chunks(filepath: str, chunk_size: int = 5000) -> Generator[pd.D
         # Read Excel and write to CSV in chunks
         from openpyxl import load_workbook
         
-        wb = load_workbook(filepath, read_only=True, data_only=True)
-        ws = wb.active
-        
-        # Get headers
-        headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-        
-        # Write to CSV
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
+        with open(filepath, 'rb') as xf:
+            wb = load_workbook(xf, read_only=True, data_only=True)
+            ws = wb.active
             
-            batch = []
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                batch.append(row)
-                if len(batch) >= 10000:
+            # Get headers
+            headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
+            
+            # Write to CSV
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                
+                batch = []
+                for row in ws.iter_rows(min_row=2, values_only=True):
+                    batch.append(row)
+                    if len(batch) >= 10000:
+                        writer.writerows(batch)
+                        batch = []
+                
+                if batch:
                     writer.writerows(batch)
-                    batch = []
             
-            if batch:
-                writer.writerows(batch)
-        
-        wb.close()
+            wb.close()
         
         # Now stream from CSV
         yield from stream_csv_chunks(csv_path, chunk_size)
@@ -247,14 +289,14 @@ def stream_file_chunks(filepath: str, chunk_size: int = 5000) -> Generator[pd.Da
     """
     Universal file streaming - handles CSV and Excel
     """
-    ext = Path(filepath).suffix.lower()
+    ext = file_format(filepath)
     
     if ext == '.csv':
         yield from stream_csv_chunks(filepath, chunk_size)
-    elif ext in ['.xlsx', '.xls']:
+    elif ext in EXCEL_FORMATS:
         yield from stream_excel_chunks(filepath, chunk_size)
     else:
-        raise ValueError(f"Unsupported file format: {ext}")
+        raise ValueError(f"Unsupported file format: {Path(filepath).name}")
 
 
 # ============================================
@@ -272,14 +314,15 @@ def transform_chunk(
     Returns: (valid_products, errors)
     """
     from infoshop_service import transform_product_for_infoshop
+    from algolia_service import frame_records
     
     products = []
     errors = []
     
-    for idx, row in chunk.iterrows():
+    for idx, row in zip(chunk.index, frame_records(chunk)):
         try:
             product = transform_product_for_infoshop(
-                row.to_dict(),
+                row,
                 vendor,
                 category_discounts
             )
@@ -318,7 +361,7 @@ async def index_batch_to_algolia(
     Index a batch of products to Algolia with retry logic
     Returns: (indexed_count, errors)
     """
-    from algolia_service import algolia_client
+    from algolia_service import post_batch
     
     if not products:
         return 0, []
@@ -331,7 +374,7 @@ async def index_batch_to_algolia(
             # Algolia recommends batches of 1000 max
             for i in range(0, len(products), config.algolia_batch_size):
                 batch = products[i:i + config.algolia_batch_size]
-                algolia_client.save_objects(index_name, batch)
+                post_batch(index_name, batch)
                 indexed += len(batch)
             
             return indexed, errors
@@ -617,4 +660,8 @@ __all__ = [
     'get_job',
     'stream_file_chunks',
     'count_file_rows',
+    'sniff_file_format',
+    'read_frame',
+    'SPREADSHEET_FORMATS',
+    'EXCEL_FORMATS',
 ]
@@ -1,23 +1,35 @@
 from fastapi import FastAPI, APIRouter, HTTPException, Depends, UploadFile, File, Query, Form, Request, Response, BackgroundTasks
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import ConnectionFailure
 import os
+import sys
+import time
 import logging
 import json
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from collections.abc import Mapping
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, ValidationError
+from typing import List, Optional, Dict, Any, NamedTuple, Tuple
 import uuid
 from datetime import datetime, timezone, timedelta
 import jwt
 import random
 import hashlib
+import hmac
+import base64
 import asyncio
+import numpy as np
 import pandas as pd
 import io
+import tempfile
 
 # Import Emergent LLM integration
 try:
@@ -28,6 +40,14 @@ except ImportError:
     LlmChat = None
     UserMessage = None
 
+# msgspec decodes hot request bodies straight into typed structs; Pydantic validates them otherwise
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+    msgspec = None
+
 # Import AI price benchmarking module
 from ai_price_benchmark import (
     perform_ai_price_benchmarking, 
@@ -57,10 +77,13 @@ try:
     from algolia_service import (
         init_algolia,
         index_products as algolia_index_products,
-        index_products_from_file,
+        index_product_chunks,
+        frame_records,
+        get_product_with_related,
+        SEARCH_HIT_ATTRIBUTES,
         search_products as algolia_search_products,
         get_facet_values,
-        update_product_grouping,
+        schedule_product_grouping,
         clear_index,
         get_index_stats
     )
@@ -80,8 +103,9 @@ from punchout_service import (
     update_punchout_cart,
     close_punchout_session,
     log_punchout_transaction,
+    flush_punchout_logs,
     save_punchout_session_to_db,
-    get_punchout_session_from_db,
+    load_punchout_session,
     PUNCHOUT_CONFIG
 )
 
@@ -101,6 +125,24 @@ from infoshop_service import (
     get_all_partner_discounts
 )
 
+# Import static product catalog (preparsed JSON blob, subcatalogs load on first access)
+import catalog_service
+from catalog_service import (
+    CATALOG_DATA_DIR,
+    CatalogRow,
+    PRECOMPRESSED_BODIES,
+    ResponseCache,
+    ServiceSearchIndex,
+    accepted_encoding,
+    build_products,
+    dumps_with_etag,
+    get_product_index,
+    intern_catalog_strings,
+    load_catalog_blob,
+    precompress,
+    spec_dict,
+)
+
 # Import Scalable Ingestion Service
 from scalable_ingestion import (
     JobStatus,
@@ -114,6 +156,11 @@ from scalable_ingestion import (
     get_all_jobs,
     get_job,
     count_file_rows,
+    stream_file_chunks,
+    sniff_file_format,
+    read_frame,
+    SPREADSHEET_FORMATS,
+    EXCEL_FORMATS,
 )
 
 ROOT_DIR = Path(__file__).parent
@@ -128,6 +175,11 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Build the static catalog at import when preloading (gunicorn --preload), so forked
+# workers share it copy-on-write instead of each building their own copy
+if os.environ.get('CATALOG_PRELOAD', '').lower() in ('1', 'true'):
+    catalog_service.warm_catalog()
+
 # JWT Configuration
 JWT_SECRET = os.environ.get('JWT_SECRET_KEY', 'omnisupply_default_secret')
 JWT_ALGORITHM = "HS256"
@@ -136,8 +188,8 @@ JWT_EXPIRATION_HOURS = 24  # Extended from 1 hour
 # Emergent LLM Key
 EMERGENT_LLM_KEY = os.environ.get('EMERGENT_LLM_KEY', '')
 
-# Create the main app
-app = FastAPI(title="OMNISupply.io API", version="2.0.0")
+# Create the main app (responses encoded with orjson rather than stdlib json)
+app = FastAPI(title="OMNISupply.io API", version="2.0.0", default_response_class=ORJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -145,9 +197,15 @@ api_router = APIRouter(prefix="/api")
 # Security
 security = HTTPBearer()
 
-# Translation cache to avoid repeated LLM calls
+# Translation cache to avoid repeated LLM calls (oldest entries dropped past TRANSLATION_CACHE_SIZE)
+TRANSLATION_CACHE_SIZE = 50000
 translation_cache = {}
 
+def remember_translation(cache_key: str, translation: str) -> None:
+    translation_cache[cache_key] = translation
+    while len(translation_cache) > TRANSLATION_CACHE_SIZE:
+        del translation_cache[next(iter(translation_cache))]
+
 # Language mapping for translation
 LANGUAGE_NAMES = {
     "en": "English",
@@ -157,20 +215,23 @@ LANGUAGE_NAMES = {
     "nl": "Dutch"
 }
 
+def translation_cache_key(text: str, target_lang: str) -> str:
+    return f"{target_lang}:{hashlib.md5(text.encode()).hexdigest()}"
+
 async def translate_text(text: str, target_lang: str, context: str = "product") -> str:
     """Translate text using Emergent LLM with caching"""
     if not text or target_lang == "en":
         return text
     
     # Check cache first
-    cache_key = f"{target_lang}:{hashlib.md5(text.encode()).hexdigest()}"
+    cache_key = translation_cache_key(text, target_lang)
     if cache_key in translation_cache:
         return translation_cache[cache_key]
     
     # Check MongoDB cache
     cached = await db.translations.find_one({"cache_key": cache_key})
     if cached:
-        translation_cache[cache_key] = cached["translation"]
+        remember_translation(cache_key, cached["translation"])
         return cached["translation"]
     
     try:
@@ -185,7 +246,7 @@ async def translate_text(text: str, target_lang: str, context: str = "product")
         translated = response.strip() if response else text
         
         # Cache in memory and MongoDB
-        translation_cache[cache_key] = translated
+        remember_translation(cache_key, translated)
         await db.translations.update_one(
             {"cache_key": cache_key},
             {"$set": {"cache_key": cache_key, "original": text, "target_lang": target_lang, 
@@ -198,65 +259,173 @@ async def translate_text(text: str, target_lang: str, context: str = "product")
         logger.error(f"Translation error: {e}")
         return text
 
+async def translate_fields(fields: Dict[str, str], target_lang: str, context: str = "product") -> Dict[str, str]:
+    """Translate the texts of one item with a single LLM call; each text is still cached on its own"""
+    translated, missing = {}, {}
+    for field, text in fields.items():
+        cached = translation_cache.get(translation_cache_key(text, target_lang))
+        if cached is None:
+            missing[field] = text
+        else:
+            translated[field] = cached
+    if not missing:
+        return translated
+
+    # One MongoDB round trip for everything the in-memory cache lacks
+    cache_keys = {field: translation_cache_key(text, target_lang) for field, text in missing.items()}
+    stored = {
+        doc["cache_key"]: doc["translation"]
+        async for doc in db.translations.find(
+            {"cache_key": {"$in": list(set(cache_keys.values()))}}, {"_id": 0, "cache_key": 1, "translation": 1}
+        )
+    }
+    for field, cache_key in cache_keys.items():
+        if cache_key in stored:
+            remember_translation(cache_key, stored[cache_key])
+            translated[field] = stored[cache_key]
+            del missing[field]
+    if not missing:
+        return translated
+
+    replies = {}
+    try:
+        target_language = LANGUAGE_NAMES.get(target_lang, "French")
+        chat = LlmChat(
+            api_key=EMERGENT_LLM_KEY,
+            session_id=f"translate_{cache_keys[next(iter(missing))][-8:]}",
+            system_message=f"You are a professional B2B e-commerce {context} translator. You receive a JSON object of {context} texts; its keys say what each text is (name, description, category, specification label or value). Translate every value from English to {target_language}. Keep technical terms, brand names, model numbers, and specifications intact. Reply with only a JSON object with the same keys and the translated texts as values."
+        ).with_model("openai", "gpt-4o-mini")
+        response_text = str(await chat.send_message(UserMessage(text=json.dumps(missing, ensure_ascii=False))))
+        reply = json.loads(response_text[response_text.find("{"):response_text.rfind("}") + 1])
+        replies = {field: reply[field].strip() for field in missing if isinstance(reply.get(field), str) and reply[field].strip()}
+    except Exception as e:
+        logger.error(f"Batch translation error: {e}")
+
+    now = datetime.now(timezone.utc)
+    updates = []
+    for field, translation in replies.items():
+        cache_key, text = cache_keys[field], missing[field]
+        remember_translation(cache_key, translation)
+        translated[field] = translation
+        updates.append(UpdateOne(
+            {"cache_key": cache_key},
+            {"$set": {"cache_key": cache_key, "original": text, "target_lang": target_lang,
+                      "translation": translation, "created_at": now}},
+            upsert=True
+        ))
+    if updates:
+        await db.translations.bulk_write(updates, ordered=False)
+
+    # Texts the batch reply dropped fall back to one call each
+    leftover = [field for field in missing if field not in replies]
+    for field, translation in zip(leftover, await asyncio.gather(
+        *(translate_text(missing[field], target_lang, context) for field in leftover)
+    )):
+        translated[field] = translation
+    return translated
+
 async def translate_product(product: dict, target_lang: str) -> dict:
-    """Translate all product text fields"""
+    """Translate all product text fields in one batch"""
     if target_lang == "en":
         return product
     
     translated = product.copy()
-    
-    # Translate key fields
-    if product.get("name"):
-        translated["name"] = await translate_text(product["name"], target_lang, "product name")
-    if product.get("short_description"):
-        translated["short_description"] = await translate_text(product["short_description"], target_lang, "product description")
-    if product.get("full_description"):
-        translated["full_description"] = await translate_text(product["full_description"], target_lang, "product description")
-    if product.get("category"):
-        translated["category"] = await translate_text(product["category"], target_lang, "category name")
-    
-    # Translate specifications
-    if product.get("specifications"):
-        translated_specs = {}
-        for key, value in product["specifications"].items():
-            translated_key = await translate_text(key, target_lang, "specification label")
-            # Don't translate numeric values or technical specs
-            if isinstance(value, str) and not any(c.isdigit() for c in value):
-                translated_specs[translated_key] = await translate_text(value, target_lang, "specification value")
-            else:
-                translated_specs[translated_key] = value
-        translated["specifications"] = translated_specs
+    fields = {key: product[key] for key in ("name", "short_description", "full_description", "category") if product.get(key)}
+    
+    # Specification labels, and values without numbers (numeric values and technical specs stay as they are)
+    specs = list((product.get("specifications") or {}).items())
+    for i, (key, value) in enumerate(specs):
+        fields[f"specification_label_{i}"] = key
+        if isinstance(value, str) and value and not any(c.isdigit() for c in value):
+            fields[f"specification_value_{i}"] = value
+    
+    texts = await translate_fields(fields, target_lang, "product")
+    for key in ("name", "short_description", "full_description", "category"):
+        if key in texts:
+            translated[key] = texts[key]
+    if specs:
+        translated["specifications"] = {
+            texts[f"specification_label_{i}"]: texts.get(f"specification_value_{i}", value)
+            for i, (key, value) in enumerate(specs)
+        }
     
     return translated
 
 async def translate_service(service: dict, target_lang: str) -> dict:
-    """Translate all service text fields"""
+    """Translate all service text fields in one batch"""
     if target_lang == "en":
         return service
     
     translated = service.copy()
+    fields = {
+        key: service[key]
+        for key in ("name", "short_description", "full_description", "category", "unit_of_measure") if service.get(key)
+    }
+    includes = service.get("service_includes") or []
+    fields.update((f"service_includes_{i}", item) for i, item in enumerate(includes) if item)
     
-    # Translate key fields
-    if service.get("name"):
-        translated["name"] = await translate_text(service["name"], target_lang, "service name")
-    if service.get("short_description"):
-        translated["short_description"] = await translate_text(service["short_description"], target_lang, "service description")
-    if service.get("full_description"):
-        translated["full_description"] = await translate_text(service["full_description"], target_lang, "service description")
-    if service.get("category"):
-        translated["category"] = await translate_text(service["category"], target_lang, "category name")
-    if service.get("unit_of_measure"):
-        translated["unit_of_measure"] = await translate_text(service["unit_of_measure"], target_lang, "pricing unit")
-    
-    # Translate service includes list
-    if service.get("service_includes"):
-        translated["service_includes"] = [
-            await translate_text(item, target_lang, "service feature") 
-            for item in service["service_includes"]
-        ]
+    texts = await translate_fields(fields, target_lang, "service")
+    for key in ("name", "short_description", "full_description", "category", "unit_of_measure"):
+        if key in texts:
+            translated[key] = texts[key]
+    if includes:
+        translated["service_includes"] = [texts.get(f"service_includes_{i}", item) for i, item in enumerate(includes)]
     
     return translated
 
+# At most this many items of one result set are translated at the same time
+TRANSLATION_CONCURRENCY = 8
+
+async def translate_concurrently(items: List[dict], translate, target_lang: str, kind: str) -> List[dict]:
+    """Translate result items concurrently; an item whose translation fails is kept as is"""
+    semaphore = asyncio.Semaphore(TRANSLATION_CONCURRENCY)
+
+    async def translate_one(item: dict) -> dict:
+        async with semaphore:
+            return await translate(item, target_lang)
+
+    translated = await asyncio.gather(*(translate_one(item) for item in items), return_exceptions=True)
+    results = []
+    for item, result in zip(items, translated):
+        if isinstance(result, Exception):
+            logger.error(f"Translation failed for {kind}: {result}")
+            results.append(item)
+        else:
+            results.append(result)
+    return results
+
+async def translate_category_names(categories: List[dict], target_lang: str) -> None:
+    """Translate category names in place, concurrently; names whose translation fails stay in English"""
+    names = await asyncio.gather(
+        *(translate_text(cat["name"], target_lang, "category") for cat in categories), return_exceptions=True
+    )
+    for cat, name in zip(categories, names):
+        if not isinstance(name, BaseException):
+            cat["name"] = name
+
+# Category lists sent with search results, per language; a language is only cached once every name translated
+PRODUCT_CATEGORY_LISTS: Dict[str, List[dict]] = {}
+SERVICE_CATEGORY_LISTS: Dict[str, List[dict]] = {}
+
+async def category_list(cache: Dict[str, List[dict]], categories: List[dict], lang: str, limit: int) -> List[dict]:
+    """Category list in lang with the first `limit` names translated, reused for supported languages
+
+    categories is a prebuilt short view; English shares it, other languages translate a copy.
+    """
+    if lang == "en":
+        return categories
+    cached = cache.get(lang)
+    if cached is not None:
+        return cached
+    entries = [dict(c) for c in categories]
+    await translate_category_names(entries[:limit], lang)
+    translated = all(
+        translation_cache_key(c["name"], lang) in translation_cache for c in categories[:limit]
+    )
+    if lang in LANGUAGE_NAMES and translated:
+        cache[lang] = entries
+    return entries
+
 # Currency configurations per country
 COUNTRY_CURRENCIES = {
     "USA": {"code": "USD", "symbol": "$", "rate": 1.0},
@@ -398,7 +567,7 @@ PRODUCT_IMAGE_URLS = {
     "Safety Gloves": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/9f7011dbf936aa67ab41af039d39e363f5a435c0efbfbed8a069e7684f74ad25.png",
 }
 
-# Reward images for InfoCoins redemption
+# Reward images for InfoCoins redemption (baked into data/reference.json by bake_catalog.py)
 REWARD_IMAGE_URLS = {
     "Executive Jacket": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/7a28899414c059decd7892a76b2510a988cbd7721cd8cc81edb9db0b2d98abb8.png",
     "Insulated Tumbler": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/e20ad22b18b960ea85b19e85bf4ff46d506caa85fc150f5ed6f1b6f4b693fde8.png",
@@ -411,6 +580,16 @@ REWARD_IMAGE_URLS = {
 # Default fallback image
 DEFAULT_PRODUCT_IMAGE = "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/7ac37795d30541fe96a379b8ebc9a669a9f5534a1c47d157f2dcfce68eda8fde.png"
 
+def _img(primary: str, fallback: str) -> str:
+    """Resolve a product image, falling back to its category image, as one interned string"""
+    return sys.intern(PRODUCT_IMAGE_URLS.get(primary) or PRODUCT_IMAGE_URLS.get(fallback) or DEFAULT_PRODUCT_IMAGE)
+
+# Category image resolved once so every product in a category shares one URL string
+CATEGORY_IMAGE_URL = {
+    cat["name"]: sys.intern(PRODUCT_IMAGE_URLS.get(cat["name"], DEFAULT_PRODUCT_IMAGE))
+    for cat in MRO_CATEGORIES
+}
+
 # Service images hosted on Emergent CDN (guaranteed to work)
 SERVICE_IMAGE_URLS = {
     "Network Installation Services": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/afdd726c02cc7d9e8690e91dc7c1b0a13c962c96325cef7d1eece4d48001fb82.png",
@@ -458,1475 +637,29 @@ SERVICE_CATEGORIES = [
     {"name": "Cybersecurity Services", "unspsc": "81112500", "icon": "shield"},
 ]
 
-# Detailed IT Products Catalog
-IT_PRODUCTS_CATALOG = [
-    # HP Laptops
-    {
-        "id": "HP-LAP-001",
-        "name": "HP ProBook 450 G10 Business Laptop",
-        "brand": "HP",
-        "category": "IT Equipment - Laptops",
-        "sku": "HP-PB450G10-i7",
-        "unspsc_code": "43211503",
-        "base_price": 1299.00,
-        "image_url": PRODUCT_IMAGE_URLS.get("HP Laptop", PRODUCT_IMAGE_URLS.get("IT Equipment - Laptops")),
-        "short_description": "15.6\" FHD Display, Intel Core i7-1355U, 16GB RAM, 512GB SSD",
-        "full_description": "The HP ProBook 450 G10 is designed for business professionals who need reliability and performance. Features a 15.6-inch Full HD anti-glare display, Intel Core i7-1355U processor (up to 5.0 GHz), 16GB DDR4 RAM, and 512GB NVMe SSD. Includes Windows 11 Pro, Intel Iris Xe Graphics, fingerprint reader, and HD webcam with privacy shutter.",
-        "specifications": {
-            "Processor": "Intel Core i7-1355U (10 cores, up to 5.0 GHz)",
-            "Memory": "16GB DDR4-3200",
-            "Storage": "512GB PCIe NVMe SSD",
-            "Display": "15.6\" FHD (1920x1080) IPS Anti-Glare",
-            "Graphics": "Intel Iris Xe Graphics",
-            "Operating System": "Windows 11 Pro",
-            "Battery": "51Wh, up to 10 hours",
-            "Weight": "1.79 kg (3.94 lbs)",
-            "Ports": "USB-C, USB-A, HDMI, RJ-45, Audio Jack",
-            "Warranty": "3 Years On-Site"
-        },
-        "availability": {"in_stock": True, "quantity": 156, "warehouse": "US-East"},
-        "rating": 4.5,
-        "reviews_count": 234
-    },
-    {
-        "id": "HP-LAP-002",
-        "name": "HP EliteBook 840 G10 Enterprise Laptop",
-        "brand": "HP",
-        "category": "IT Equipment - Laptops",
-        "sku": "HP-EB840G10-i7",
-        "unspsc_code": "43211503",
-        "base_price": 1849.00,
-        "image_url": PRODUCT_IMAGE_URLS.get("HP Laptop", PRODUCT_IMAGE_URLS.get("IT Equipment - Laptops")),
-        "short_description": "14\" WUXGA Display, Intel Core i7-1365U, 32GB RAM, 1TB SSD",
-        "full_description": "HP EliteBook 840 G10 delivers enterprise-grade security with stunning design. Features Sure View Reflect privacy screen, Wolf Security for Business, and military-grade durability (MIL-STD 810H). Perfect for executive and hybrid workforce.",
-        "specifications": {
-            "Processor": "Intel Core i7-1365U vPro (12 cores, up to 5.2 GHz)",
-            "Memory": "32GB DDR5-4800",
-            "Storage": "1TB PCIe Gen4 NVMe SSD",
-            "Display": "14\" WUXGA (1920x1200) Sure View Reflect",
-            "Graphics": "Intel Iris Xe Graphics",
-            "Operating System": "Windows 11 Pro",
-            "Battery": "51Wh, up to 14 hours",
-            "Weight": "1.36 kg (3.0 lbs)",
-            "Security": "Fingerprint, IR Camera, TPM 2.0, Wolf Security",
-            "Warranty": "3 Years On-Site Next Business Day"
-        },
-        "availability": {"in_stock": True, "quantity": 89, "warehouse": "US-West"},
-        "rating": 4.8,
-        "reviews_count": 412
-    },
-    # Dell Laptops
-    {
-        "id": "DELL-LAP-001",
-        "name": "Dell Latitude 5540 Business Laptop",
-        "brand": "Dell",
-        "category": "IT Equipment - Laptops",
-        "sku": "DELL-LAT5540-i7",
-        "unspsc_code": "43211503",
-        "base_price": 1449.00,
-        "image_url": PRODUCT_IMAGE_URLS.get("HP Laptop", PRODUCT_IMAGE_URLS.get("IT Equipment - Laptops")),
-        "short_description": "15.6\" FHD+ Display, Intel Core i7-1365U, 16GB RAM, 512GB SSD",
-        "full_description": "Dell Latitude 5540 combines performance with enterprise manageability. Built for IT deployment with Dell Optimizer AI, SafeBIOS, and comprehensive Dell Technologies services.",
-        "specifications": {
-            "Processor": "Intel Core i7-1365U vPro (12 cores, up to 5.2 GHz)",
-            "Memory": "16GB DDR4-3200",
-            "Storage": "512GB PCIe NVMe SSD",
-            "Display": "15.6\" FHD+ (1920x1200) Anti-Glare",
-            "Graphics": "Intel Iris Xe Graphics",
-            "Operating System": "Windows 11 Pro",
-            "Battery": "54Wh, up to 11 hours",
-            "Weight": "1.66 kg (3.66 lbs)",
-            "Ports": "Thunderbolt 4, USB-A, HDMI 2.0, microSD",
-            "Warranty": "3 Years ProSupport"
-        },
-        "availability": {"in_stock": True, "quantity": 203, "warehouse": "US-Central"},
-        "rating": 4.6,
-        "reviews_count": 567
-    },
-    {
-        "id": "DELL-LAP-002",
-        "name": "Dell Precision 5680 Mobile Workstation",
-        "brand": "Dell",
-        "category": "IT Equipment - Laptops",
-        "sku": "DELL-P5680-i9",
-        "unspsc_code": "43211503",
-        "base_price": 3299.00,
-        "image_url": PRODUCT_IMAGE_URLS.get("HP Laptop", PRODUCT_IMAGE_URLS.get("IT Equipment - Laptops")),
-        "short_description": "16\" 3.5K OLED, Intel Core i9-13900H, 64GB RAM, 2TB SSD, RTX 3500",
-        "full_description": "Dell Precision 5680 is engineered for CAD, 3D modeling, and AI workloads. Features NVIDIA RTX 3500 Ada graphics, stunning 3.5K OLED display with 120Hz refresh, and ISV-certified reliability.",
-        "specifications": {
-            "Processor": "Intel Core i9-13900H (14 cores, up to 5.4 GHz)",
-            "Memory": "64GB DDR5-4800",
-            "Storage": "2TB PCIe Gen4 NVMe SSD",
-            "Display": "16\" 3.5K (3456x2160) OLED 120Hz Touch",
-            "Graphics": "NVIDIA RTX 3500 Ada 12GB GDDR6",
-            "Operating System": "Windows 11 Pro for Workstations",
-            "Battery": "86Wh, up to 8 hours",
-            "Weight": "2.01 kg (4.43 lbs)",
-            "Certifications": "ISV Certified (AutoCAD, SolidWorks, Revit)",
-            "Warranty": "3 Years ProSupport Plus"
-        },
-        "availability": {"in_stock": True, "quantity": 34, "warehouse": "US-East"},
-        "rating": 4.9,
-        "reviews_count": 123
-    },
-    # Lenovo Laptops
-    {
-        "id": "LEN-LAP-001",
-        "name": "Lenovo ThinkPad X1 Carbon Gen 11",
-        "brand": "Lenovo",
-        "category": "IT Equipment - Laptops",
-        "sku": "LEN-X1C-G11-i7",
-        "unspsc_code": "43211503",
-        "base_price": 1999.00,
-        "image_url": PRODUCT_IMAGE_URLS.get("HP Laptop", PRODUCT_IMAGE_URLS.get("IT Equipment - Laptops")),
-        "short_description": "14\" 2.8K OLED, Intel Core i7-1365U, 32GB RAM, 1TB SSD",
-        "full_description": "The legendary ThinkPad X1 Carbon continues its legacy with Gen 11. Ultra-light at just 1.12kg, featuring stunning OLED display, iconic keyboard, and comprehensive security features.",
-        "specifications": {
-            "Processor": "Intel Core i7-1365U vPro (12 cores, up to 5.2 GHz)",
-            "Memory": "32GB LPDDR5-6400",
-            "Storage": "1TB PCIe Gen4 NVMe SSD",
-            "Display": "14\" 2.8K (2880x1800) OLED 400nits",
-            "Graphics": "Intel Iris Xe Graphics",
-            "Operating System": "Windows 11 Pro",
-            "Battery": "57Wh, up to 15 hours",
-            "Weight": "1.12 kg (2.48 lbs)",
-            "Security": "Fingerprint, IR Camera, dTPM 2.0, ThinkShutter",
-            "Warranty": "3 Years Premier Support"
-        },
-        "availability": {"in_stock": True, "quantity": 178, "warehouse": "US-West"},
-        "rating": 4.7,
-        "reviews_count": 891
-    },
-    # Monitors
-    {
-        "id": "DELL-MON-001",
-        "name": "Dell UltraSharp U2723QE 27\" 4K USB-C Hub Monitor",
-        "brand": "Dell",
-        "category": "IT Equipment - Monitors",
-        "sku": "DELL-U2723QE",
-        "unspsc_code": "43211902",
-        "base_price": 799.00,
-        "image_url": PRODUCT_IMAGE_URLS.get("Dell Monitor", PRODUCT_IMAGE_URLS.get("IT Equipment - Monitors")),
-        "short_description": "27\" 4K UHD IPS Black, USB-C 90W PD, RJ45, Built-in KVM",
-        "full_description": "Dell UltraSharp U2723QE features IPS Black technology for 2000:1 contrast ratio. USB-C hub with 90W power delivery, RJ45 ethernet, and built-in KVM for multi-PC productivity.",
-        "specifications": {
-            "Screen Size": "27 inches",
-            "Resolution": "3840 x 2160 (4K UHD)",
-            "Panel Type": "IPS Black Technology",
-            "Refresh Rate": "60Hz",
-            "Response Time": "5ms (GtG Fast)",
-            "Brightness": "400 cd/m² (typical)",
-            "Contrast": "2000:1",
-            "Color Accuracy": "100% sRGB, 98% DCI-P3, Delta E < 2",
-            "Connectivity": "USB-C (90W PD), HDMI, DP, USB-A Hub, RJ45",
-            "Stand": "Height, Tilt, Swivel, Pivot Adjustable",
-            "Warranty": "3 Years Advanced Exchange"
-        },
-        "availability": {"in_stock": True, "quantity": 312, "warehouse": "US-Central"},
-        "rating": 4.8,
-        "reviews_count": 1245
-    },
-    {
-        "id": "LG-MON-001",
-        "name": "LG UltraFine 32UN880-B 32\" 4K Ergo Monitor",
-        "brand": "LG",
-        "category": "IT Equipment - Monitors",
-        "sku": "LG-32UN880B",
-        "unspsc_code": "43211902",
-        "base_price": 699.00,
-        "image_url": PRODUCT_IMAGE_URLS.get("Dell Monitor", PRODUCT_IMAGE_URLS.get("IT Equipment - Monitors")),
-        "short_description": "32\" 4K UHD IPS, USB-C 60W PD, Ergo Stand, HDR10",
-        "full_description": "LG UltraFine Ergo features a unique C-clamp stand for maximum desk space and flexibility. HDR10 support, 95% DCI-P3 color gamut, and USB-C one-cable solution.",
-        "specifications": {
-            "Screen Size": "31.5 inches",
-            "Resolution": "3840 x 2160 (4K UHD)",
-            "Panel Type": "IPS",
-            "Refresh Rate": "60Hz",
-            "Response Time": "5ms (GtG)",
-            "Brightness": "350 cd/m²",
-            "HDR": "HDR10",
-            "Color Gamut": "95% DCI-P3, 99% sRGB",
-            "Connectivity": "USB-C (60W PD), HDMI x2, USB Hub",
-            "Stand": "Ergo C-Clamp with Full Articulation",
-            "Warranty": "3 Years"
-        },
-        "availability": {"in_stock": True, "quantity": 187, "warehouse": "US-East"},
-        "rating": 4.6,
-        "reviews_count": 678
-    },
-    {
-        "id": "SAM-MON-001",
-        "name": "Samsung ViewFinity S9 49\" 5K Ultrawide",
-        "brand": "Samsung",
-        "category": "IT Equipment - Monitors",
-        "sku": "SAM-LS49C950",
-        "unspsc_code": "43211902",
-        "base_price": 1499.00,
-        "image_url": PRODUCT_IMAGE_URLS.get("Dell Monitor", PRODUCT_IMAGE_URLS.get("IT Equipment - Monitors")),
-        "short_description": "49\" 5K Dual QHD, 1000R Curve, USB-C 90W, KVM Switch",
-        "full_description": "Samsung ViewFinity S9 replaces two monitors with one stunning 49-inch ultrawide. 5120x1440 Dual QHD resolution with 1000R curvature for immersive productivity.",
-        "specifications": {
-            "Screen Size": "49 inches (32:9 Aspect)",
-            "Resolution": "5120 x 1440 (Dual QHD)",
-            "Panel Type": "VA",
-            "Refresh Rate": "120Hz",
-            "Response Time": "4ms (GtG)",
-            "Brightness": "350 cd/m²",
-            "Curvature": "1000R",
-            "Color Accuracy": "99% sRGB, Delta E < 2",
-            "Connectivity": "USB-C (90W PD), HDMI x2, DP, USB Hub",
-            "Features": "PBP/PIP, KVM Switch, Eye Saver Mode",
-            "Warranty": "3 Years"
-        },
-        "availability": {"in_stock": True, "quantity": 56, "warehouse": "US-West"},
-        "rating": 4.7,
-        "reviews_count": 234
-    },
-    # Networking Equipment
-    {
-        "id": "CISCO-NET-001",
-        "name": "Cisco Catalyst 9200L-48P-4G Network Switch",
-        "brand": "Cisco",
-        "category": "IT Equipment - Networking",
-        "sku": "C9200L-48P-4G-E",
-        "unspsc_code": "43222609",
-        "base_price": 4299.00,
-        "image_url": PRODUCT_IMAGE_URLS.get("Cisco Switch", PRODUCT_IMAGE_URLS.get("IT Equipment - Networking")),
-        "short_description": "48-Port PoE+ Gigabit, 4x1G SFP, 370W PoE Budget, Stackable",
-        "full_description": "Cisco Catalyst 9200L delivers enterprise-class access switching with PoE+ for wireless APs, IP phones, and IoT devices. DNA licensing for automation and security.",
-        "specifications": {
-            "Ports": "48x Gigabit Ethernet PoE+",
-            "Uplinks": "4x 1G SFP",
-            "PoE Budget": "370W",
-            "Switching Capacity": "176 Gbps",
-            "Forwarding Rate": "130 Mpps",
-            "Stacking": "Up to 8 switches",
-            "Management": "Cisco DNA Center, CLI, REST API",
-            "Security": "TrustSec, MACsec, VLAN ACLs",
-            "Dimensions": "1.73\" x 17.5\" x 14.96\"",
-            "Warranty": "Limited Lifetime (Hardware)"
-        },
-        "availability": {"in_stock": True, "quantity": 45, "warehouse": "US-Central"},
-        "rating": 4.9,
-        "reviews_count": 167
-    },
-    # Additional Products - Motors & Drives
-    {
-        "id": "MOT-001",
-        "name": "ABB Industrial AC Motor 7.5HP",
-        "brand": "ABB",
-        "category": "Motors & Drives",
-        "sku": "ABB-ACM-75HP",
-        "unspsc_code": "26101500",
-        "base_price": 1850.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/48eb714ed81a4debd0fcbb8614e5e4412263c16c00d900b645c44f969c378c75.png",
-        "short_description": "7.5HP 3-Phase AC Induction Motor, TEFC, 1800RPM",
-        "full_description": "ABB Industrial AC Motor delivers reliable performance for demanding industrial applications. Features Totally Enclosed Fan Cooled (TEFC) design, Class F insulation, and robust construction.",
-        "specifications": {
-            "Power": "7.5 HP (5.5 kW)",
-            "Voltage": "460V 3-Phase",
-            "Speed": "1800 RPM",
-            "Frame": "213T",
-            "Enclosure": "TEFC",
-            "Efficiency": "IE3 Premium",
-            "Service Factor": "1.15"
-        },
-        "availability": {"in_stock": True, "quantity": 28, "warehouse": "US-East"},
-        "rating": 4.7,
-        "reviews_count": 156
-    },
-    {
-        "id": "MOT-002",
-        "name": "Siemens VFD Variable Frequency Drive 15HP",
-        "brand": "Siemens",
-        "category": "Motors & Drives",
-        "sku": "SIE-VFD-15HP",
-        "unspsc_code": "26101600",
-        "base_price": 2450.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/48eb714ed81a4debd0fcbb8614e5e4412263c16c00d900b645c44f969c378c75.png",
-        "short_description": "15HP Variable Frequency Drive with Integrated PLC",
-        "full_description": "Siemens SINAMICS G120 VFD for precise motor control. Features built-in safety functions, Modbus communication, and energy-saving algorithms.",
-        "specifications": {
-            "Power Rating": "15 HP",
-            "Input Voltage": "480V 3-Phase",
-            "Output Frequency": "0-400 Hz",
-            "Control Mode": "V/f, Sensorless Vector",
-            "Communication": "Modbus RTU, Profinet",
-            "Protection": "IP20",
-            "Ambient Temp": "-10°C to +50°C"
-        },
-        "availability": {"in_stock": True, "quantity": 42, "warehouse": "US-Central"},
-        "rating": 4.8,
-        "reviews_count": 234
-    },
-    # Hydraulics & Pneumatics
-    {
-        "id": "HYD-001",
-        "name": "Parker Hydraulic Gear Pump 20GPM",
-        "brand": "Parker",
-        "category": "Hydraulics & Pneumatics",
-        "sku": "PAR-HGP-20",
-        "unspsc_code": "40141600",
-        "base_price": 875.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/67b16a05b97dae42c11c9c72f6e05b8af5d7aec7f63f9dfbd8e237a3fd5fc463.png",
-        "short_description": "High-pressure hydraulic gear pump, 20GPM at 3000PSI",
-        "full_description": "Parker PGP Series hydraulic gear pump designed for mobile and industrial applications. Features case-hardened gears and high volumetric efficiency.",
-        "specifications": {
-            "Flow Rate": "20 GPM",
-            "Max Pressure": "3000 PSI",
-            "Displacement": "3.6 cu in/rev",
-            "Shaft": "SAE B 2-Bolt",
-            "Port Size": "SAE 16",
-            "Speed Range": "500-3600 RPM",
-            "Fluid": "Mineral-based hydraulic oil"
-        },
-        "availability": {"in_stock": True, "quantity": 65, "warehouse": "US-West"},
-        "rating": 4.6,
-        "reviews_count": 189
-    },
-    {
-        "id": "PNE-001",
-        "name": "Festo Pneumatic Cylinder 100mm Bore",
-        "brand": "Festo",
-        "category": "Hydraulics & Pneumatics",
-        "sku": "FES-CYL-100",
-        "unspsc_code": "40141700",
-        "base_price": 425.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/f33db98cd05c6baa652b94111e2425bcdc4313c5335f9673a214cb91bf2d2284.png",
-        "short_description": "Double-acting pneumatic cylinder, ISO 15552 standard",
-        "full_description": "Festo DSBC Series pneumatic cylinder with adjustable cushioning. Built to ISO 15552 standard for easy interchangeability.",
-        "specifications": {
-            "Bore": "100mm",
-            "Stroke": "200mm",
-            "Operating Pressure": "1-10 bar",
-            "Piston Rod": "25mm Chrome-plated",
-            "Cushioning": "PPV Adjustable",
-            "Mounting": "ISO 15552",
-            "Temperature Range": "-20°C to +80°C"
-        },
-        "availability": {"in_stock": True, "quantity": 112, "warehouse": "EU-West"},
-        "rating": 4.9,
-        "reviews_count": 321
-    },
-    # Welding Equipment
-    {
-        "id": "WLD-001",
-        "name": "Lincoln Electric MIG Welder 250A",
-        "brand": "Lincoln Electric",
-        "category": "Welding",
-        "sku": "LIN-MIG-250",
-        "unspsc_code": "23270000",
-        "base_price": 2150.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/2e6b43c65ae6a6b6a4fa924c3f3f88f897cad2a707104ffdc57d165e3b1d04e8.png",
-        "short_description": "Industrial MIG welder with synergic control, 250A output",
-        "full_description": "Lincoln Electric Power MIG 256 delivers reliable performance for production welding. Features Diamond Core Technology for superior arc performance.",
-        "specifications": {
-            "Amperage Range": "30-250A",
-            "Input Power": "230V Single Phase",
-            "Wire Feed Speed": "50-700 IPM",
-            "Duty Cycle": "40% at 250A",
-            "Wire Size": "0.023-0.045\"",
-            "Spool Size": "10-15 lb",
-            "Weight": "145 lbs"
-        },
-        "availability": {"in_stock": True, "quantity": 23, "warehouse": "US-Central"},
-        "rating": 4.8,
-        "reviews_count": 445
-    },
-    # Test & Measurement
-    {
-        "id": "TST-001",
-        "name": "Fluke 289 True-RMS Industrial Multimeter",
-        "brand": "Fluke",
-        "category": "Test & Measurement",
-        "sku": "FLK-289",
-        "unspsc_code": "41110000",
-        "base_price": 595.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/411bcb13dee27615e9b815fde695cdc27e5f05eee4347121309be34bbdb8c3e0.png",
-        "short_description": "Industrial logging multimeter with TrendCapture",
-        "full_description": "Fluke 289 True-RMS Industrial Logging Multimeter with TrendCapture for recording signal fluctuations over time. CAT IV 600V safety rated.",
-        "specifications": {
-            "DC Accuracy": "0.025%",
-            "True RMS": "AC+DC",
-            "Max Voltage": "1000V DC, 1000V AC",
-            "Max Current": "10A (20A 30-sec)",
-            "Resistance": "500MΩ",
-            "Memory": "250 saved readings",
-            "Safety Rating": "CAT III 1000V, CAT IV 600V"
-        },
-        "availability": {"in_stock": True, "quantity": 87, "warehouse": "US-East"},
-        "rating": 4.9,
-        "reviews_count": 678
-    },
-    # Safety Equipment
-    {
-        "id": "SAF-001",
-        "name": "3M Powered Air Purifying Respirator System",
-        "brand": "3M",
-        "category": "Safety & PPE",
-        "sku": "3M-PAPR-SYS",
-        "unspsc_code": "46180000",
-        "base_price": 1250.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/61099fb65121a227a0c6e32140edac60830b2fd0c6269420c02ee34b2e9933a2.png",
-        "short_description": "Complete PAPR system with headgear and battery",
-        "full_description": "3M Versaflo TR-600 Powered Air Purifying Respirator System provides respiratory protection with comfortable airflow in hazardous environments.",
-        "specifications": {
-            "Airflow": "6.7 CFM",
-            "Battery Life": "8+ hours",
-            "Filter Type": "P100/OV/AG",
-            "APF": "1000",
-            "Weight": "2.2 lbs (belt unit)",
-            "Charging Time": "4 hours",
-            "Certifications": "NIOSH Approved"
-        },
-        "availability": {"in_stock": True, "quantity": 34, "warehouse": "US-West"},
-        "rating": 4.7,
-        "reviews_count": 234
-    },
-    {
-        "id": "SAF-002",
-        "name": "Honeywell Safety Harness Full Body",
-        "brand": "Honeywell",
-        "category": "Safety & PPE",
-        "sku": "HON-FBH-PRO",
-        "unspsc_code": "46180000",
-        "base_price": 345.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/9f7011dbf936aa67ab41af039d39e363f5a435c0efbfbed8a069e7684f74ad25.png",
-        "short_description": "Full body fall protection harness with quick-connect buckles",
-        "full_description": "Honeywell Miller Revolution Harness features DualTech webbing for maximum comfort and durability. Quick-connect chest and leg buckles for easy donning.",
-        "specifications": {
-            "Type": "Full Body",
-            "D-Rings": "5-Point (back, shoulders, front)",
-            "Weight Capacity": "400 lbs",
-            "Webbing": "DualTech Polyester",
-            "Buckles": "Quick-Connect",
-            "Size Range": "S-XL",
-            "Compliance": "OSHA 1926.502, ANSI Z359.11"
-        },
-        "availability": {"in_stock": True, "quantity": 156, "warehouse": "US-Central"},
-        "rating": 4.8,
-        "reviews_count": 412
-    },
-    # Material Handling
-    {
-        "id": "MAT-001",
-        "name": "Crown Electric Pallet Jack 4500lb",
-        "brand": "Crown",
-        "category": "Material Handling",
-        "sku": "CRW-EPJ-4500",
-        "unspsc_code": "24100000",
-        "base_price": 3950.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/d3b288a3bc2eae93ca8304dff24b6a6c2fa3e071ff498bff6f994dc86e336ddf.png",
-        "short_description": "Electric pallet jack with 4500lb capacity",
-        "full_description": "Crown WP 3000 Series electric pallet jack provides effortless load handling. Features regenerative braking and AC traction motor.",
-        "specifications": {
-            "Capacity": "4500 lbs",
-            "Fork Length": "48\"",
-            "Fork Width": "27\"",
-            "Lift Height": "7.9\"",
-            "Travel Speed": "4.1 mph",
-            "Battery": "24V Lead-Acid",
-            "Runtime": "8 hours continuous"
-        },
-        "availability": {"in_stock": True, "quantity": 12, "warehouse": "US-East"},
-        "rating": 4.6,
-        "reviews_count": 189
-    },
-    # Cutting Tools
-    {
-        "id": "CUT-001",
-        "name": "Kennametal Carbide End Mill Set",
-        "brand": "Kennametal",
-        "category": "Cutting Tools",
-        "sku": "KEN-CEM-SET",
-        "unspsc_code": "27110000",
-        "base_price": 485.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/5f3ec0cc9e4246d05af7b1609a78a8d3c2c76abbebba2fcb9823ffac8851309d.png",
-        "short_description": "10-piece solid carbide end mill set, various sizes",
-        "full_description": "Kennametal Harvi I TE solid carbide end mills for high-performance milling. Features advanced coating for extended tool life.",
-        "specifications": {
-            "Material": "Solid Carbide",
-            "Coating": "TiAlN",
-            "Flutes": "4",
-            "Sizes": "1/8\" to 1/2\"",
-            "Cut Length": "3x Diameter",
-            "Shank": "Standard",
-            "Helix Angle": "30°"
-        },
-        "availability": {"in_stock": True, "quantity": 78, "warehouse": "US-Central"},
-        "rating": 4.8,
-        "reviews_count": 345
-    },
-    # Storage & Organization
-    {
-        "id": "STO-001",
-        "name": "Lista Industrial Storage Cabinet",
-        "brand": "Lista",
-        "category": "Storage & Organization",
-        "sku": "LST-CAB-IND",
-        "unspsc_code": "56100000",
-        "base_price": 1875.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/ad801ca5185620afbcc264b33f0c59dacf2085f9b98895eb624068ec3ebad64d.png",
-        "short_description": "Heavy-duty modular drawer cabinet, 10 drawers",
-        "full_description": "Lista industrial storage cabinet with 100% drawer extension and 440lb drawer capacity. Ideal for tool storage and parts organization.",
-        "specifications": {
-            "Drawers": "10",
-            "Drawer Capacity": "440 lbs each",
-            "Dimensions": "30\"W x 28\"D x 59\"H",
-            "Material": "14-gauge Steel",
-            "Extension": "100%",
-            "Lock": "Central Locking",
-            "Color": "Industrial Gray"
-        },
-        "availability": {"in_stock": True, "quantity": 19, "warehouse": "US-West"},
-        "rating": 4.7,
-        "reviews_count": 234
-    },
-    # Cleaning & Janitorial
-    {
-        "id": "CLN-001",
-        "name": "Tennant T300 Floor Scrubber",
-        "brand": "Tennant",
-        "category": "Cleaning & Janitorial",
-        "sku": "TEN-T300",
-        "unspsc_code": "47130000",
-        "base_price": 4250.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/899b4b3e6aceed339189fb8d0b0fa309930af38864a707139f102cc7b47c1bfd.png",
-        "short_description": "Walk-behind floor scrubber, 20\" cleaning path",
-        "full_description": "Tennant T300 walk-behind scrubber delivers consistent cleaning performance. Features ec-H2O NanoClean technology for chemical-free cleaning.",
-        "specifications": {
-            "Cleaning Path": "20 inches",
-            "Solution Tank": "11 gallons",
-            "Recovery Tank": "12 gallons",
-            "Run Time": "Up to 3 hours",
-            "Productivity": "Up to 18,400 sq ft/hr",
-            "Power": "Battery (24V)",
-            "Weight": "287 lbs"
-        },
-        "availability": {"in_stock": True, "quantity": 8, "warehouse": "US-Central"},
-        "rating": 4.5,
-        "reviews_count": 167
-    },
-    # Lubrication
-    {
-        "id": "LUB-001",
-        "name": "Mobil Industrial Lubricant Kit",
-        "brand": "Mobil",
-        "category": "Lubrication",
-        "sku": "MOB-IND-KIT",
-        "unspsc_code": "15120000",
-        "base_price": 385.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/e12637ed7080f9cc6f0ab4378314a9bf6991b40c91ff9c4c31ea98fd25d1aa62.png",
-        "short_description": "Complete industrial lubrication kit with various grades",
-        "full_description": "Mobil Industrial Lubricant Kit includes synthetic and mineral-based lubricants for diverse industrial applications. Premium quality for extended equipment life.",
-        "specifications": {
-            "Includes": "5 products",
-            "Types": "Gear Oil, Hydraulic, Grease, Way Oil, Spindle",
-            "Grades": "ISO 32-220",
-            "Container Sizes": "1 Quart each",
-            "Base Stock": "Synthetic/Mineral",
-            "Temperature Range": "-40°F to +300°F",
-            "Applications": "General Industrial"
-        },
-        "availability": {"in_stock": True, "quantity": 145, "warehouse": "US-East"},
-        "rating": 4.6,
-        "reviews_count": 289
-    }
-]
-
-# New Vendor Products - Donaldson, Avantor, Markem-Imaje
-NEW_VENDOR_PRODUCTS = [
-    # Donaldson Products - Filtration Solutions
-    {
-        "id": "DON-FILT-001",
-        "name": "Donaldson PowerCore Air Filter Element",
-        "brand": "Donaldson",
-        "category": "Filtration",
-        "sku": "DON-PC-G2",
-        "unspsc_code": "40161500",
-        "base_price": 285.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/920a11b0254f17e72f4a3b2a14027ff42d9fb11f2c45ab67408d34471c2b3991.png",
-        "short_description": "High-efficiency PowerCore G2 air filtration element for heavy equipment",
-        "full_description": "Donaldson PowerCore G2 air filter delivers superior engine protection with breakthrough filtration technology. Compact design provides more filtration capacity in less space with extended service life.",
-        "specifications": {
-            "Filter Media": "Ultra-Web Nanofiber",
-            "Efficiency": "99.99% at 4 microns",
-            "Air Flow": "Up to 2,500 CFM",
-            "Dimensions": "12\" x 8\" x 6\"",
-            "Application": "Heavy Equipment, Trucks, Agriculture",
-            "Service Life": "Up to 3x standard filters",
-            "Operating Temp": "-40°F to +250°F"
-        },
-        "availability": {"in_stock": True, "quantity": 234, "warehouse": "US-Central"},
-        "rating": 4.8,
-        "reviews_count": 456
-    },
-    {
-        "id": "DON-FILT-002",
-        "name": "Donaldson Hydraulic Filter Assembly P566672",
-        "brand": "Donaldson",
-        "category": "Filtration",
-        "sku": "DON-P566672",
-        "unspsc_code": "40161501",
-        "base_price": 178.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/11d201fe0b5b4bef07c03b28000c28ba86ef8177ac5694ca45ad7dae9c8ac9d4.png",
-        "short_description": "Premium hydraulic filter for mobile and industrial equipment",
-        "full_description": "Donaldson Duramax hydraulic filter delivers exceptional contamination control for hydraulic systems. Synteq XP media technology provides high dirt-holding capacity and long service life.",
-        "specifications": {
-            "Filter Media": "Synteq XP Synthetic",
-            "Beta Ratio": "β₁₀ ≥ 1000",
-            "Flow Rate": "50 GPM",
-            "Collapse Pressure": "435 PSI",
-            "Operating Pressure": "150 PSI",
-            "Thread Size": "1-1/4\" SAE-16",
-            "Element Length": "8.66\""
-        },
-        "availability": {"in_stock": True, "quantity": 312, "warehouse": "US-East"},
-        "rating": 4.7,
-        "reviews_count": 289
-    },
-    {
-        "id": "DON-FILT-003",
-        "name": "Donaldson Torit PowerCore Dust Collector TG6",
-        "brand": "Donaldson",
-        "category": "Filtration",
-        "sku": "DON-TG6-5000",
-        "unspsc_code": "40161502",
-        "base_price": 12500.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/254fb871dea9172c9defc7ec40ceb0fe0a7680d955f413aa73cf05fbb0afd386.png",
-        "short_description": "Industrial dust collection system with PowerCore technology",
-        "full_description": "Donaldson Torit PowerCore TG Series dust collector combines PowerCore filtration with pulse-jet cleaning for superior dust collection. Ideal for weld fume, grinding dust, and general manufacturing.",
-        "specifications": {
-            "Airflow Capacity": "5,000 CFM",
-            "Filter Area": "1,500 sq ft",
-            "Efficiency": "99.99% at 0.5 microns",
-            "Motor": "15 HP",
-            "Voltage": "460V 3-Phase",
-            "Dimensions": "72\" W x 48\" D x 120\" H",
-            "Collection Bin": "55 Gallon",
-            "Cleaning": "Automatic Pulse-Jet"
-        },
-        "availability": {"in_stock": True, "quantity": 8, "warehouse": "US-West"},
-        "rating": 4.9,
-        "reviews_count": 127
-    },
-    {
-        "id": "DON-FILT-004",
-        "name": "Donaldson Fuel Filter Kit P553004",
-        "brand": "Donaldson",
-        "category": "Filtration",
-        "sku": "DON-P553004",
-        "unspsc_code": "40161503",
-        "base_price": 89.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/11d201fe0b5b4bef07c03b28000c28ba86ef8177ac5694ca45ad7dae9c8ac9d4.png",
-        "short_description": "High-performance diesel fuel filter with water separator",
-        "full_description": "Donaldson fuel filter kit with integrated water separator provides superior fuel system protection. Advanced media removes water and contaminants to protect injectors and fuel pumps.",
-        "specifications": {
-            "Efficiency": "98.7% at 4 microns",
-            "Water Separation": "95%",
-            "Flow Rate": "90 GPH",
-            "Micron Rating": "4 Micron",
-            "Application": "Diesel Engines",
-            "Thread": "1-14 UNS",
-            "Change Interval": "15,000 miles"
-        },
-        "availability": {"in_stock": True, "quantity": 567, "warehouse": "US-Central"},
-        "rating": 4.6,
-        "reviews_count": 834
-    },
-    # Avantor Products - Laboratory Supplies
-    {
-        "id": "AVT-LAB-001",
-        "name": "Avantor J.T.Baker Reagent Grade Chemicals Kit",
-        "brand": "Avantor",
-        "category": "Laboratory Supplies",
-        "sku": "AVT-JTB-CHEM-KIT",
-        "unspsc_code": "41100000",
-        "base_price": 425.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/bda0f8ddcb8e8de02c4616297d73d60d7a4332948c4c0f8e4d43f9cee4ea1d99.png",
-        "short_description": "Premium laboratory reagent chemical kit for analytical applications",
-        "full_description": "Avantor J.T.Baker reagent grade chemicals kit includes essential solvents and reagents for analytical chemistry. Meets or exceeds ACS specifications for purity and performance.",
-        "specifications": {
-            "Contents": "Acetone, Methanol, Isopropanol, Ethanol, Hexane",
-            "Grade": "ACS Reagent Grade",
-            "Purity": "≥99.5%",
-            "Container Size": "4L each",
-            "Certification": "Certificate of Analysis included",
-            "Storage": "Room temperature, away from heat",
-            "Shelf Life": "36 months"
-        },
-        "availability": {"in_stock": True, "quantity": 156, "warehouse": "US-East"},
-        "rating": 4.9,
-        "reviews_count": 312
-    },
-    {
-        "id": "AVT-LAB-002",
-        "name": "Avantor VWR Borosilicate Glassware Set",
-        "brand": "Avantor",
-        "category": "Laboratory Supplies",
-        "sku": "AVT-VWR-GLASS-SET",
-        "unspsc_code": "41100001",
-        "base_price": 345.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/0c4ded7d30419f0e2db518c70c5b61015ad39e470fb06392d9e7e8ccac2b3d8b.png",
-        "short_description": "Complete laboratory glassware set in premium borosilicate glass",
-        "full_description": "Avantor VWR laboratory glassware set includes essential beakers, flasks, and graduated cylinders in borosilicate 3.3 glass. Designed for chemical resistance and thermal stability.",
-        "specifications": {
-            "Material": "Borosilicate 3.3 Glass",
-            "Contents": "Beakers (6), Erlenmeyer Flasks (4), Graduated Cylinders (3), Volumetric Flasks (4)",
-            "Sizes": "50mL to 1000mL",
-            "Graduations": "White enamel, permanent",
-            "Thermal Resistance": "Up to 500°C",
-            "Chemical Resistance": "High",
-            "Autoclavable": "Yes"
-        },
-        "availability": {"in_stock": True, "quantity": 89, "warehouse": "US-West"},
-        "rating": 4.8,
-        "reviews_count": 234
-    },
-    {
-        "id": "AVT-LAB-003",
-        "name": "Avantor Laboratory PPE Safety Kit",
-        "brand": "Avantor",
-        "category": "Laboratory Supplies",
-        "sku": "AVT-PPE-KIT",
-        "unspsc_code": "46180001",
-        "base_price": 189.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/61f1f2f87a0b950443add33a553f6456b702582c73e0a7351e246e5676760d5a.png",
-        "short_description": "Complete laboratory personal protective equipment kit",
-        "full_description": "Avantor laboratory PPE kit provides comprehensive protection for lab personnel. Includes nitrile gloves, safety goggles, lab coat, and face shield for chemical handling safety.",
-        "specifications": {
-            "Contents": "Lab Coat (1), Safety Goggles (1), Face Shield (1), Nitrile Gloves (100pk), Shoe Covers (50pk)",
-            "Lab Coat Material": "Polypropylene, fluid resistant",
-            "Glove Material": "Nitrile, powder-free",
-            "Glove Thickness": "4 mil",
-            "Goggle Type": "Indirect vent, anti-fog",
-            "Sizes Available": "S, M, L, XL",
-            "Standards": "ANSI Z87.1, ASTM D6319"
-        },
-        "availability": {"in_stock": True, "quantity": 234, "warehouse": "US-Central"},
-        "rating": 4.7,
-        "reviews_count": 456
-    },
-    {
-        "id": "AVT-LAB-004",
-        "name": "Avantor Chromatography Column Kit",
-        "brand": "Avantor",
-        "category": "Laboratory Supplies",
-        "sku": "AVT-CHROM-KIT",
-        "unspsc_code": "41100002",
-        "base_price": 875.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/0c4ded7d30419f0e2db518c70c5b61015ad39e470fb06392d9e7e8ccac2b3d8b.png",
-        "short_description": "HPLC and flash chromatography column starter kit",
-        "full_description": "Avantor chromatography kit includes HPLC columns and flash cartridges for separation and purification. Ideal for pharmaceutical and research applications.",
-        "specifications": {
-            "HPLC Columns": "C18 (3), C8 (2), Silica (2)",
-            "Column Dimensions": "4.6 x 150mm, 4.6 x 250mm",
-            "Particle Size": "5 μm",
-            "Flash Cartridges": "12g, 24g, 40g sizes",
-            "Pore Size": "100Å",
-            "pH Range": "2-8",
-            "Application": "Small molecule separation"
-        },
-        "availability": {"in_stock": True, "quantity": 45, "warehouse": "US-East"},
-        "rating": 4.8,
-        "reviews_count": 167
-    },
-    # Markem-Imaje Products - Industrial Coding & Marking
-    {
-        "id": "MKI-CODE-001",
-        "name": "Markem-Imaje 9450 Continuous Inkjet Printer",
-        "brand": "Markem-Imaje",
-        "category": "Industrial Coding",
-        "sku": "MKI-9450-CIJ",
-        "unspsc_code": "44100000",
-        "base_price": 8500.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/dcbc55f9918f49116b8e9d85b0ef14471548a0e8682df9b9d9489aad94d48172.png",
-        "short_description": "High-speed continuous inkjet printer for product coding",
-        "full_description": "Markem-Imaje 9450 delivers reliable continuous inkjet printing for high-speed production lines. Features automatic ink viscosity control, simple interface, and minimal maintenance requirements.",
-        "specifications": {
-            "Print Speed": "Up to 2,857 characters/second",
-            "Lines of Print": "1-5 lines",
-            "Character Height": "1.5mm to 15mm",
-            "Print Distance": "1-15mm",
-            "Ink Types": "MEK, Acetone, Ethanol-based",
-            "Interface": "7\" Color Touchscreen",
-            "Communication": "Ethernet, RS232, USB",
-            "IP Rating": "IP55"
-        },
-        "availability": {"in_stock": True, "quantity": 23, "warehouse": "US-West"},
-        "rating": 4.8,
-        "reviews_count": 189
-    },
-    {
-        "id": "MKI-CODE-002",
-        "name": "Markem-Imaje SmartLase C350 Laser Coder",
-        "brand": "Markem-Imaje",
-        "category": "Industrial Coding",
-        "sku": "MKI-C350-LASER",
-        "unspsc_code": "44100001",
-        "base_price": 18500.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/f072196072ed9dc67a0130899ab9aacebfdfb10d650b2681c5735dd7f1c7692e.png",
-        "short_description": "CO2 laser marking system for permanent product coding",
-        "full_description": "Markem-Imaje SmartLase C350 provides permanent, high-contrast laser marking on packaging materials. Zero consumables, low maintenance, and environmentally friendly coding solution.",
-        "specifications": {
-            "Laser Type": "CO2, 30W",
-            "Wavelength": "10.6 μm",
-            "Marking Speed": "Up to 1,500 characters/second",
-            "Marking Area": "120mm x 120mm",
-            "Resolution": "1000 dpi",
-            "Focal Length": "170mm, 250mm, 350mm options",
-            "Cooling": "Air-cooled",
-            "Communication": "Ethernet, RS232, Profinet"
-        },
-        "availability": {"in_stock": True, "quantity": 12, "warehouse": "US-Central"},
-        "rating": 4.9,
-        "reviews_count": 98
-    },
-    {
-        "id": "MKI-CODE-003",
-        "name": "Markem-Imaje 2200 Print & Apply Labeler",
-        "brand": "Markem-Imaje",
-        "category": "Industrial Coding",
-        "sku": "MKI-2200-PA",
-        "unspsc_code": "44100002",
-        "base_price": 14500.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/0b758ba424771fe8b64df70bb8728a8b9ce3fde545e92f400ca3dc3dc88a4076.png",
-        "short_description": "Automated label print and apply system for packaging lines",
-        "full_description": "Markem-Imaje 2200 Series print and apply labeler combines high-resolution thermal transfer printing with precision label application. Ideal for case, pallet, and product labeling.",
-        "specifications": {
-            "Print Technology": "Thermal Transfer, 300 dpi",
-            "Print Speed": "Up to 16 IPS",
-            "Label Width": "1\" to 6\"",
-            "Label Length": "0.5\" to 20\"",
-            "Application Methods": "Tamp, Blow, Wipe",
-            "Ribbon Length": "1,500 meters",
-            "Construction": "Stainless Steel",
-            "Communication": "Ethernet, RS232, USB"
-        },
-        "availability": {"in_stock": True, "quantity": 18, "warehouse": "US-East"},
-        "rating": 4.7,
-        "reviews_count": 134
-    },
-    {
-        "id": "MKI-CODE-004",
-        "name": "Markem-Imaje 5800 High-Resolution Inkjet",
-        "brand": "Markem-Imaje",
-        "category": "Industrial Coding",
-        "sku": "MKI-5800-HR",
-        "unspsc_code": "44100003",
-        "base_price": 5200.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/8461848d-5003-4951-88f2-3971eec2f2c7/images/dcbc55f9918f49116b8e9d85b0ef14471548a0e8682df9b9d9489aad94d48172.png",
-        "short_description": "High-resolution large character inkjet for secondary packaging",
-        "full_description": "Markem-Imaje 5800 offers high-resolution printing on porous substrates like corrugated cardboard. Perfect for case coding with crisp graphics, barcodes, and text.",
-        "specifications": {
-            "Resolution": "185 dpi",
-            "Print Height": "Up to 70mm (2.75\")",
-            "Print Speed": "Up to 90 m/min",
-            "Ink Type": "Water-based or Oil-based",
-            "Cartridge Life": "Up to 350,000 prints",
-            "Printheads": "1-4 heads cascadable",
-            "Interface": "10\" Color Touchscreen",
-            "IP Rating": "IP65"
-        },
-        "availability": {"in_stock": True, "quantity": 34, "warehouse": "US-West"},
-        "rating": 4.6,
-        "reviews_count": 212
-    }
-]
-
-# Detailed IT Services Catalog
-IT_SERVICES_CATALOG = [
-    {
-        "id": "SVC-NET-001",
-        "name": "Network Infrastructure Installation - Enterprise",
-        "category": "Network Installation Services",
-        "unspsc_code": "81111801",
-        "unspsc_name": "Network installation services",
-        "supplier_name": "Infosys Network Solutions",
-        "supplier_logo": None,
-        "supplier_color": "#007CC3",
-        "pricing_model": "Per Hour",
-        "base_price": 125.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/afdd726c02cc7d9e8690e91dc7c1b0a13c962c96325cef7d1eece4d48001fb82.png",
-        "short_description": "Professional network cabling, switch configuration, and testing",
-        "full_description": "Complete enterprise network installation including structured cabling (Cat6/Cat6a), switch rack mounting and configuration, fiber optic termination, cable management, and comprehensive testing with documentation.",
-        "service_includes": [
-            "Site survey and network design",
-            "Structured cabling (Cat6/Cat6a/Fiber)",
-            "Patch panel and switch installation",
-            "Network switch configuration",
-            "Cable certification and testing",
-            "Network documentation and labeling",
-            "Post-installation support (48 hours)"
-        ],
-        "availability": {"available": True, "lead_time_days": 3, "regions": ["North America", "Europe", "APAC"]},
-        "rating": 4.8,
-        "reviews_count": 234
-    },
-    {
-        "id": "SVC-NET-002",
-        "name": "Wireless Network Setup - Enterprise Wi-Fi 6E",
-        "category": "Network Installation Services",
-        "unspsc_code": "81111802",
-        "unspsc_name": "Wireless network installation",
-        "supplier_name": "Cisco Certified Partner",
-        "supplier_logo": None,
-        "supplier_color": "#049FD9",
-        "pricing_model": "Per Access Point",
-        "base_price": 350.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/88c4a88606ac13bb8e539641523213064945b830124a9c902aa9147532aa3c49.png",
-        "short_description": "Wi-Fi 6E access point deployment with site survey",
-        "full_description": "Enterprise-grade wireless network deployment including predictive site survey, access point mounting, controller configuration, SSID setup, security policies, and performance optimization.",
-        "service_includes": [
-            "Predictive RF site survey",
-            "Access point mounting and cabling",
-            "Wireless controller configuration",
-            "SSID and security policy setup",
-            "Guest network configuration",
-            "Heat map validation",
-            "Performance optimization"
-        ],
-        "availability": {"available": True, "lead_time_days": 5, "regions": ["North America", "Europe"]},
-        "rating": 4.7,
-        "reviews_count": 189
-    },
-    {
-        "id": "SVC-IT-001",
-        "name": "Desktop/Laptop Deployment Service",
-        "category": "IT Equipment Installation & Setup",
-        "unspsc_code": "81112201",
-        "unspsc_name": "Computer hardware installation",
-        "supplier_name": "Dell ProDeploy Services",
-        "supplier_logo": None,
-        "supplier_color": "#007DB8",
-        "pricing_model": "Per Device",
-        "base_price": 85.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/cff7a5158c43f81799d59a99494279b2c5f255b2610fe406a1ffe6934277c4a7.png",
-        "short_description": "Complete device imaging, setup, and user migration",
-        "full_description": "Full PC lifecycle deployment including asset tagging, image deployment, domain join, software installation, data migration, and user orientation. Includes packaging disposal.",
-        "service_includes": [
-            "Asset tagging and inventory",
-            "Custom image deployment",
-            "Domain join and policy application",
-            "Standard software installation",
-            "User data migration (up to 50GB)",
-            "Basic user orientation (30 min)",
-            "Old device data wipe",
-            "Packaging disposal"
-        ],
-        "availability": {"available": True, "lead_time_days": 1, "regions": ["Global"]},
-        "rating": 4.6,
-        "reviews_count": 567
-    },
-    {
-        "id": "SVC-IT-002",
-        "name": "Server Rack Installation & Configuration",
-        "category": "IT Equipment Installation & Setup",
-        "unspsc_code": "81112202",
-        "unspsc_name": "Server installation services",
-        "supplier_name": "HP Enterprise Services",
-        "supplier_logo": None,
-        "supplier_color": "#0096D6",
-        "pricing_model": "Per Server",
-        "base_price": 450.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/a1c30bd322a62ea6d441b12da74c66ca96707140958e1737c0d9a286f041a795.png",
-        "short_description": "Physical server installation with OS and baseline config",
-        "full_description": "Complete server deployment including rack mounting, power and network cabling, BIOS/firmware updates, OS installation, baseline security hardening, and integration with monitoring systems.",
-        "service_includes": [
-            "Server rack mounting",
-            "Power and network cabling",
-            "BIOS/firmware updates",
-            "RAID configuration",
-            "Operating system installation",
-            "Security baseline hardening",
-            "Monitoring agent deployment",
-            "Documentation and handover"
-        ],
-        "availability": {"available": True, "lead_time_days": 2, "regions": ["North America", "Europe", "APAC"]},
-        "rating": 4.9,
-        "reviews_count": 312
-    },
-    {
-        "id": "SVC-SEC-001",
-        "name": "Network Security Assessment",
-        "category": "Cybersecurity Services",
-        "unspsc_code": "81112501",
-        "unspsc_name": "Network security services",
-        "supplier_name": "Infosys Cybersecurity",
-        "supplier_logo": None,
-        "supplier_color": "#007CC3",
-        "pricing_model": "Per Assessment",
-        "base_price": 5500.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/88995698058a90986297157d130fa19ac15656bbe7ac2296b1949cbb9993e380.png",
-        "short_description": "Comprehensive vulnerability scan and penetration testing",
-        "full_description": "Full network security assessment including vulnerability scanning, penetration testing, firewall review, and detailed remediation recommendations with executive summary.",
-        "service_includes": [
-            "External vulnerability scanning",
-            "Internal network assessment",
-            "Penetration testing (network layer)",
-            "Firewall rule review",
-            "Detailed findings report",
-            "Risk prioritization matrix",
-            "Executive summary presentation",
-            "Remediation consultation (4 hours)"
-        ],
-        "availability": {"available": True, "lead_time_days": 7, "regions": ["Global"]},
-        "rating": 4.8,
-        "reviews_count": 145
-    },
-    {
-        "id": "SVC-MGD-001",
-        "name": "Managed IT Support - Per User/Month",
-        "category": "IT Managed Services",
-        "unspsc_code": "81112301",
-        "unspsc_name": "IT managed services",
-        "supplier_name": "Infosys Managed Services",
-        "supplier_logo": None,
-        "supplier_color": "#007CC3",
-        "pricing_model": "Per User/Month",
-        "base_price": 75.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/f848c4af2e1f5caac71aa56dc1f1b9285fb801ad8e1ee77ad4185116211e3627.png",
-        "short_description": "24/7 helpdesk, remote support, and proactive monitoring",
-        "full_description": "Comprehensive managed IT services including 24/7 helpdesk, remote troubleshooting, patch management, antivirus monitoring, and monthly reporting.",
-        "service_includes": [
-            "24/7 helpdesk support (phone/email/chat)",
-            "Remote desktop support",
-            "Patch management",
-            "Antivirus monitoring",
-            "Basic user provisioning",
-            "Monthly health reports",
-            "Quarterly business reviews",
-            "15 min average response time"
-        ],
-        "availability": {"available": True, "lead_time_days": 0, "regions": ["Global"]},
-        "rating": 4.5,
-        "reviews_count": 789
-    },
-    # Additional Services
-    {
-        "id": "SVC-DC-001",
-        "name": "Data Center Infrastructure Services",
-        "category": "IT Equipment Installation & Setup",
-        "unspsc_code": "81112203",
-        "unspsc_name": "Data center services",
-        "supplier_name": "Equinix Solutions",
-        "supplier_logo": None,
-        "supplier_color": "#ED1C24",
-        "pricing_model": "Per Rack",
-        "base_price": 1250.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/45b8605364d7a481ab4a4bf15be73f59f9761da18220b1efb363c134d7ce0fb4.png",
-        "short_description": "Complete data center rack installation and configuration",
-        "full_description": "End-to-end data center infrastructure deployment including rack installation, power distribution, cooling setup, cable management, and environmental monitoring integration.",
-        "service_includes": [
-            "42U rack installation",
-            "Power distribution unit setup",
-            "Cable management systems",
-            "Environmental monitoring",
-            "Hot/cold aisle containment",
-            "Documentation and labeling",
-            "Commissioning and testing"
-        ],
-        "availability": {"available": True, "lead_time_days": 5, "regions": ["North America", "Europe", "APAC"]},
-        "rating": 4.9,
-        "reviews_count": 234
-    },
-    {
-        "id": "SVC-MNT-001",
-        "name": "Industrial Equipment Maintenance",
-        "category": "Facilities Management & Workplace Services",
-        "unspsc_code": "72151500",
-        "unspsc_name": "Equipment maintenance services",
-        "supplier_name": "SKF Reliability Systems",
-        "supplier_logo": None,
-        "supplier_color": "#005B94",
-        "pricing_model": "Per Hour",
-        "base_price": 145.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/fd8c452c65505c4fa649fae356b50b7dcc945b4ca0d180088866270a0b7d86f5.png",
-        "short_description": "Preventive and predictive maintenance for industrial machinery",
-        "full_description": "Comprehensive industrial equipment maintenance program including vibration analysis, thermography, oil analysis, and predictive maintenance scheduling.",
-        "service_includes": [
-            "Vibration monitoring and analysis",
-            "Thermal imaging inspection",
-            "Oil sample analysis",
-            "Alignment verification",
-            "Bearing inspection and replacement",
-            "Maintenance scheduling",
-            "Performance reporting"
-        ],
-        "availability": {"available": True, "lead_time_days": 2, "regions": ["Global"]},
-        "rating": 4.7,
-        "reviews_count": 456
-    },
-    {
-        "id": "SVC-TRN-001",
-        "name": "Corporate Technology Training",
-        "category": "Corporate & Business Support Services",
-        "unspsc_code": "86101700",
-        "unspsc_name": "Professional training services",
-        "supplier_name": "Infosys Learning Solutions",
-        "supplier_logo": None,
-        "supplier_color": "#007CC3",
-        "pricing_model": "Per Session",
-        "base_price": 2500.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/8d3d10c922ac4516e87dff834b0b0f3d00633c1032b7667687f506addb1e98b3.png",
-        "short_description": "Custom corporate technology training programs",
-        "full_description": "Tailored technology training programs for enterprise teams. Includes curriculum development, certified instructors, hands-on labs, and certification preparation.",
-        "service_includes": [
-            "Needs assessment",
-            "Custom curriculum development",
-            "Certified instructor delivery",
-            "Hands-on lab exercises",
-            "Training materials and guides",
-            "Post-training assessment",
-            "Certification exam prep"
-        ],
-        "availability": {"available": True, "lead_time_days": 7, "regions": ["Global"]},
-        "rating": 4.6,
-        "reviews_count": 312
-    },
-    {
-        "id": "SVC-QC-001",
-        "name": "Quality Control & Inspection Services",
-        "category": "HSE, Quality & Compliance Services",
-        "unspsc_code": "77100000",
-        "unspsc_name": "Quality inspection services",
-        "supplier_name": "Bureau Veritas",
-        "supplier_logo": None,
-        "supplier_color": "#E30613",
-        "pricing_model": "Per Day",
-        "base_price": 950.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/1e0527ecaf208bd7905092e337f70a54eabef0782a81bd6e510c8e4d5c3c18ac.png",
-        "short_description": "Product and process quality inspection services",
-        "full_description": "Independent quality control and inspection services including incoming material inspection, in-process checks, final product inspection, and supplier audits.",
-        "service_includes": [
-            "Incoming material inspection",
-            "In-process quality checks",
-            "Final product inspection",
-            "AQL sampling inspection",
-            "Supplier quality audits",
-            "Non-conformance reporting",
-            "Corrective action tracking"
-        ],
-        "availability": {"available": True, "lead_time_days": 3, "regions": ["Global"]},
-        "rating": 4.8,
-        "reviews_count": 289
-    },
-    {
-        "id": "SVC-LOG-001",
-        "name": "Supply Chain Optimization Services",
-        "category": "Logistics, Warehouse & Supply Chain Services",
-        "unspsc_code": "78100000",
-        "unspsc_name": "Supply chain services",
-        "supplier_name": "DHL Supply Chain",
-        "supplier_logo": None,
-        "supplier_color": "#FFCC00",
-        "pricing_model": "Per Project",
-        "base_price": 15000.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/6810b3362e86e8ba23010897c9d6d3718dce4d1803e090213f94464944c1175b.png",
-        "short_description": "End-to-end supply chain analysis and optimization",
-        "full_description": "Comprehensive supply chain optimization including network analysis, inventory optimization, transportation routing, and warehouse layout design.",
-        "service_includes": [
-            "Current state assessment",
-            "Network optimization modeling",
-            "Inventory strategy development",
-            "Transportation route optimization",
-            "Warehouse layout design",
-            "Technology recommendations",
-            "Implementation roadmap"
-        ],
-        "availability": {"available": True, "lead_time_days": 10, "regions": ["North America", "Europe"]},
-        "rating": 4.7,
-        "reviews_count": 167
-    },
-    {
-        "id": "SVC-CLN-001",
-        "name": "Commercial Deep Cleaning Services",
-        "category": "Facilities Management & Workplace Services",
-        "unspsc_code": "76111500",
-        "unspsc_name": "Commercial cleaning services",
-        "supplier_name": "ISS Facility Services",
-        "supplier_logo": None,
-        "supplier_color": "#E4002B",
-        "pricing_model": "Per Sq Ft",
-        "base_price": 0.45,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/9c245588-b7cf-44e6-ac82-aa2be101ce17/images/124d0636fdb6759f0b0e809e00fe07c91c12562a510f2da1e68cc2cb7a0fd266.png",
-        "short_description": "Professional commercial deep cleaning and sanitization",
-        "full_description": "Comprehensive commercial deep cleaning services including floor stripping and waxing, carpet extraction, window cleaning, and disinfection protocols.",
-        "service_includes": [
-            "Floor stripping and refinishing",
-            "Carpet deep extraction",
-            "Window and glass cleaning",
-            "High-touch surface disinfection",
-            "Restroom deep sanitization",
-            "Kitchen/break room cleaning",
-            "Waste removal and recycling"
-        ],
-        "availability": {"available": True, "lead_time_days": 1, "regions": ["Global"]},
-        "rating": 4.5,
-        "reviews_count": 523
-    },
-    {
-        "id": "SVC-SEC-002",
-        "name": "Penetration Testing Services",
-        "category": "Cybersecurity Services",
-        "unspsc_code": "81112502",
-        "unspsc_name": "Security testing services",
-        "supplier_name": "Mandiant",
-        "supplier_logo": None,
-        "supplier_color": "#FF6600",
-        "pricing_model": "Per Assessment",
-        "base_price": 12500.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/88995698058a90986297157d130fa19ac15656bbe7ac2296b1949cbb9993e380.png",
-        "short_description": "Advanced penetration testing for web, network, and applications",
-        "full_description": "Comprehensive penetration testing services including web application testing, network penetration, social engineering, and red team exercises.",
-        "service_includes": [
-            "Web application penetration testing",
-            "Network infrastructure testing",
-            "Social engineering assessment",
-            "Wireless security testing",
-            "Physical security testing",
-            "Detailed findings report",
-            "Remediation consultation"
-        ],
-        "availability": {"available": True, "lead_time_days": 14, "regions": ["Global"]},
-        "rating": 4.9,
-        "reviews_count": 178
-    },
-    {
-        "id": "SVC-MKT-001",
-        "name": "B2B Digital Marketing Campaign",
-        "category": "Digital Marketing & Creative Agency Services",
-        "unspsc_code": "80171600",
-        "unspsc_name": "Marketing campaign services",
-        "supplier_name": "WPP Digital",
-        "supplier_logo": None,
-        "supplier_color": "#5C0080",
-        "pricing_model": "Per Month",
-        "base_price": 8500.00,
-        "image_url": "https://static.prod-images.emergentagent.com/jobs/93bd7302-b98c-48b8-885e-c31e5a425122/images/516a358136877fc314216c27facefe3422f8dfa69a45e5553584d72a437e9fce.png",
-        "short_description": "Full-service B2B digital marketing campaign management",
-        "full_description": "Complete B2B digital marketing campaign including strategy development, content creation, paid media management, and performance analytics.",
-        "service_includes": [
-            "Campaign strategy development",
-            "Content creation and copywriting",
-            "LinkedIn advertising management",
-            "Google Ads B2B campaigns",
-            "Email marketing automation",
-            "Landing page optimization",
-            "Monthly performance reporting"
-        ],
-        "availability": {"available": True, "lead_time_days": 5, "regions": ["Global"]},
-        "rating": 4.6,
-        "reviews_count": 234
-    },
-    # Additional Digital Marketing Services
-    {
-        "id": "SVC-SMM-001",
-        "name": "Social Media Marketing Management",
-        "category": "Digital Marketing & Creative Agency Services",
-        "unspsc_code": "80171610",
-        "unspsc_name": "Social media marketing services",
-        "supplier_name": "Hootsuite Enterprise",
-        "supplier_logo": None,
-        "supplier_color": "#143059",
-        "pricing_model": "Per Month",
-        "base_price": 3500.00,
-        "image_url": SERVICE_IMAGE_URLS.get("Social Media Marketing"),
-        "short_description": "Full-service social media marketing and community management",
-        "full_description": "Comprehensive social media marketing services including strategy development, content creation, community management, and analytics reporting across all major platforms.",
-        "service_includes": [
-            "Social media strategy development",
-            "Content calendar creation",
-            "Daily post publishing",
-            "Community engagement management",
-            "Influencer partnership coordination",
-            "Social listening and monitoring",
-            "Monthly analytics reports"
-        ],
-        "availability": {"available": True, "lead_time_days": 3, "regions": ["Global"]},
-        "rating": 4.7,
-        "reviews_count": 456
-    },
-    {
-        "id": "SVC-SEO-001",
-        "name": "Enterprise SEO Optimization Services",
-        "category": "Digital Marketing & Creative Agency Services",
-        "unspsc_code": "80171608",
-        "unspsc_name": "Search engine optimization services",
-        "supplier_name": "Moz Enterprise",
-        "supplier_logo": None,
-        "supplier_color": "#1B98E0",
-        "pricing_model": "Per Month",
-        "base_price": 4500.00,
-        "image_url": SERVICE_IMAGE_URLS.get("SEO Optimization"),
-        "short_description": "Technical and content SEO optimization for enterprise websites",
-        "full_description": "Full-spectrum SEO services including technical audits, on-page optimization, link building, and content strategy to improve organic search rankings and drive qualified traffic.",
-        "service_includes": [
-            "Technical SEO audit",
-            "Keyword research and mapping",
-            "On-page optimization",
-            "Link building campaigns",
-            "Content optimization",
-            "Competitor analysis",
-            "Monthly ranking reports"
-        ],
-        "availability": {"available": True, "lead_time_days": 5, "regions": ["Global"]},
-        "rating": 4.8,
-        "reviews_count": 312
-    },
-    {
-        "id": "SVC-CNT-001",
-        "name": "B2B Content Marketing Services",
-        "category": "Digital Marketing & Creative Agency Services",
-        "unspsc_code": "80172106",
-        "unspsc_name": "Content marketing services",
-        "supplier_name": "Contently Enterprise",
-        "supplier_logo": None,
-        "supplier_color": "#FF5733",
-        "pricing_model": "Per Month",
-        "base_price": 6000.00,
-        "image_url": SERVICE_IMAGE_URLS.get("Content Marketing"),
-        "short_description": "Strategic content creation and distribution for B2B audiences",
-        "full_description": "End-to-end B2B content marketing services including content strategy, thought leadership creation, blog management, and content distribution across multiple channels.",
-        "service_includes": [
-            "Content strategy development",
-            "Blog article writing (8/month)",
-            "Whitepaper creation (1/quarter)",
-            "Case study development",
-            "Newsletter content creation",
-            "Content distribution strategy",
-            "Performance analytics"
-        ],
-        "availability": {"available": True, "lead_time_days": 7, "regions": ["Global"]},
-        "rating": 4.5,
-        "reviews_count": 234
-    },
-    {
-        "id": "SVC-EML-001",
-        "name": "Email Marketing Automation Services",
-        "category": "Digital Marketing & Creative Agency Services",
-        "unspsc_code": "80171615",
-        "unspsc_name": "Email marketing services",
-        "supplier_name": "Mailchimp Enterprise",
-        "supplier_logo": None,
-        "supplier_color": "#FFE01B",
-        "pricing_model": "Per Month",
-        "base_price": 2500.00,
-        "image_url": SERVICE_IMAGE_URLS.get("Email Marketing"),
-        "short_description": "Automated email marketing campaigns with lead nurturing",
-        "full_description": "Comprehensive email marketing services including campaign strategy, template design, automation workflow setup, A/B testing, and performance optimization.",
-        "service_includes": [
-            "Email strategy development",
-            "Template design and coding",
-            "List segmentation setup",
-            "Automation workflow creation",
-            "A/B testing programs",
-            "Deliverability optimization",
-            "Performance reporting"
-        ],
-        "availability": {"available": True, "lead_time_days": 3, "regions": ["Global"]},
-        "rating": 4.6,
-        "reviews_count": 389
-    },
-    {
-        "id": "SVC-PPC-001",
-        "name": "PPC & Paid Advertising Management",
-        "category": "Digital Marketing & Creative Agency Services",
-        "unspsc_code": "80171620",
-        "unspsc_name": "Paid advertising services",
-        "supplier_name": "WordStream Agency",
-        "supplier_logo": None,
-        "supplier_color": "#4285F4",
-        "pricing_model": "Percentage of Ad Spend",
-        "base_price": 15.00,
-        "image_url": SERVICE_IMAGE_URLS.get("PPC Advertising"),
-        "short_description": "Google Ads, LinkedIn Ads, and paid media campaign management",
-        "full_description": "Full-service paid advertising management across Google Ads, LinkedIn, Facebook, and programmatic display networks with focus on ROI optimization.",
-        "service_includes": [
-            "Campaign strategy and setup",
-            "Keyword and audience research",
-            "Ad copywriting and creative",
-            "Bid management optimization",
-            "Landing page recommendations",
-            "Conversion tracking setup",
-            "Weekly performance reports"
-        ],
-        "availability": {"available": True, "lead_time_days": 3, "regions": ["Global"]},
-        "rating": 4.7,
-        "reviews_count": 567
-    },
-    {
-        "id": "SVC-BRD-001",
-        "name": "Brand Identity Design Services",
-        "category": "Digital Marketing & Creative Agency Services",
-        "unspsc_code": "80141605",
-        "unspsc_name": "Brand identity design",
-        "supplier_name": "Pentagram Design",
-        "supplier_logo": None,
-        "supplier_color": "#000000",
-        "pricing_model": "Per Project",
-        "base_price": 25000.00,
-        "image_url": SERVICE_IMAGE_URLS.get("Brand Identity Design"),
-        "short_description": "Complete brand identity creation and visual design system",
-        "full_description": "Comprehensive brand identity design services including logo design, visual identity system, brand guidelines, and collateral design for consistent brand representation.",
-        "service_includes": [
-            "Brand discovery workshop",
-            "Logo design and variations",
-            "Color palette development",
-            "Typography selection",
-            "Visual design system",
-            "Brand guidelines documentation",
-            "Collateral template design"
-        ],
-        "availability": {"available": True, "lead_time_days": 21, "regions": ["Global"]},
-        "rating": 4.9,
-        "reviews_count": 178
-    }
-]
+# Reference data (services, PunchOut systems, InfoCoin rewards), preparsed JSON decoded once
+REFERENCE_DATA = load_catalog_blob(CATALOG_DATA_DIR / "reference.json")
 
 # PunchOut Systems
-PUNCHOUT_SYSTEMS = [
-    {"name": "Coupa", "logo": "https://logo.clearbit.com/coupa.com"},
-    {"name": "SAP Ariba", "logo": "https://logo.clearbit.com/ariba.com"},
-    {"name": "SAP ERP", "logo": "https://logo.clearbit.com/sap.com"},
-    {"name": "Ivalua", "logo": "https://logo.clearbit.com/ivalua.com"},
-    {"name": "Oracle", "logo": "https://logo.clearbit.com/oracle.com"},
-]
-
-# Services data with UNSPSC codes
-SERVICES_DATA = [
-    {"name": "Janitorial Office Cleaning Services – Business Hours", "unspsc_code": "76111501", "unspsc_name": "Janitorial services", "category": "Facilities Management & Workplace Services", "country": "Denmark", "supplier_name": "Wipro IT Services DK", "unit_of_measure": "Per Sq Ft", "base_price": 0.85},
-    {"name": "Deep Cleaning Services – Office Facilities", "unspsc_code": "76111502", "unspsc_name": "Commercial cleaning", "category": "Facilities Management & Workplace Services", "country": "Nigeria", "supplier_name": None, "unit_of_measure": "Per Service", "base_price": None},
-    {"name": "Pest Control Services – Preventive", "unspsc_code": "76102101", "unspsc_name": "Pest control", "category": "Facilities Management & Workplace Services", "country": "Spain", "supplier_name": "Genpact Enterprise IT ES", "unit_of_measure": "Per Visit", "base_price": 150.00},
-    {"name": "HVAC Preventive Maintenance Services", "unspsc_code": "72101502", "unspsc_name": "HVAC maintenance", "category": "Facilities Management & Workplace Services", "country": "Switzerland", "supplier_name": None, "unit_of_measure": "Per Service", "base_price": None},
-    {"name": "Security Guard Services – Day Shift", "unspsc_code": "92121504", "unspsc_name": "Guard services", "category": "Facilities Management & Workplace Services", "country": "Brazil", "supplier_name": "Siemens Smart Infrastructure", "unit_of_measure": "Per Hour", "base_price": 25.00},
-    {"name": "Elevator Preventive Maintenance Services", "unspsc_code": "72101504", "unspsc_name": "Elevator maintenance", "category": "Facilities Management & Workplace Services", "country": "Chile", "supplier_name": "Schindler Elevator", "unit_of_measure": "Per Month", "base_price": 450.00},
-    {"name": "Fire Extinguisher Inspection Services", "unspsc_code": "46191601", "unspsc_name": "Fire safety inspection", "category": "Facilities Management & Workplace Services", "country": "Portugal", "supplier_name": "Tata Consultancy Services", "unit_of_measure": "Per Unit", "base_price": 15.00},
-    {"name": "Digital Marketing Strategy Services", "unspsc_code": "80171607", "unspsc_name": "Digital marketing", "category": "Digital Marketing & Creative Agency Services", "country": "Greece", "supplier_name": None, "unit_of_measure": "Per Month", "base_price": None},
-    {"name": "Search Engine Optimization (SEO) Services", "unspsc_code": "80171608", "unspsc_name": "SEO services", "category": "Digital Marketing & Creative Agency Services", "country": "Switzerland", "supplier_name": "Tata Consultancy Services", "unit_of_measure": "Per Month", "base_price": 2500.00},
-    {"name": "Video Production Services – Corporate", "unspsc_code": "82131602", "unspsc_name": "Video production", "category": "Digital Marketing & Creative Agency Services", "country": "Argentina", "supplier_name": "Dentsu International", "unit_of_measure": "Per Day", "base_price": 1500.00},
-    {"name": "Content Marketing Services", "unspsc_code": "80172106", "unspsc_name": "Content development", "category": "Digital Marketing & Creative Agency Services", "country": "Portugal", "supplier_name": "BrightView Landscape PT", "unit_of_measure": "Per Asset", "base_price": 350.00},
-    {"name": "Brand Strategy Consulting Services", "unspsc_code": "80171605", "unspsc_name": "Brand management", "category": "Digital Marketing & Creative Agency Services", "country": "Singapore", "supplier_name": "Honeywell Building Solutions", "unit_of_measure": "Per Day", "base_price": 2000.00},
-    {"name": "Desktop Support Services – Onsite – L1", "unspsc_code": "81112106", "unspsc_name": "Computer hardware support services", "category": "IT & Workplace Technology Services", "country": "Greece", "supplier_name": None, "unit_of_measure": "Per Hour", "base_price": None},
-    {"name": "Desktop Support Services – Remote – L1", "unspsc_code": "81112107", "unspsc_name": "Remote technical support", "category": "IT & Workplace Technology Services", "country": "UAE", "supplier_name": "Infosys Digital Workplace", "unit_of_measure": "Per Hour", "base_price": 45.00},
-    {"name": "Hardware Break/Fix Services – Workspace IT", "unspsc_code": "81112306", "unspsc_name": "Hardware maintenance services", "category": "IT & Workplace Technology Services", "country": "Spain", "supplier_name": "ABM Industries ES", "unit_of_measure": "Per Call", "base_price": 125.00},
-    {"name": "Cloud Migration Assessment Services", "unspsc_code": "81101524", "unspsc_name": "Digital transformation consulting", "category": "IT & Workplace Technology Services", "country": "UK", "supplier_name": "Publicis Media GB", "unit_of_measure": "Per Day", "base_price": 2000.00},
-    {"name": "Cybersecurity Awareness Training Services", "unspsc_code": "86101605", "unspsc_name": "Information security training", "category": "IT & Workplace Technology Services", "country": "Belgium", "supplier_name": "HCLTech Digital", "unit_of_measure": "Per Session", "base_price": 500.00},
-    {"name": "Health & Safety Audit Services – Site Level", "unspsc_code": "81101508", "unspsc_name": "Facility inspection services", "category": "HSE, Quality & Compliance Services", "country": "Bulgaria", "supplier_name": None, "unit_of_measure": "Per Day", "base_price": None},
-    {"name": "Fire Safety Risk Assessment Services", "unspsc_code": "92121702", "unspsc_name": "Fire safety consulting services", "category": "HSE, Quality & Compliance Services", "country": "Germany", "supplier_name": "Ricoh Managed Services DE", "unit_of_measure": "Per Day", "base_price": 800.00},
-    {"name": "ISO 9001 Certification Support Services", "unspsc_code": "81101512", "unspsc_name": "Quality management consulting", "category": "HSE, Quality & Compliance Services", "country": "Finland", "supplier_name": None, "unit_of_measure": "Per Project", "base_price": None},
-    {"name": "ISO 14001 Certification Support Services", "unspsc_code": "81101512", "unspsc_name": "Environmental management consulting", "category": "HSE, Quality & Compliance Services", "country": "Switzerland", "supplier_name": "Bureau Veritas", "unit_of_measure": "Per Project", "base_price": 8500.00},
-    {"name": "Warehouse Labor Services – General", "unspsc_code": "78131601", "unspsc_name": "Warehousing services", "category": "Logistics, Warehouse & Supply Chain Services", "country": "Peru", "supplier_name": None, "unit_of_measure": "Per Hour", "base_price": None},
-    {"name": "Import Customs Clearance Support Services", "unspsc_code": "80111509", "unspsc_name": "Customs support services", "category": "Logistics, Warehouse & Supply Chain Services", "country": "India", "supplier_name": "Genpact Enterprise IT", "unit_of_measure": "Per Hour", "base_price": 75.00},
-    {"name": "Supply Chain Process Mapping Services", "unspsc_code": "81101503", "unspsc_name": "Process mapping services", "category": "Logistics, Warehouse & Supply Chain Services", "country": "Chile", "supplier_name": "WPP Group (GroupM)", "unit_of_measure": "Per Service", "base_price": 3500.00},
-    {"name": "Freight Audit & Pay Services", "unspsc_code": "84111801", "unspsc_name": "Freight audit services", "category": "Logistics, Warehouse & Supply Chain Services", "country": "Romania", "supplier_name": "DHL Supply Chain", "unit_of_measure": "Per Transaction", "base_price": 5.00},
-    {"name": "Legal Document Review Services – Standard", "unspsc_code": "80121602", "unspsc_name": "Legal review services", "category": "Corporate & Business Support Services", "country": "Bulgaria", "supplier_name": None, "unit_of_measure": "Per Hour", "base_price": None},
-    {"name": "Contract Drafting Support Services", "unspsc_code": "80121603", "unspsc_name": "Contract drafting services", "category": "Corporate & Business Support Services", "country": "Ireland", "supplier_name": "SUEZ Recycling & Recovery IE", "unit_of_measure": "Per Hour", "base_price": 150.00},
-    {"name": "Executive Presentation Development Services", "unspsc_code": "82111701", "unspsc_name": "Presentation design services", "category": "Corporate & Business Support Services", "country": "USA", "supplier_name": "Wipro IT Services", "unit_of_measure": "Per Deck", "base_price": 500.00},
-    {"name": "Technical Staff Augmentation Services", "unspsc_code": "80111605", "unspsc_name": "Temporary staffing services", "category": "Temp Labor across Technical Skilled Capabilities", "country": "USA", "supplier_name": "Randstad", "unit_of_measure": "Per Hour", "base_price": 85.00},
-    {"name": "Engineering Staff Augmentation Services", "unspsc_code": "80111605", "unspsc_name": "Temporary staffing services", "category": "Temp Labor across Technical Skilled Capabilities", "country": "Germany", "supplier_name": "Hays", "unit_of_measure": "Per Hour", "base_price": 95.00},
-]
+PUNCHOUT_SYSTEMS = REFERENCE_DATA["punchout_systems"]
+PUNCHOUT_SYSTEMS_RESPONSE = precompress(dumps_with_etag({"systems": PUNCHOUT_SYSTEMS}))
+PUNCHOUT_SYSTEM_BY_NAME = {system["name"]: system for system in PUNCHOUT_SYSTEMS}
+
+# Services data with UNSPSC codes and baked category image URLs
+SERVICES_DATA = build_products(REFERENCE_DATA, "services")
+intern_catalog_strings(SERVICES_DATA)
+
+def new_uuid4() -> str:
+    """Random (version 4) UUID string, formatted straight from os.urandom without a uuid.UUID object"""
+    raw = bytearray(os.urandom(16))
+    raw[6] = raw[6] & 0x0F | 0x40
+    raw[8] = raw[8] & 0x3F | 0x80
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+def new_listing_id() -> str:
+    """32 hex character id for generated search results that are never stored or looked up"""
+    return os.urandom(16).hex()
 
 # Pydantic Models
 class UserLogin(BaseModel):
@@ -1944,14 +677,15 @@ class UserResponse(BaseModel):
     token: str
     role: Optional[str] = None
 
-class DeliveryPartner(BaseModel):
+class DeliveryPartner(NamedTuple):
+    """Generated delivery option; a plain tuple since it is built internally and never validated"""
     partner_id: str
     price: float
     lead_time_days: int
     available_quantity: int
 
 class CartItem(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_uuid4)
     product_id: str
     product_name: str
     brand: str
@@ -1965,6 +699,53 @@ class CartItem(BaseModel):
     image_url: Optional[str] = None
     is_service: bool = False
 
+if MSGSPEC_AVAILABLE:
+    class CartItemStruct(msgspec.Struct, kw_only=True):
+        """CartItem decoded by msgspec; same fields, defaults and model_dump() as the Pydantic model"""
+        id: str = msgspec.field(default_factory=new_uuid4)
+        product_id: str
+        product_name: str
+        brand: str
+        sku: str
+        unspsc_code: str
+        category: str
+        quantity: int
+        unit_price: float
+        total_price: float
+        currency_code: str
+        image_url: Optional[str] = None
+        is_service: bool = False
+
+        def model_dump(self) -> Dict[str, Any]:
+            return msgspec.structs.asdict(self)
+
+# Pydantic validators for bodies decoded by hand (used without msgspec, and for the OpenAPI schema)
+CART_ITEM_ADAPTER = TypeAdapter(CartItem)
+CART_ITEMS_ADAPTER = TypeAdapter(List[CartItem])
+
+def decode_json_body(raw: bytes, adapter: TypeAdapter, struct_type=None):
+    """Decode and validate a JSON request body with msgspec when available, else with Pydantic"""
+    if struct_type is not None:
+        try:
+            return msgspec.json.decode(raw, type=struct_type, strict=False)
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            raise RequestValidationError([{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}])
+    try:
+        return adapter.validate_json(raw)
+    except ValidationError as e:
+        raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)])
+
+def json_body_schema(adapter: TypeAdapter) -> Dict[str, Any]:
+    """openapi_extra documenting the body of a route that decodes it itself"""
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": adapter.json_schema()}}}}
+
+async def cart_item_body(request: Request):
+    return decode_json_body(await request.body(), CART_ITEM_ADAPTER, CartItemStruct if MSGSPEC_AVAILABLE else None)
+
+async def cart_items_body(request: Request):
+    struct_type = List[CartItemStruct] if MSGSPEC_AVAILABLE else None
+    return decode_json_body(await request.body(), CART_ITEMS_ADAPTER, struct_type)
+
 class CartTransfer(BaseModel):
     system: str  # "Coupa", "SAP Ariba", "SAP ERP", "Ivalua", "Oracle"
     cart_items: List[str]  # List of cart item IDs
@@ -1992,131 +773,206 @@ class QuotationResponse(BaseModel):
     action: str  # "accept", "cancel"
     cancel_reason: Optional[str] = None
 
-# InfoCoin Rewards with CDN images
-INFOCOIN_REWARDS = [
-    {"id": "1", "name": "Premium Executive Jacket", "description": "High-quality insulated navy blue jacket with Infosys branding", "coins_required": 5000, "image_url": REWARD_IMAGE_URLS.get("Executive Jacket"), "category": "Apparel"},
-    {"id": "2", "name": "Premium Leather Backpack", "description": "Professional leather laptop backpack for business travel", "coins_required": 4500, "image_url": REWARD_IMAGE_URLS.get("Leather Backpack"), "category": "Accessories"},
-    {"id": "3", "name": "Wireless Bluetooth Earbuds", "description": "Premium wireless earbuds with noise cancellation in charging case", "coins_required": 3500, "image_url": REWARD_IMAGE_URLS.get("Wireless Earbuds"), "category": "Electronics"},
-    {"id": "4", "name": "Stainless Steel Insulated Tumbler", "description": "Double-walled insulated tumbler, keeps drinks hot/cold for 12 hours", "coins_required": 800, "image_url": REWARD_IMAGE_URLS.get("Insulated Tumbler"), "category": "Drinkware"},
-    {"id": "5", "name": "Executive Desk Organizer Set", "description": "Premium desk organizer with pen holder, card holder, and notepad holder", "coins_required": 1500, "image_url": REWARD_IMAGE_URLS.get("Desk Organizer Set"), "category": "Office"},
-    {"id": "6", "name": "Smartwatch Fitness Tracker", "description": "Modern smartwatch with fitness tracking, heart rate monitor, and notifications", "coins_required": 6000, "image_url": REWARD_IMAGE_URLS.get("Smartwatch"), "category": "Electronics"},
-]
+# InfoCoin Rewards with CDN images (URLs baked from REWARD_IMAGE_URLS by bake_catalog.py)
+INFOCOIN_REWARDS = REFERENCE_DATA["infocoin_rewards"]
+INFOCOIN_REWARDS_RESPONSE = precompress(dumps_with_etag({"rewards": INFOCOIN_REWARDS}))
+REWARD_BY_ID = {reward["id"]: reward for reward in INFOCOIN_REWARDS}
 
 # Helper Functions
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# The HS256 header never changes, so its base64url segment is encoded once; tokens match jwt.encode's
+JWT_HEADER_SEGMENT = _b64url(json.dumps({"alg": JWT_ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode())
+JWT_SIGNING_KEY = JWT_SECRET.encode()
+JWT_EXPIRATION_SECONDS = JWT_EXPIRATION_HOURS * 3600
+
 def create_jwt_token(user_id: str, email: str) -> str:
-    expiration = datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
-    payload = {"sub": user_id, "email": email, "exp": expiration}
-    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    payload = {"sub": user_id, "email": email, "exp": int(time.time()) + JWT_EXPIRATION_SECONDS}
+    signing_input = JWT_HEADER_SEGMENT + b"." + _b64url(json.dumps(payload, separators=(",", ":")).encode())
+    # hmac + hashlib.sha256 run in OpenSSL (SHA-NI where the CPU has it)
+    signature = hmac.new(JWT_SIGNING_KEY, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
+# Verified token -> claims. Only successful decodes are cached (exceptions are not), and expiry
+# is re-checked on every hit, so an expired token still fails even while it is cached
+@lru_cache(maxsize=4096)
+def _decode_jwt_cached(token: str) -> Dict:
+    return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
 
 def verify_jwt_token(token: str) -> Dict:
     try:
-        return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = _decode_jwt_cached(token)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    if payload.get("exp") is not None and payload["exp"] <= time.time():
+        raise HTTPException(status_code=401, detail="Token expired")
+    return dict(payload)
+
+# Authenticated user documents by id, reused for a short window instead of a find_one per request
+USER_CACHE_TTL_SECONDS = 30
+USER_CACHE_MAX_ENTRIES = 10000
+_user_cache: Dict[str, tuple] = {}
+# In-flight user lookups, so a burst of requests for a cold user shares one find_one
+_user_fetches: Dict[str, asyncio.Task] = {}
+
+def forget_cached_user(user_id: str) -> None:
+    """Drop a cached user document after the user record changes"""
+    _user_cache.pop(user_id, None)
+    _user_fetches.pop(user_id, None)
+
+def _trim_user_cache() -> None:
+    """Drop expired entries, then the oldest ones, once the cache outgrows USER_CACHE_MAX_ENTRIES"""
+    if len(_user_cache) <= USER_CACHE_MAX_ENTRIES:
+        return
+    now = time.monotonic()
+    for user_id in [uid for uid, (expires, _) in _user_cache.items() if expires <= now]:
+        del _user_cache[user_id]
+    while len(_user_cache) > USER_CACHE_MAX_ENTRIES:
+        del _user_cache[next(iter(_user_cache))]
+
+async def _load_user(user_id: str) -> Optional[Dict]:
+    user = await db.users.find_one({"id": user_id}, {"_id": 0})
+    # Not cached if forget_cached_user ran while this lookup was in flight
+    if user and _user_fetches.get(user_id) is asyncio.current_task():
+        _user_cache[user_id] = (time.monotonic() + USER_CACHE_TTL_SECONDS, user)
+        _trim_user_cache()
+    return user
+
+def _fetch_done(user_id: str, task: asyncio.Task) -> None:
+    if _user_fetches.get(user_id) is task:
+        del _user_fetches[user_id]
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     payload = verify_jwt_token(credentials.credentials)
-    user = await db.users.find_one({"id": payload["sub"]}, {"_id": 0})
+    user_id = payload["sub"]
+    cached = _user_cache.get(user_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return dict(cached[1])
+    task = _user_fetches.get(user_id)
+    if task is None:
+        task = asyncio.ensure_future(_load_user(user_id))
+        _user_fetches[user_id] = task
+        task.add_done_callback(lambda done: _fetch_done(user_id, done))
+    # Shielded so one cancelled request does not cancel the lookup the others are waiting on
+    user = await asyncio.shield(task)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
-    return user
+    return dict(user)
+
+# Product name / spec templates for generated MRO results, keyed by category
+MRO_PRODUCT_TEMPLATES: Dict[str, List[Dict]] = {
+    "Bearings & Power Transmission": [
+        {"name": "Deep Groove Ball Bearing", "specs": {"Inner Diameter": "25mm", "Outer Diameter": "52mm", "Width": "15mm", "Material": "Chrome Steel", "Seal Type": "2RS Rubber Sealed", "Load Rating": "14kN Dynamic"}, "image": _img("SKF Ball Bearing", "Bearings & Power Transmission")},
+        {"name": "Tapered Roller Bearing", "specs": {"Bore Size": "30mm", "Outside Diameter": "62mm", "Width": "17.25mm", "Material": "Chrome Steel", "Cage Type": "Steel", "Dynamic Load": "44kN"}, "image": _img("SKF Ball Bearing", "Bearings & Power Transmission")},
+        {"name": "Industrial Timing Belt", "specs": {"Pitch": "8mm HTD", "Width": "30mm", "Length": "1200mm", "Material": "Neoprene/Fiberglass", "Teeth Count": "150", "Max Speed": "40m/s"}, "image": _img("Gates Timing Belt", "Bearings & Power Transmission")},
+    ],
+    "Electrical & Lighting": [
+        {"name": "Industrial LED High Bay Light", "specs": {"Power": "200W", "Lumens": "26,000lm", "Color Temp": "5000K", "IP Rating": "IP65", "Beam Angle": "120°", "Lifespan": "50,000hrs"}, "image": _img("Philips LED Light", "Electrical & Lighting")},
+        {"name": "Miniature Circuit Breaker", "specs": {"Current Rating": "32A", "Poles": "3P", "Breaking Capacity": "10kA", "Curve Type": "C", "Voltage": "400V AC", "DIN Rail Mount": "Yes"}, "image": _img("Schneider Circuit Breaker", "Electrical & Lighting")},
+        {"name": "Industrial Contactor", "specs": {"Coil Voltage": "24V DC", "Current Rating": "40A", "Contacts": "3NO + 1NC", "Mounting": "DIN Rail", "Duty Cycle": "AC-3", "Mechanical Life": "10M ops"}, "image": _img("Schneider Circuit Breaker", "Electrical & Lighting")},
+    ],
+    "Hand Tools": [
+        {"name": "Professional Ratcheting Wrench Set", "specs": {"Pieces": "12pc SAE/Metric", "Drive Size": "72-Tooth Ratchet", "Material": "Chrome Vanadium", "Finish": "Polished Chrome", "Case": "Blow Mold", "Warranty": "Lifetime"}, "image": _img("Stanley Wrench", "Hand Tools")},
+        {"name": "Precision Screwdriver Set", "specs": {"Pieces": "32pc", "Tip Types": "Phillips/Slotted/Torx/Hex", "Handle": "Ergonomic Cushion Grip", "Blade": "Hardened Steel", "Case": "Rotating Stand", "Magnetic Tips": "Yes"}, "image": _img("Stanley Wrench", "Hand Tools")},
+    ],
+    "Power Tools": [
+        {"name": "18V Brushless Cordless Drill/Driver Kit", "specs": {"Voltage": "18V/20V MAX", "Chuck": "1/2\" Metal Ratcheting", "Speed": "0-2000 RPM", "Torque": "620 in-lbs", "Battery": "5.0Ah Li-Ion (2x)", "LED Light": "3-Mode"}, "image": _img("Bosch Drill", "Power Tools")},
+        {"name": "Industrial Angle Grinder", "specs": {"Disc Size": "125mm (5\")", "Power": "1400W", "No Load Speed": "11,500 RPM", "Spindle Thread": "M14", "Guard": "Adjustable", "Soft Start": "Yes"}, "image": _img("Bosch Drill", "Power Tools")},
+    ],
+    "Safety & PPE": [
+        {"name": "Premium Safety Helmet", "specs": {"Standard": "EN397/ANSI Z89.1", "Material": "ABS Shell", "Suspension": "6-Point Ratchet", "Ventilation": "4-Point Vented", "Accessory Slots": "Yes", "UV Resistant": "Yes"}, "image": _img("3M Safety Helmet", "Safety & PPE")},
+        {"name": "Impact-Resistant Safety Glasses", "specs": {"Standard": "EN166/ANSI Z87.1+", "Lens": "Polycarbonate Anti-Scratch", "Coating": "Anti-Fog", "UV Protection": "99.9%", "Frame": "Wraparound", "Weight": "28g"}, "image": _img("3M Safety Glasses", "Safety & PPE")},
+    ],
+    "IT Equipment - Laptops": [
+        {"name": "ProBook Business Laptop", "specs": {"Processor": "Intel Core i7-1355U", "Memory": "16GB DDR4", "Storage": "512GB NVMe SSD", "Display": "15.6\" FHD IPS", "OS": "Windows 11 Pro", "Battery": "Up to 10hrs"}, "image": _img("HP Laptop", "IT Equipment - Laptops")},
+        {"name": "Elite Ultrabook", "specs": {"Processor": "Intel Core i7-1365U vPro", "Memory": "32GB DDR5", "Storage": "1TB NVMe Gen4", "Display": "14\" 2.8K OLED", "OS": "Windows 11 Pro", "Weight": "1.12kg"}, "image": _img("HP Laptop", "IT Equipment - Laptops")},
+    ],
+    "IT Equipment - Monitors": [
+        {"name": "Professional 4K USB-C Monitor", "specs": {"Screen Size": "27\"", "Resolution": "3840x2160", "Panel": "IPS", "Refresh": "60Hz", "Ports": "USB-C 90W, HDMI, DP", "Ergonomics": "HAS"}, "image": _img("Dell Monitor", "IT Equipment - Monitors")},
+        {"name": "Ultrawide Curved Monitor", "specs": {"Screen Size": "34\"", "Resolution": "3440x1440", "Panel": "VA 1500R", "Refresh": "100Hz", "HDR": "HDR10", "Built-in KVM": "Yes"}, "image": _img("Dell Monitor", "IT Equipment - Monitors")},
+    ],
+    "IT Equipment - Networking": [
+        {"name": "Enterprise Managed Switch", "specs": {"Ports": "48x GbE PoE+", "Uplinks": "4x 10G SFP+", "PoE Budget": "740W", "Switching": "176Gbps", "Management": "CLI/Web/SNMP", "Stackable": "Yes"}, "image": _img("Cisco Switch", "IT Equipment - Networking")},
+        {"name": "Enterprise Wireless Access Point", "specs": {"Standard": "Wi-Fi 6E", "Speed": "Up to 5.4Gbps", "Bands": "Tri-Band", "Clients": "500+", "PoE": "802.3at", "MIMO": "4x4:4"}, "image": _img("Cisco Switch", "IT Equipment - Networking")},
+    ],
+    "Adhesives & Sealants": [
+        {"name": "Industrial Adhesive Set", "specs": {"Type": "Multi-purpose", "Bond Strength": "High", "Cure Time": "24hrs", "Temperature Range": "-40°C to 120°C", "Volume": "50ml each"}, "image": _img("Henkel Adhesive", "Adhesives & Sealants")},
+    ],
+}
+
+# Short views sent by the category endpoints and with search results; built once, never mutated
+PRODUCT_CATEGORY_VIEW = [{"name": c["name"], "unspsc": c["unspsc"], "icon": c["icon"]} for c in MRO_CATEGORIES]
+SERVICE_CATEGORY_VIEW = [{"name": c["name"], "unspsc": c["unspsc"], "icon": c["icon"]} for c in SERVICE_CATEGORIES]
+PRODUCT_BRAND_VIEW = [{"name": b["name"], "logo": b["logo"]} for b in MRO_BRANDS]
+
+# Name -> UNSPSC code / brand entry, so lookups hash instead of scanning the lists
+UNSPSC_BY_CATEGORY = {cat["name"]: cat["unspsc"] for cat in MRO_CATEGORIES}
+BRAND_BY_NAME = {brand["name"]: brand for brand in MRO_BRANDS}
+MRO_BRAND_NAMES = list(BRAND_BY_NAME)
+MRO_CATEGORY_NAMES = list(UNSPSC_BY_CATEGORY)
+# Brand list sent with every product search response
+SEARCH_BRANDS = [{"name": b["name"], "logo": b.get("logo"), "color": b.get("color")} for b in MRO_BRANDS]
+# (lowercased, original) names for the substring match that picks generated results
+MRO_CATEGORY_NAMES_LOWER = [(name.lower(), name) for name in MRO_CATEGORY_NAMES]
+MRO_BRAND_NAMES_LOWER = [(name.lower(), name) for name in MRO_BRAND_NAMES]
+
+
+def _matching_names(names_lower: List[Tuple[str, str]], search_term: str, selected: Optional[str]) -> Tuple[str, ...]:
+    if search_term:
+        names = [name for lower, name in names_lower if search_term in lower]
+    else:
+        names = [name for _, name in names_lower[:10]]
+    if selected and selected != "all":
+        wanted = selected.lower()
+        names = [name for name in names if name.lower() == wanted] or [selected]
+    return tuple(names)
+
+
+@lru_cache(maxsize=1024)
+def generator_names(search_term: str, category: Optional[str], brand: Optional[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Categories and brands generated search results are drawn from, memoized per (term, category, brand)"""
+    return (
+        _matching_names(MRO_CATEGORY_NAMES_LOWER, search_term, category),
+        _matching_names(MRO_BRAND_NAMES_LOWER, search_term, brand),
+    )
 
 def generate_unspsc_code(category_name: str) -> str:
     """Get UNSPSC code for a category"""
-    for cat in MRO_CATEGORIES:
-        if cat["name"] == category_name:
-            return cat["unspsc"]
-    return "31000000"  # Default MRO code
+    return UNSPSC_BY_CATEGORY.get(category_name, "31000000")  # Default MRO code
+
+# Shared read-only info for brands outside MRO_BRANDS; callers only read logo / color
+DEFAULT_BRAND_INFO = MappingProxyType({"logo": None, "color": "#007CC3"})
 
-def get_brand_info(brand_name: str) -> Dict:
+def get_brand_info(brand_name: str) -> Mapping:
     """Get brand info with color"""
-    for brand in MRO_BRANDS:
-        if brand["name"] == brand_name:
-            return brand
-    return {"name": brand_name, "logo": None, "color": "#007CC3"}
+    return BRAND_BY_NAME.get(brand_name, DEFAULT_BRAND_INFO)
+
+# Generated product price ranges (USD) by category, and the value pools drawn from per product
+PRODUCT_PRICE_RANGES = {
+    "IT Equipment - Laptops": (800, 3500),
+    "IT Equipment - Monitors": (300, 1500),
+    "IT Equipment - Networking": (500, 5000),
+    "IT Equipment - Servers": (2000, 15000),
+    "Power Tools": (100, 800),
+    "Safety & PPE": (15, 150),
+}
+DEFAULT_PRICE_RANGE = (25, 500)
+DEFAULT_PRODUCT_TEMPLATES = [
+    {"name": "Industrial Component", "specs": {"Type": "Standard", "Grade": "Industrial", "Material": "High-Quality", "Certification": "ISO 9001"}}
+]
+PRODUCT_WAREHOUSES = ["US-East", "US-West", "US-Central", "EU-West", "APAC-SG"]
+PRODUCT_SHIPS_FROM = ["Manufacturer", "Distribution Center", "Local Warehouse"]
+PRODUCT_UNITS = ["EA", "PK", "BX", "SET"]
+PRODUCT_RNG = np.random.default_rng()
 
-def generate_product_data(index: int, category: str, brand: str) -> Dict:
-    """Generate realistic product data with UNSPSC and detailed specifications"""
-    # Enhanced product names with specifications - all images from Emergent CDN
-    product_catalog = {
-        "Bearings & Power Transmission": [
-            {"name": "Deep Groove Ball Bearing", "specs": {"Inner Diameter": "25mm", "Outer Diameter": "52mm", "Width": "15mm", "Material": "Chrome Steel", "Seal Type": "2RS Rubber Sealed", "Load Rating": "14kN Dynamic"}, "image": PRODUCT_IMAGE_URLS.get("SKF Ball Bearing", PRODUCT_IMAGE_URLS.get("Bearings & Power Transmission"))},
-            {"name": "Tapered Roller Bearing", "specs": {"Bore Size": "30mm", "Outside Diameter": "62mm", "Width": "17.25mm", "Material": "Chrome Steel", "Cage Type": "Steel", "Dynamic Load": "44kN"}, "image": PRODUCT_IMAGE_URLS.get("SKF Ball Bearing", PRODUCT_IMAGE_URLS.get("Bearings & Power Transmission"))},
-            {"name": "Industrial Timing Belt", "specs": {"Pitch": "8mm HTD", "Width": "30mm", "Length": "1200mm", "Material": "Neoprene/Fiberglass", "Teeth Count": "150", "Max Speed": "40m/s"}, "image": PRODUCT_IMAGE_URLS.get("Gates Timing Belt", PRODUCT_IMAGE_URLS.get("Bearings & Power Transmission"))},
-        ],
-        "Electrical & Lighting": [
-            {"name": "Industrial LED High Bay Light", "specs": {"Power": "200W", "Lumens": "26,000lm", "Color Temp": "5000K", "IP Rating": "IP65", "Beam Angle": "120°", "Lifespan": "50,000hrs"}, "image": PRODUCT_IMAGE_URLS.get("Philips LED Light", PRODUCT_IMAGE_URLS.get("Electrical & Lighting"))},
-            {"name": "Miniature Circuit Breaker", "specs": {"Current Rating": "32A", "Poles": "3P", "Breaking Capacity": "10kA", "Curve Type": "C", "Voltage": "400V AC", "DIN Rail Mount": "Yes"}, "image": PRODUCT_IMAGE_URLS.get("Schneider Circuit Breaker", PRODUCT_IMAGE_URLS.get("Electrical & Lighting"))},
-            {"name": "Industrial Contactor", "specs": {"Coil Voltage": "24V DC", "Current Rating": "40A", "Contacts": "3NO + 1NC", "Mounting": "DIN Rail", "Duty Cycle": "AC-3", "Mechanical Life": "10M ops"}, "image": PRODUCT_IMAGE_URLS.get("Schneider Circuit Breaker", PRODUCT_IMAGE_URLS.get("Electrical & Lighting"))},
-        ],
-        "Hand Tools": [
-            {"name": "Professional Ratcheting Wrench Set", "specs": {"Pieces": "12pc SAE/Metric", "Drive Size": "72-Tooth Ratchet", "Material": "Chrome Vanadium", "Finish": "Polished Chrome", "Case": "Blow Mold", "Warranty": "Lifetime"}, "image": PRODUCT_IMAGE_URLS.get("Stanley Wrench", PRODUCT_IMAGE_URLS.get("Hand Tools"))},
-            {"name": "Precision Screwdriver Set", "specs": {"Pieces": "32pc", "Tip Types": "Phillips/Slotted/Torx/Hex", "Handle": "Ergonomic Cushion Grip", "Blade": "Hardened Steel", "Case": "Rotating Stand", "Magnetic Tips": "Yes"}, "image": PRODUCT_IMAGE_URLS.get("Stanley Wrench", PRODUCT_IMAGE_URLS.get("Hand Tools"))},
-        ],
-        "Power Tools": [
-            {"name": "18V Brushless Cordless Drill/Driver Kit", "specs": {"Voltage": "18V/20V MAX", "Chuck": "1/2\" Metal Ratcheting", "Speed": "0-2000 RPM", "Torque": "620 in-lbs", "Battery": "5.0Ah Li-Ion (2x)", "LED Light": "3-Mode"}, "image": PRODUCT_IMAGE_URLS.get("Bosch Drill", PRODUCT_IMAGE_URLS.get("Power Tools"))},
-            {"name": "Industrial Angle Grinder", "specs": {"Disc Size": "125mm (5\")", "Power": "1400W", "No Load Speed": "11,500 RPM", "Spindle Thread": "M14", "Guard": "Adjustable", "Soft Start": "Yes"}, "image": PRODUCT_IMAGE_URLS.get("Bosch Drill", PRODUCT_IMAGE_URLS.get("Power Tools"))},
-        ],
-        "Safety & PPE": [
-            {"name": "Premium Safety Helmet", "specs": {"Standard": "EN397/ANSI Z89.1", "Material": "ABS Shell", "Suspension": "6-Point Ratchet", "Ventilation": "4-Point Vented", "Accessory Slots": "Yes", "UV Resistant": "Yes"}, "image": PRODUCT_IMAGE_URLS.get("3M Safety Helmet", PRODUCT_IMAGE_URLS.get("Safety & PPE"))},
-            {"name": "Impact-Resistant Safety Glasses", "specs": {"Standard": "EN166/ANSI Z87.1+", "Lens": "Polycarbonate Anti-Scratch", "Coating": "Anti-Fog", "UV Protection": "99.9%", "Frame": "Wraparound", "Weight": "28g"}, "image": PRODUCT_IMAGE_URLS.get("3M Safety Glasses", PRODUCT_IMAGE_URLS.get("Safety & PPE"))},
-        ],
-        "IT Equipment - Laptops": [
-            {"name": "ProBook Business Laptop", "specs": {"Processor": "Intel Core i7-1355U", "Memory": "16GB DDR4", "Storage": "512GB NVMe SSD", "Display": "15.6\" FHD IPS", "OS": "Windows 11 Pro", "Battery": "Up to 10hrs"}, "image": PRODUCT_IMAGE_URLS.get("HP Laptop", PRODUCT_IMAGE_URLS.get("IT Equipment - Laptops"))},
-            {"name": "Elite Ultrabook", "specs": {"Processor": "Intel Core i7-1365U vPro", "Memory": "32GB DDR5", "Storage": "1TB NVMe Gen4", "Display": "14\" 2.8K OLED", "OS": "Windows 11 Pro", "Weight": "1.12kg"}, "image": PRODUCT_IMAGE_URLS.get("HP Laptop", PRODUCT_IMAGE_URLS.get("IT Equipment - Laptops"))},
-        ],
-        "IT Equipment - Monitors": [
-            {"name": "Professional 4K USB-C Monitor", "specs": {"Screen Size": "27\"", "Resolution": "3840x2160", "Panel": "IPS", "Refresh": "60Hz", "Ports": "USB-C 90W, HDMI, DP", "Ergonomics": "HAS"}, "image": PRODUCT_IMAGE_URLS.get("Dell Monitor", PRODUCT_IMAGE_URLS.get("IT Equipment - Monitors"))},
-            {"name": "Ultrawide Curved Monitor", "specs": {"Screen Size": "34\"", "Resolution": "3440x1440", "Panel": "VA 1500R", "Refresh": "100Hz", "HDR": "HDR10", "Built-in KVM": "Yes"}, "image": PRODUCT_IMAGE_URLS.get("Dell Monitor", PRODUCT_IMAGE_URLS.get("IT Equipment - Monitors"))},
-        ],
-        "IT Equipment - Networking": [
-            {"name": "Enterprise Managed Switch", "specs": {"Ports": "48x GbE PoE+", "Uplinks": "4x 10G SFP+", "PoE Budget": "740W", "Switching": "176Gbps", "Management": "CLI/Web/SNMP", "Stackable": "Yes"}, "image": PRODUCT_IMAGE_URLS.get("Cisco Switch", PRODUCT_IMAGE_URLS.get("IT Equipment - Networking"))},
-            {"name": "Enterprise Wireless Access Point", "specs": {"Standard": "Wi-Fi 6E", "Speed": "Up to 5.4Gbps", "Bands": "Tri-Band", "Clients": "500+", "PoE": "802.3at", "MIMO": "4x4:4"}, "image": PRODUCT_IMAGE_URLS.get("Cisco Switch", PRODUCT_IMAGE_URLS.get("IT Equipment - Networking"))},
-        ],
-        "Adhesives & Sealants": [
-            {"name": "Industrial Adhesive Set", "specs": {"Type": "Multi-purpose", "Bond Strength": "High", "Cure Time": "24hrs", "Temperature Range": "-40°C to 120°C", "Volume": "50ml each"}, "image": PRODUCT_IMAGE_URLS.get("Henkel Adhesive", PRODUCT_IMAGE_URLS.get("Adhesives & Sealants"))},
-        ],
-    }
-    
-    # Get product details or use defaults
-    products = product_catalog.get(category, [
-        {"name": "Industrial Component", "specs": {"Type": "Standard", "Grade": "Industrial", "Material": "High-Quality", "Certification": "ISO 9001"}}
-    ])
-    
-    product = products[index % len(products)]
-    unspsc = generate_unspsc_code(category)
-    brand_info = get_brand_info(brand)
-    
-    # Get image URL from CDN
-    image_url = PRODUCT_IMAGE_URLS.get(category, DEFAULT_PRODUCT_IMAGE)
-    
-    # Generate price based on category
-    price_ranges = {
-        "IT Equipment - Laptops": (800, 3500),
-        "IT Equipment - Monitors": (300, 1500),
-        "IT Equipment - Networking": (500, 5000),
-        "IT Equipment - Servers": (2000, 15000),
-        "Power Tools": (100, 800),
-        "Safety & PPE": (15, 150),
-    }
-    price_range = price_ranges.get(category, (25, 500))
-    base_price = round(random.uniform(*price_range), 2)
-    
-    # 10% chance of being sponsored
-    is_sponsored = random.random() < 0.10
-    
-    # Generate availability info
-    availability = {
-        "in_stock": random.random() > 0.1,
-        "quantity": random.randint(5, 500),
-        "warehouse": random.choice(["US-East", "US-West", "US-Central", "EU-West", "APAC-SG"]),
-        "ships_from": random.choice(["Manufacturer", "Distribution Center", "Local Warehouse"]),
-        "estimated_delivery": f"{random.randint(1, 5)}-{random.randint(6, 10)} business days"
-    }
-    
-    # Create descriptive product name and description based on category
+
+@lru_cache(maxsize=4096)
+def _product_text(category: str, brand: str, template_index: int) -> Tuple[Dict, str, str, str]:
+    """(template, name, short description, full description) of a generated product; fixed per combination"""
+    product = MRO_PRODUCT_TEMPLATES.get(category, DEFAULT_PRODUCT_TEMPLATES)[template_index]
     product_name = product['name']
     
     # Generate accurate short description based on product specifications
@@ -2128,10 +984,18 @@ def generate_product_data(index: int, category: str, brand: str) -> Dict:
     if product.get("specs"):
         full_desc += f"Key specifications include: {specs_text}. "
     full_desc += f"Built with premium materials and backed by {brand}'s reputation for quality. Meets international standards for safety and performance."
-    
+    return product, f"{brand} {product_name}", short_desc, full_desc
+
+
+def _product_record(index: int, category: str, brand: str, unspsc_code: str, image_url: str, brand_info: Mapping,
+                    base_price: float, availability: Dict, unit: str, rating: float, reviews_count: int,
+                    is_sponsored: bool) -> Dict:
+    # Reduce the slot to its template so the text cache is keyed on distinct outputs only
+    templates = MRO_PRODUCT_TEMPLATES.get(category, DEFAULT_PRODUCT_TEMPLATES)
+    product, name, short_desc, full_desc = _product_text(category, brand, index % len(templates))
     return {
-        "id": str(uuid.uuid4()),
-        "name": f"{brand} {product_name}",
+        "id": new_listing_id(),
+        "name": name,
         "short_description": short_desc,
         "full_description": full_desc,
         "category": category,
@@ -2139,15 +1003,15 @@ def generate_product_data(index: int, category: str, brand: str) -> Dict:
         "brand_logo": brand_info.get("logo"),
         "brand_color": brand_info.get("color", "#007CC3"),
         "sku": f"{brand[:3].upper()}-{category[:3].upper()}-{index:06d}",
-        "unspsc_code": unspsc,
+        "unspsc_code": unspsc_code,
         "unspsc_name": category,
         "base_price": base_price,
-        "unit": random.choice(["EA", "PK", "BX", "SET"]),
+        "unit": unit,
         "image_url": image_url,
         "specifications": product.get("specs", {}),
         "availability": availability,
-        "rating": round(random.uniform(4.0, 5.0), 1),
-        "reviews_count": random.randint(10, 500),
+        "rating": rating,
+        "reviews_count": reviews_count,
         "spec_document_url": "https://example.com/specs/document.pdf",
         "is_sponsored": is_sponsored,
         "features": [
@@ -2158,67 +1022,141 @@ def generate_product_data(index: int, category: str, brand: str) -> Dict:
         ]
     }
 
-def generate_delivery_partners(base_price: float, count: int) -> List[DeliveryPartner]:
-    """Generate delivery partners with price/lead time inverse relationship"""
-    partners = []
-    for i in range(count):
-        price_multiplier = 1.0 + (0.1 * (count - i - 1))
-        lead_time = 10 - (i * 3)
-        if lead_time < 1:
-            lead_time = 1
-        partners.append(DeliveryPartner(
-            partner_id=f"DP-{uuid.uuid4().hex[:8]}",
-            price=round(base_price * price_multiplier, 2),
-            lead_time_days=lead_time,
-            available_quantity=random.randint(16, 2098)
+def generate_product_data(index: int, category: str, brand: str) -> Dict:
+    """Generate realistic product data with UNSPSC and detailed specifications"""
+    base_price = round(random.uniform(*PRODUCT_PRICE_RANGES.get(category, DEFAULT_PRICE_RANGE)), 2)
+    
+    # 10% chance of being sponsored
+    is_sponsored = random.random() < 0.10
+    
+    # Generate availability info
+    availability = {
+        "in_stock": random.random() > 0.1,
+        "quantity": random.randint(5, 500),
+        "warehouse": random.choice(PRODUCT_WAREHOUSES),
+        "ships_from": random.choice(PRODUCT_SHIPS_FROM),
+        "estimated_delivery": f"{random.randint(1, 5)}-{random.randint(6, 10)} business days"
+    }
+    return _product_record(
+        index, category, brand, generate_unspsc_code(category), CATEGORY_IMAGE_URL.get(category, DEFAULT_PRODUCT_IMAGE),
+        get_brand_info(brand), base_price, availability, random.choice(PRODUCT_UNITS),
+        round(random.uniform(4.0, 5.0), 1), random.randint(10, 500), is_sponsored,
+    )
+
+def generate_product_batch(start_index: int, categories: List[str], brands: List[str], count: int) -> List[Dict]:
+    """Generate count products over random (category, brand) picks, drawing every numeric column at once"""
+    rng = PRODUCT_RNG
+    category_ids = rng.integers(len(categories), size=count)
+    brand_ids = rng.integers(len(brands), size=count)
+    price_ranges = np.array([PRODUCT_PRICE_RANGES.get(c, DEFAULT_PRICE_RANGE) for c in categories], dtype=np.float64)
+    low, high = price_ranges[category_ids, 0], price_ranges[category_ids, 1]
+    base_prices = np.round(low + rng.random(count) * (high - low), 2).tolist()
+    is_sponsored = (rng.random(count) < 0.10).tolist()
+    in_stock = (rng.random(count) > 0.1).tolist()
+    quantities = rng.integers(5, 501, size=count).tolist()
+    warehouses = rng.integers(len(PRODUCT_WAREHOUSES), size=count).tolist()
+    ships_from = rng.integers(len(PRODUCT_SHIPS_FROM), size=count).tolist()
+    delivery_min = rng.integers(1, 6, size=count).tolist()
+    delivery_max = rng.integers(6, 11, size=count).tolist()
+    units = rng.integers(len(PRODUCT_UNITS), size=count).tolist()
+    ratings = np.round(rng.uniform(4.0, 5.0, size=count), 1).tolist()
+    reviews = rng.integers(10, 501, size=count).tolist()
+    # Per-id lookups resolved once, so rows index lists instead of hashing names again
+    unspsc_of = [generate_unspsc_code(c) for c in categories]
+    image_of = [CATEGORY_IMAGE_URL.get(c, DEFAULT_PRODUCT_IMAGE) for c in categories]
+    brand_info_of = [get_brand_info(b) for b in brands]
+    
+    products = []
+    for i, (category_id, brand_id) in enumerate(zip(category_ids.tolist(), brand_ids.tolist())):
+        availability = {
+            "in_stock": in_stock[i],
+            "quantity": quantities[i],
+            "warehouse": PRODUCT_WAREHOUSES[warehouses[i]],
+            "ships_from": PRODUCT_SHIPS_FROM[ships_from[i]],
+            "estimated_delivery": f"{delivery_min[i]}-{delivery_max[i]} business days"
+        }
+        products.append(_product_record(
+            start_index + i, categories[category_id], brands[brand_id], unspsc_of[category_id],
+            image_of[category_id], brand_info_of[brand_id], base_prices[i], availability,
+            PRODUCT_UNITS[units[i]], ratings[i], reviews[i], is_sponsored[i],
         ))
-    return partners
+    return products
+
+@lru_cache(maxsize=16)
+def delivery_partner_tiers(count: int) -> Tuple[Tuple[float, int], ...]:
+    """(price multiplier, lead time) per partner: the cheapest partner is the slowest"""
+    multipliers = 1.0 + 0.1 * (count - 1 - np.arange(count))
+    lead_times = np.maximum(10 - 3 * np.arange(count), 1)
+    return tuple(zip(multipliers.tolist(), lead_times.tolist()))
+
+def generate_delivery_partners(base_price: float, count: int,
+                               quantities: Optional[List[int]] = None) -> List[DeliveryPartner]:
+    """Generate delivery partners with price/lead time inverse relationship (quantities may be pre-drawn)"""
+    if quantities is None:
+        quantities = PRODUCT_RNG.integers(16, 2099, count).tolist()
+    return [
+        DeliveryPartner(f"DP-{os.urandom(4).hex()}", round(base_price * multiplier, 2), lead_time, quantity)
+        for (multiplier, lead_time), quantity in zip(delivery_partner_tiers(count), quantities)
+    ]
 
-def get_alternate_products(product: Dict, brand: str) -> List[Dict]:
-    """Generate alternate product suggestions"""
-    alt_brands = [b["name"] for b in MRO_BRANDS if b["name"] != brand]
+@lru_cache(maxsize=256)
+def alternate_brands(brand: str) -> Tuple[str, ...]:
+    """MRO brand names other than brand, to sample alternates from"""
+    return tuple(name for name in MRO_BRAND_NAMES if name != brand)
+
+def get_alternate_products(product: Dict, brand: str, price_factors: Optional[List[float]] = None,
+                           lead_times: Optional[List[int]] = None) -> List[Dict]:
+    """Generate alternate product suggestions (price factors and lead times may be pre-drawn)"""
+    alt_brands = alternate_brands(brand)
+    picks = random.sample(alt_brands, min(2, len(alt_brands)))
+    if price_factors is None:
+        price_factors = PRODUCT_RNG.uniform(0.7, 0.95, len(picks)).tolist()
+    if lead_times is None:
+        lead_times = PRODUCT_RNG.integers(7, 16, len(picks)).tolist()
     alternates = []
-    for alt_brand in random.sample(alt_brands, min(2, len(alt_brands))):
-        brand_info = get_brand_info(alt_brand)
+    for alt_brand, price_factor, lead_time in zip(picks, price_factors, lead_times):
         alternates.append({
-            "id": str(uuid.uuid4()),
+            "id": new_listing_id(),
             "name": product["name"].replace(brand, alt_brand),
             "brand": alt_brand,
-            "brand_logo": brand_info.get("logo"),
-            "price": round(product["base_price"] * random.uniform(0.7, 0.95), 2),
-            "lead_time_days": random.randint(7, 15)
+            "brand_logo": get_brand_info(alt_brand).get("logo"),
+            "price": round(product["base_price"] * price_factor, 2),
+            "lead_time_days": lead_time
         })
     return alternates
 
 # Auth Routes
+# Only the user fields the login response reads are decoded from the returned document
+LOGIN_USER_PROJECTION = {"_id": 0, "id": 1, "email": 1, "name": 1, "info_coins": 1, "role": 1}
+
 @api_router.post("/auth/login", response_model=UserResponse)
 async def login(user_data: UserLogin):
     if not user_data.email or not user_data.password:
         raise HTTPException(status_code=400, detail="Email and password required")
     
-    existing_user = await db.users.find_one({"email": user_data.email}, {"_id": 0})
-    
-    if existing_user:
-        if existing_user.get("country") != user_data.country:
-            await db.users.update_one({"email": user_data.email}, {"$set": {"country": user_data.country}})
-            existing_user["country"] = user_data.country
-        user = existing_user
-    else:
-        user_id = str(uuid.uuid4())
-        user = {
-            "id": user_id,
-            "email": user_data.email,
-            "name": user_data.email.split("@")[0].title(),
-            "country": user_data.country,
-            "info_coins": 2500,
-            "created_at": datetime.now(timezone.utc).isoformat()
-        }
-        await db.users.insert_one(user)
+    # One round trip: update the country of an existing user, or create the user with defaults
+    user = await db.users.find_one_and_update(
+        {"email": user_data.email},
+        {
+            "$set": {"country": user_data.country},
+            "$setOnInsert": {
+                "id": str(uuid.uuid4()),
+                "name": user_data.email.split("@")[0].title(),
+                "info_coins": 2500,
+                "created_at": datetime.now(timezone.utc).isoformat()
+            }
+        },
+        projection=LOGIN_USER_PROJECTION,
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    forget_cached_user(user["id"])
     
     currency = COUNTRY_CURRENCIES.get(user_data.country, COUNTRY_CURRENCIES["USA"])
     token = create_jwt_token(user["id"], user["email"])
     
-    return UserResponse(
+    # Built from our own user record and token, so field validation is skipped
+    return UserResponse.model_construct(
         id=user["id"], email=user["email"], name=user["name"],
         country=user_data.country, currency=currency,
         info_coins=user.get("info_coins", 0), token=token,
@@ -2231,6 +1169,54 @@ async def get_me(current_user: dict = Depends(get_current_user)):
     return {**current_user, "currency": currency}
 
 # Product Routes
+# Advertised result counts of the (open-ended, generated) product and service searches
+PRODUCT_SEARCH_TOTAL = 3000000
+SERVICE_SEARCH_TOTAL = 100000
+# Generated fill-in slots: 70% with delivery partners, 20% quotation only, 10% dropped;
+# searchsorted of a uniform draw against the cumulative thresholds gives the outcome
+FILL_OUTCOME_THRESHOLDS = np.array([0.70, 0.90])
+FILL_OUTCOME_WITH_PARTNER, FILL_OUTCOME_QUOTATION, FILL_OUTCOME_DROPPED = range(3)
+
+def _catalog_search_base(product: CatalogRow) -> Dict:
+    """Search result fields of a catalog row that depend on neither currency nor request"""
+    brand_info = get_brand_info(product.brand)
+    return {
+        "id": product.id,
+        "name": product.name,
+        "short_description": product.short_description or "",
+        "full_description": product.full_description or "",
+        "category": product.category,
+        "brand": product.brand or "",
+        "brand_logo": brand_info.get("logo"),
+        "brand_color": brand_info.get("color", "#007CC3"),
+        "sku": product.sku,
+        "unspsc_code": product.unspsc_code,
+        "unspsc_name": product.category or "",
+        # Placeholders keep the key order; filled in per request
+        "price": None,
+        "currency_code": None,
+        "currency_symbol": None,
+        "unit": "EA",
+        "image_url": product.image_url,
+        "specifications": spec_dict(product),
+        "availability": product.availability or {"in_stock": True, "quantity": random.randint(10, 500)},
+        "rating": product.rating if product.rating is not None else round(random.uniform(4.0, 5.0), 1),
+        "reviews_count": product.reviews_count if product.reviews_count is not None else random.randint(10, 500),
+        "features": [],
+        "spec_document_url": f"https://docs.omnisupply.io/specs/{product.id}.pdf",
+        "lead_time_days": None,
+        "delivery_partners": None,
+        "has_delivery_partner": True,
+        "alternate_products": [],
+        "result_type": "with_partner",
+        "is_sponsored": None
+    }
+
+@lru_cache(maxsize=1)
+def catalog_search_bases(catalog_index) -> List[Dict]:
+    """Per-row search result skeletons, built once per catalog index (shared; copied per result)"""
+    return [_catalog_search_base(row) for row in catalog_index.rows]
+
 @api_router.get("/products/search")
 async def search_products(
     q: str = Query("", description="Search query"),
@@ -2242,124 +1228,83 @@ async def search_products(
     current_user: dict = Depends(get_current_user)
 ):
     currency = COUNTRY_CURRENCIES.get(current_user.get("country", "USA"), COUNTRY_CURRENCIES["USA"])
+    rate, currency_code, currency_symbol = currency["rate"], currency["code"], currency["symbol"]
     results = []
     
     search_term = q.lower()
     
-    # First, add real catalog products - interleave for variety (industrial + IT mixed)
-    # Combine and shuffle for diverse display when no search term
-    all_catalog_products = []
-    it_products = list(IT_PRODUCTS_CATALOG)
-    vendor_products = list(NEW_VENDOR_PRODUCTS)
-    
-    # Interleave products: 1 industrial, 1 IT, 1 industrial, etc. for better variety
-    max_len = max(len(vendor_products), len(it_products))
-    for i in range(max_len):
-        if i < len(vendor_products):
-            all_catalog_products.append(vendor_products[i])
-        if i < len(it_products):
-            all_catalog_products.append(it_products[i])
-    
-    # Filter catalog products based on search, category, and brand
-    filtered_catalog = []
-    for product in all_catalog_products:
-        # Search filter
-        if search_term:
-            name_match = search_term in product["name"].lower()
-            brand_match = search_term in product.get("brand", "").lower()
-            category_match = search_term in product.get("category", "").lower()
-            desc_match = search_term in product.get("short_description", "").lower() or search_term in product.get("full_description", "").lower()
-            if not (name_match or brand_match or category_match or desc_match):
-                continue
-        
-        # Category filter
-        if category and category != "all" and product.get("category", "").lower() != category.lower():
-            continue
-        
-        # Brand filter
-        if brand and brand != "all" and product.get("brand", "").lower() != brand.lower():
-            continue
-        
-        filtered_catalog.append(product)
-    
-    # Add filtered catalog products to results
-    for product in filtered_catalog:
-        brand_info = next((b for b in MRO_BRANDS if b["name"] == product.get("brand")), {})
-        base_price = product.get("base_price", 100)
-        
+    # First, add real catalog products - interleaved for variety (industrial + IT mixed),
+    # filtered through the precomputed catalog indexes
+    catalog_index = get_product_index()
+    catalog_rows = catalog_index.search_rows(search_term, category, brand)[:limit]
+    search_bases = catalog_search_bases(catalog_index)
+    
+    # Add filtered catalog products to results: the row's prebuilt skeleton plus the
+    # currency and per-request random fields (drawn for all rows at once)
+    count = len(catalog_rows)
+    lead_times = PRODUCT_RNG.integers(2, 8, size=count).tolist()
+    partner_lead_times = PRODUCT_RNG.integers(2, 6, size=count).tolist()
+    partner_quantities = PRODUCT_RNG.integers(50, 501, size=count).tolist()
+    sponsored = (PRODUCT_RNG.random(count) < 0.1).tolist()
+    for row, lead_time, partner_lead_time, partner_quantity, is_sponsored in zip(
+        catalog_rows, lead_times, partner_lead_times, partner_quantities, sponsored
+    ):
+        price = round(catalog_index.rows[row].base_price * rate, 2)
         results.append({
-            "id": product["id"],
-            "name": product["name"],
-            "short_description": product.get("short_description", ""),
-            "full_description": product.get("full_description", ""),
-            "category": product["category"],
-            "brand": product.get("brand", ""),
-            "brand_logo": brand_info.get("logo"),
-            "brand_color": brand_info.get("color", "#007CC3"),
-            "sku": product["sku"],
-            "unspsc_code": product["unspsc_code"],
-            "unspsc_name": product.get("category", ""),
-            "price": round(base_price * currency["rate"], 2),
-            "currency_code": currency["code"],
-            "currency_symbol": currency["symbol"],
-            "unit": product.get("unit", "EA"),
-            "image_url": product["image_url"],
-            "specifications": product.get("specifications", {}),
-            "availability": product.get("availability", {"in_stock": True, "quantity": random.randint(10, 500)}),
-            "rating": product.get("rating", round(random.uniform(4.0, 5.0), 1)),
-            "reviews_count": product.get("reviews_count", random.randint(10, 500)),
-            "features": product.get("features", []),
-            "spec_document_url": f"https://docs.omnisupply.io/specs/{product['id']}.pdf",
-            "lead_time_days": random.randint(2, 7),
+            **search_bases[row],
+            "price": price,
+            "currency_code": currency_code,
+            "currency_symbol": currency_symbol,
+            "lead_time_days": lead_time,
             "delivery_partners": [
-                {"partner_id": "DP001", "price": round(base_price * currency["rate"], 2),
-                 "lead_time_days": random.randint(2, 5), "available_quantity": random.randint(50, 500)}
+                {"partner_id": "DP001", "price": price,
+                 "lead_time_days": partner_lead_time, "available_quantity": partner_quantity}
             ],
-            "has_delivery_partner": True,
-            "alternate_products": [],
-            "result_type": "with_partner",
-            "is_sponsored": random.random() < 0.1
+            "is_sponsored": is_sponsored
         })
     
     # Generate additional products to fill up to the limit
     remaining = limit - len(results)
     if remaining > 0:
-        matching_categories = [c["name"] for c in MRO_CATEGORIES if search_term in c["name"].lower()] if search_term else [c["name"] for c in MRO_CATEGORIES[:10]]
-        matching_brands = [b["name"] for b in MRO_BRANDS if search_term in b["name"].lower()] if search_term else [b["name"] for b in MRO_BRANDS[:10]]
-        
-        if category and category != "all":
-            matching_categories = [c for c in matching_categories if c.lower() == category.lower()] or [category]
-        if brand and brand != "all":
-            matching_brands = [b for b in matching_brands if b.lower() == brand.lower()] or [brand]
-        
-        for i in range(remaining):
-            cat = random.choice(matching_categories if matching_categories else [c["name"] for c in MRO_CATEGORIES])
-            br = random.choice(matching_brands if matching_brands else [b["name"] for b in MRO_BRANDS])
-            product = generate_product_data(i + (page - 1) * limit + len(results), cat, br)
-            
-            rand = random.random()
+        matching_categories, matching_brands = generator_names(search_term, category, brand)
+        
+        # Outcome per slot drawn up front; dropped slots are never generated
+        outcomes = np.searchsorted(FILL_OUTCOME_THRESHOLDS, PRODUCT_RNG.random(remaining), side="right")
+        outcomes = outcomes[outcomes != FILL_OUTCOME_DROPPED].tolist()
+        kept = len(outcomes)
+        generated = generate_product_batch(
+            (page - 1) * limit + len(results),
+            matching_categories if matching_categories else MRO_CATEGORY_NAMES,
+            matching_brands if matching_brands else MRO_BRAND_NAMES,
+            kept,
+        )
+        partner_counts = PRODUCT_RNG.integers(1, 4, size=kept).tolist()
+        partner_quantities = PRODUCT_RNG.integers(16, 2099, size=(kept, 3)).tolist()
+        alternate_price_factors = PRODUCT_RNG.uniform(0.7, 0.95, size=(kept, 2)).tolist()
+        alternate_lead_times = PRODUCT_RNG.integers(7, 16, size=(kept, 2)).tolist()
+        for product, outcome, partner_count, quantities, price_factors, alternate_leads in zip(
+            generated, outcomes, partner_counts, partner_quantities, alternate_price_factors, alternate_lead_times
+        ):
+            br = product["brand"]
             
-            if rand < 0.70:
-                partner_count = random.choice([1, 2, 3])
-                delivery_partners = generate_delivery_partners(product["base_price"], partner_count)
+            if outcome == FILL_OUTCOME_WITH_PARTNER:
+                delivery_partners = generate_delivery_partners(product["base_price"], partner_count, quantities)
                 result_type = "with_partner"
                 price = delivery_partners[0].price if delivery_partners else product["base_price"]
                 lead_time = delivery_partners[0].lead_time_days if delivery_partners else 5
-            elif rand < 0.90:
+            else:
                 delivery_partners = []
                 result_type = "quotation_required"
                 price = None
                 lead_time = None
-            else:
-                continue
             
-            alternates = get_alternate_products(product, br) if result_type == "with_partner" else []
+            alternates = get_alternate_products(product, br, price_factors, alternate_leads) if result_type == "with_partner" else []
             
             results.append({
                 "id": product["id"],
                 "name": product["name"],
-                "short_description": product.get("short_description", product.get("full_description", "")[:100]),
-                "full_description": product.get("full_description", ""),
+                "short_description": product["short_description"],
+                "full_description": product["full_description"],
                 "category": product["category"],
                 "brand": product["brand"],
                 "brand_logo": product.get("brand_logo"),
@@ -2367,63 +1312,51 @@ async def search_products(
                 "sku": product["sku"],
                 "unspsc_code": product["unspsc_code"],
                 "unspsc_name": product["unspsc_name"],
-                "price": round(price * currency["rate"], 2) if price else None,
-                "currency_code": currency["code"],
-                "currency_symbol": currency["symbol"],
+                "price": round(price * rate, 2) if price else None,
+                "currency_code": currency_code,
+                "currency_symbol": currency_symbol,
                 "unit": product["unit"],
                 "image_url": product["image_url"],
-                "specifications": product.get("specifications", {}),
-                "availability": product.get("availability", {"in_stock": True, "quantity": random.randint(10, 500)}),
-                "rating": product.get("rating", round(random.uniform(4.0, 5.0), 1)),
-                "reviews_count": product.get("reviews_count", random.randint(10, 500)),
-                "features": product.get("features", []),
+                "specifications": product["specifications"],
+                "availability": product["availability"],
+                "rating": product["rating"],
+                "reviews_count": product["reviews_count"],
+                "features": product["features"],
                 "spec_document_url": product["spec_document_url"],
                 "lead_time_days": lead_time,
                 "delivery_partners": [
-                    {"partner_id": dp.partner_id, "price": round(dp.price * currency["rate"], 2),
+                    {"partner_id": dp.partner_id, "price": round(dp.price * rate, 2),
                      "lead_time_days": dp.lead_time_days, "available_quantity": dp.available_quantity}
                     for dp in delivery_partners
                 ] if result_type == "with_partner" else [],
                 "has_delivery_partner": result_type == "with_partner",
-                "alternate_products": [{**alt, "price": round(alt["price"] * currency["rate"], 2)} for alt in alternates],
+                "alternate_products": [{**alt, "price": round(alt["price"] * rate, 2)} for alt in alternates],
                 "result_type": result_type,
                 "is_sponsored": product["is_sponsored"]
             })
     
     # Apply LLM translation if not English
     if lang != "en" and results:
-        translated_results = []
-        for result in results[:limit]:  # Limit translation to avoid timeout
-            try:
-                translated = await translate_product(result, lang)
-                translated_results.append(translated)
-            except Exception as e:
-                logger.error(f"Translation failed for product: {e}")
-                translated_results.append(result)
-        results = translated_results
+        results = await translate_concurrently(results[:limit], translate_product, lang, "product")
     
     # Translate categories if not English
-    translated_categories = [{"name": c["name"], "unspsc": c["unspsc"], "icon": c["icon"]} for c in MRO_CATEGORIES]
-    if lang != "en":
-        for cat in translated_categories[:20]:  # Limit to avoid timeout
-            try:
-                cat["name"] = await translate_text(cat["name"], lang, "category")
-            except:
-                pass
+    translated_categories = await category_list(PRODUCT_CATEGORY_LISTS, PRODUCT_CATEGORY_VIEW, lang, 20)  # Limit to avoid timeout
     
-    return {
+    # Plain JSON types only, so the dict goes straight to orjson without the jsonable_encoder walk
+    return ORJSONResponse({
         "results": results,
-        "total": 3000000,
+        "total": PRODUCT_SEARCH_TOTAL,
         "page": page,
         "limit": limit,
         "categories": translated_categories,
-        "brands": [{"name": b["name"], "logo": b.get("logo"), "color": b.get("color")} for b in MRO_BRANDS]
-    }
+        "brands": SEARCH_BRANDS
+    })
 
 @api_router.get("/products/{product_id}/inventory")
 async def check_inventory(product_id: str, current_user: dict = Depends(get_current_user)):
     quantity = random.randint(16, 2098)
-    return {
+    # Plain JSON types only (timestamp already an ISO string), so skip the jsonable_encoder walk
+    return ORJSONResponse({
         "product_id": product_id,
         "available_quantity": quantity,
         "warehouse_locations": [
@@ -2432,17 +1365,115 @@ async def check_inventory(product_id: str, current_user: dict = Depends(get_curr
             {"location": "EU-Central", "quantity": random.randint(0, quantity // 4)}
         ],
         "last_updated": datetime.now(timezone.utc).isoformat()
-    }
+    })
+
+# Static lists encoded once at import
+PRODUCT_CATEGORIES_RESPONSE = precompress(dumps_with_etag({"categories": PRODUCT_CATEGORY_VIEW}))
+PRODUCT_BRANDS_RESPONSE = precompress(dumps_with_etag({"brands": PRODUCT_BRAND_VIEW}))
+SERVICE_CATEGORIES_RESPONSE = precompress(dumps_with_etag({"categories": SERVICE_CATEGORY_VIEW}))
 
 @api_router.get("/products/categories")
-async def get_categories():
-    return {"categories": [{"name": c["name"], "unspsc": c["unspsc"], "icon": c["icon"]} for c in MRO_CATEGORIES]}
+async def get_categories(request: Request):
+    return cached_json_response(request, PRODUCT_CATEGORIES_RESPONSE)
 
 @api_router.get("/products/brands")
-async def get_brands():
-    return {"brands": [{"name": b["name"], "logo": b["logo"]} for b in MRO_BRANDS]}
+async def get_brands(request: Request):
+    return cached_json_response(request, PRODUCT_BRANDS_RESPONSE)
+
+# Cache-Control for near-static GET bodies that clients and CDNs may reuse for a minute
+PUBLIC_CACHE_CONTROL = "public, max-age=60"
+
+
+def cached_json_response(request: Request, rendered: tuple, cache_control: str = None) -> Response:
+    """Serve preserialized JSON bytes, answering a matching If-None-Match with 304"""
+    body, etag = rendered
+    headers = {"Cache-Control": cache_control} if cache_control else {}
+    variants = PRECOMPRESSED_BODIES.get(etag)
+    if variants:
+        # Precompressed static body: pick the representation before comparing validators
+        headers["Vary"] = "Accept-Encoding"
+        coding = accepted_encoding(request.headers.get("accept-encoding", ""), variants)
+        if coding:
+            body, etag = variants[coding]
+            headers["Content-Encoding"] = coding
+    headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")) or if_none_match.strip() == "*":
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 # Services Routes
+SERVICE_SEARCH_INDEX: Optional[ServiceSearchIndex] = None
+
+
+def _it_service_record(it_service: Dict) -> Dict:
+    return {
+        "id": it_service["id"],
+        "name": it_service["name"],
+        "short_description": it_service["short_description"],
+        "full_description": it_service["full_description"],
+        "category": it_service["category"],
+        "unspsc_code": it_service["unspsc_code"],
+        "unspsc_name": it_service["unspsc_name"],
+        "supplier_name": it_service.get("supplier_name"),
+        "supplier_logo": it_service.get("supplier_logo"),
+        "supplier_color": it_service.get("supplier_color", "#007CC3"),
+        "unit_of_measure": it_service["pricing_model"],
+        "base_price": it_service["base_price"],
+        "image_url": it_service.get("image_url", DEFAULT_SERVICE_IMAGE),
+        "service_includes": it_service.get("service_includes", []),
+        "availability": it_service.get("availability", {}),
+        "rating": it_service.get("rating", 4.5),
+        "reviews_count": it_service.get("reviews_count", 100),
+        "is_it_service": True
+    }
+
+
+def _service_record(service: Dict) -> Dict:
+    # id, availability, rating and reviews_count are drawn per listing (service_with_listing_extras)
+    return {
+        "name": service["name"],
+        "short_description": f"Professional {service['name'].lower()} for enterprise environments.",
+        "full_description": f"{service['name']}. Professional service meeting industry standards and compliance requirements.",
+        "category": service["category"],
+        "unspsc_code": service["unspsc_code"],
+        "unspsc_name": service["unspsc_name"],
+        "supplier_name": service["supplier_name"],
+        "supplier_logo": None,
+        "supplier_color": "#007CC3",
+        "unit_of_measure": service["unit_of_measure"],
+        "base_price": service["base_price"],
+        "image_url": service["image_url"],
+        "service_includes": [],
+        "is_it_service": False
+    }
+
+
+def get_service_index() -> ServiceSearchIndex:
+    """Column index over the IT services catalog followed by SERVICES_DATA, built on first use"""
+    global SERVICE_SEARCH_INDEX
+    if SERVICE_SEARCH_INDEX is None:
+        SERVICE_SEARCH_INDEX = ServiceSearchIndex(
+            [_it_service_record(s) for s in catalog_service.IT_SERVICES_CATALOG]
+            + [_service_record(s) for s in SERVICES_DATA]
+        )
+    return SERVICE_SEARCH_INDEX
+
+
+def service_with_listing_extras(service: Dict) -> Dict:
+    """IT services as indexed; other services get a fresh id, lead time, rating and review count"""
+    if service["is_it_service"]:
+        return service
+    return {
+        **service,
+        "id": new_listing_id(),
+        "availability": {"available": True, "lead_time_days": random.randint(1, 7)},
+        "rating": round(random.uniform(4.0, 5.0), 1),
+        "reviews_count": random.randint(20, 300),
+    }
+
+
 @api_router.get("/services/search")
 async def search_services(
     q: str = Query("", description="Search query"),
@@ -2450,78 +1481,23 @@ async def search_services(
     page: int = 1,
     limit: int = 20,
     lang: str = Query("en", description="Language code (en, fr, de, it, nl)"),
+    min_price: Optional[float] = Query(None, description="Minimum base price (USD)"),
+    max_price: Optional[float] = Query(None, description="Maximum base price (USD)"),
     current_user: dict = Depends(get_current_user)
 ):
     currency = COUNTRY_CURRENCIES.get(current_user.get("country", "USA"), COUNTRY_CURRENCIES["USA"])
+    rate, currency_code, currency_symbol = currency["rate"], currency["code"], currency["symbol"]
     results = []
     
     search_term = q.lower()
     
-    # Combine IT Services Catalog with SERVICES_DATA
-    all_services = []
-    
-    # Add IT Services from detailed catalog
-    for it_service in IT_SERVICES_CATALOG:
-        all_services.append({
-            "id": it_service["id"],
-            "name": it_service["name"],
-            "short_description": it_service["short_description"],
-            "full_description": it_service["full_description"],
-            "category": it_service["category"],
-            "unspsc_code": it_service["unspsc_code"],
-            "unspsc_name": it_service["unspsc_name"],
-            "supplier_name": it_service.get("supplier_name"),
-            "supplier_logo": it_service.get("supplier_logo"),
-            "supplier_color": it_service.get("supplier_color", "#007CC3"),
-            "unit_of_measure": it_service["pricing_model"],
-            "base_price": it_service["base_price"],
-            "image_url": it_service.get("image_url", DEFAULT_SERVICE_IMAGE),
-            "service_includes": it_service.get("service_includes", []),
-            "availability": it_service.get("availability", {}),
-            "rating": it_service.get("rating", 4.5),
-            "reviews_count": it_service.get("reviews_count", 100),
-            "is_it_service": True
-        })
-    
-    # Add regular services
-    for service in SERVICES_DATA:
-        # Get image URL for the service category
-        service_image = SERVICE_IMAGE_URLS.get(service["category"], DEFAULT_SERVICE_IMAGE)
-        all_services.append({
-            "id": str(uuid.uuid4()),
-            "name": service["name"],
-            "short_description": f"Professional {service['name'].lower()} for enterprise environments.",
-            "full_description": f"{service['name']}. Professional service meeting industry standards and compliance requirements.",
-            "category": service["category"],
-            "unspsc_code": service["unspsc_code"],
-            "unspsc_name": service["unspsc_name"],
-            "supplier_name": service["supplier_name"],
-            "supplier_logo": None,
-            "supplier_color": "#007CC3",
-            "unit_of_measure": service["unit_of_measure"],
-            "base_price": service["base_price"],
-            "image_url": service_image,
-            "service_includes": [],
-            "availability": {"available": True, "lead_time_days": random.randint(1, 7)},
-            "rating": round(random.uniform(4.0, 5.0), 1),
-            "reviews_count": random.randint(20, 300),
-            "is_it_service": False
-        })
-    
-    # Filter by search term
-    filtered_services = all_services
-    if search_term:
-        filtered_services = [s for s in all_services if 
-            search_term in s["name"].lower() or 
-            search_term in s["category"].lower() or
-            search_term in s.get("short_description", "").lower()]
-    if category and category != "all":
-        filtered_services = [s for s in filtered_services if s["category"].lower() == category.lower()]
-    
-    if not filtered_services:
-        filtered_services = all_services[:15]
+    service_index = get_service_index()
+    rows = service_index.search_rows(search_term, category if category != "all" else None, min_price, max_price)
+    if not rows:
+        rows = range(min(15, len(service_index)))
+    filtered_services = [service_with_listing_extras(service_index.services[row]) for row in rows[:limit]]
     
-    for service in filtered_services[:limit]:
+    for service in filtered_services:
         rand = random.random()
         is_sponsored = random.random() < 0.10
         
@@ -2547,9 +1523,9 @@ async def search_services(
             "unspsc_code": service["unspsc_code"],
             "unspsc_name": service["unspsc_name"],
             "unit_of_measure": service["unit_of_measure"],
-            "price": round(price * currency["rate"], 2) if price else None,
-            "currency_code": currency["code"],
-            "currency_symbol": currency["symbol"],
+            "price": round(price * rate, 2) if price else None,
+            "currency_code": currency_code,
+            "currency_symbol": currency_symbol,
             "pricing_model": service["unit_of_measure"],
             "supplier_name": service["supplier_name"] if has_supplier else None,
             "supplier_logo": service.get("supplier_logo"),
@@ -2566,37 +1542,23 @@ async def search_services(
     
     # Apply LLM translation if not English
     if lang != "en" and results:
-        translated_results = []
-        for result in results[:limit]:  # Limit translation to avoid timeout
-            try:
-                translated = await translate_service(result, lang)
-                translated_results.append(translated)
-            except Exception as e:
-                logger.error(f"Translation failed for service: {e}")
-                translated_results.append(result)
-        results = translated_results
+        results = await translate_concurrently(results[:limit], translate_service, lang, "service")
     
     # Translate categories if not English
-    translated_categories = [{"name": c["name"], "unspsc": c["unspsc"], "icon": c["icon"]} for c in SERVICE_CATEGORIES]
-    if lang != "en":
-        for cat in translated_categories[:15]:  # Limit to avoid timeout
-            try:
-                cat["name"] = await translate_text(cat["name"], lang, "category")
-            except:
-                pass
+    translated_categories = await category_list(SERVICE_CATEGORY_LISTS, SERVICE_CATEGORY_VIEW, lang, 15)  # Limit to avoid timeout
     
-    return {
+    # Plain JSON types only, so the dict goes straight to orjson without the jsonable_encoder walk
+    return ORJSONResponse({
         "results": results,
-        "total": 100000,
+        "total": SERVICE_SEARCH_TOTAL,
         "page": page,
         "limit": limit,
         "categories": translated_categories
-    }
+    })
 
 @api_router.get("/services/categories")
-async def get_service_categories():
-    return {"categories": [{"name": c["name"], "unspsc": c["unspsc"], "icon": c["icon"]} for c in SERVICE_CATEGORIES]}
-
+async def get_service_categories(request: Request):
+    return cached_json_response(request, SERVICE_CATEGORIES_RESPONSE)
 
 # ============================================================
 # ALGOLIA CATALOG SEARCH API - World-Class B2B Product Catalog
@@ -2608,6 +1570,8 @@ class AlgoliaSearchRequest(BaseModel):
     hits_per_page: int = 24
     filters: Optional[Dict] = None
     sort_by: Optional[str] = None  # price_asc, price_desc, relevance
+    # Defaults to the result-card attributes (SEARCH_HIT_ATTRIBUTES); ["*"] returns full hits
+    attributes_to_retrieve: Optional[List[str]] = None
 
 
 class AlgoliaCatalogUploadRequest(BaseModel):
@@ -2615,6 +1579,24 @@ class AlgoliaCatalogUploadRequest(BaseModel):
     catalog_type: str = "products"  # products or services
 
 
+# Shared across responses; never mutate
+LOWEST_PRICE_BADGE = {"type": "lowest_price", "label": "Lowest Price", "color": "green"}
+IN_STOCK_BADGE = {"type": "in_stock", "label": "In Stock", "color": "green"}
+
+
+@lru_cache(maxsize=256)
+def hit_badges(is_lowest_price: bool, supplier_count: int, in_stock: bool) -> Tuple[Dict, ...]:
+    """Shared badge list for a search hit's lowest price / supplier count / stock flags"""
+    badges = []
+    if is_lowest_price:
+        badges.append(LOWEST_PRICE_BADGE)
+    elif supplier_count > 1:
+        badges.append({"type": "multi_supplier", "label": f"{supplier_count} Suppliers", "color": "blue"})
+    if in_stock:
+        badges.append(IN_STOCK_BADGE)
+    return tuple(badges)
+
+
 @api_router.post("/algolia/catalog/search")
 async def algolia_search_catalog(request: AlgoliaSearchRequest):
     """
@@ -2630,33 +1612,20 @@ async def algolia_search_catalog(request: AlgoliaSearchRequest):
             filters=request.filters,
             page=request.page,
             hits_per_page=request.hits_per_page,
-            sort_by=request.sort_by
+            sort_by=request.sort_by,
+            attributes_to_retrieve=request.attributes_to_retrieve or SEARCH_HIT_ATTRIBUTES
         )
         
-        # Process hits to group by product and identify lowest prices
-        processed_hits = []
-        product_groups = {}
-        
-        for hit in results.get("hits", []):
-            group_id = hit.get("product_group_id")
-            
-            # Add lowest price badge
-            if hit.get("is_lowest_price"):
-                hit["badges"] = [{"type": "lowest_price", "label": "Lowest Price", "color": "green"}]
-            elif hit.get("supplier_count", 1) > 1:
-                hit["badges"] = [{"type": "multi_supplier", "label": f"{hit['supplier_count']} Suppliers", "color": "blue"}]
-            else:
-                hit["badges"] = []
-            
-            # Add stock badge
-            if hit.get("in_stock"):
-                hit["badges"].append({"type": "in_stock", "label": "In Stock", "color": "green"})
-            
-            processed_hits.append(hit)
+        # Lowest price / multi-supplier and stock badges are shared per flag combination
+        hits = results.get("hits", [])
+        for hit in hits:
+            hit["badges"] = hit_badges(
+                bool(hit.get("is_lowest_price")), hit.get("supplier_count") or 1, bool(hit.get("in_stock"))
+            )
         
-        return {
+        return ORJSONResponse({
             "success": True,
-            "hits": processed_hits,
+            "hits": hits,
             "nbHits": results.get("nbHits", 0),
             "page": results.get("page", 0),
             "nbPages": results.get("nbPages", 0),
@@ -2664,7 +1633,7 @@ async def algolia_search_catalog(request: AlgoliaSearchRequest):
             "facets": results.get("facets", {}),
             "processingTimeMS": results.get("processingTimeMS", 0),
             "query": request.query
-        }
+        })
         
     except Exception as e:
         logging.error(f"Algolia search error: {e}")
@@ -2678,16 +1647,62 @@ async def get_catalog_facets(facet_name: str, query: str = ""):
         raise HTTPException(status_code=503, detail="Algolia service not available")
     
     try:
-        facet_values = get_facet_values(facet_name, query)
-        return {
+        facet_values = await asyncio.to_thread(get_facet_values, facet_name, query)
+        return ORJSONResponse({
             "facet": facet_name,
-            "values": facet_values
-        }
+            "values": [f.to_dict() for f in facet_values]
+        })
     except Exception as e:
         logging.error(f"Facet retrieval error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def upload_format(file: UploadFile, allowed: Tuple[str, ...], detail: str) -> str:
+    """Sniff an upload's format from its first bytes (the filename is not trusted); 400 unless allowed"""
+    file_format = sniff_file_format(await file.read(8))
+    await file.seek(0)
+    if file_format not in allowed:
+        raise HTTPException(status_code=400, detail=detail)
+    return file_format
+
+
+# Uploads parsed in memory / catalog files streamed to disk (millions of rows)
+MAX_UPLOAD_BYTES = 64 * 1024 * 1024
+MAX_CATALOG_UPLOAD_BYTES = 2 * 1024 * 1024 * 1024
+
+
+async def copy_upload(file: UploadFile, out, max_bytes: int) -> None:
+    """Copy an upload to out 1MB at a time; 413 as soon as it exceeds max_bytes"""
+    too_large = HTTPException(status_code=413, detail=f"File too large (max {max_bytes // (1024 * 1024)} MB)")
+    if file.size is not None and file.size > max_bytes:
+        raise too_large
+    total = 0
+    while chunk := await file.read(1024 * 1024):
+        total += len(chunk)
+        if total > max_bytes:
+            raise too_large
+        out.write(chunk)
+
+
+async def read_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> bytes:
+    """Whole upload body, bounded by max_bytes"""
+    buffer = io.BytesIO()
+    await copy_upload(file, buffer, max_bytes)
+    return buffer.getvalue()
+
+
+async def spool_upload(file: UploadFile) -> str:
+    """Copy an upload to a temporary file (keeping its extension) 1MB at a time; the caller removes it"""
+    fd, path = tempfile.mkstemp(suffix=Path(file.filename).suffix.lower())
+    try:
+        with os.fdopen(fd, "wb") as f:
+            await copy_upload(file, f, MAX_CATALOG_UPLOAD_BYTES)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
 @api_router.post("/algolia/catalog/upload")
 async def upload_catalog_to_algolia(
     file: UploadFile = File(...),
@@ -2702,28 +1717,26 @@ async def upload_catalog_to_algolia(
         raise HTTPException(status_code=503, detail="Algolia service not available")
     
     # Check file type
-    if not file.filename.endswith(('.xlsx', '.xls', '.csv')):
-        raise HTTPException(status_code=400, detail="Only Excel (.xlsx, .xls) and CSV files are supported")
+    await upload_format(file, SPREADSHEET_FORMATS, "Only Excel (.xlsx, .xls) and CSV files are supported")
     
+    path = await spool_upload(file)
     try:
-        # Read file content
-        content = await file.read()
-        
-        # Parse file
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(io.BytesIO(content))
-        else:
-            df = pd.read_excel(io.BytesIO(content))
-        
-        # Convert to list of dicts
-        products = df.to_dict('records')
-        
-        if not products:
+        # Index to Algolia one chunk of rows at a time
+        row_count = 0
+        result = {"success": False, "indexed_count": 0, "failed_count": 0}
+        for chunk in stream_file_chunks(path):
+            row_count += len(chunk)
+            chunk_result = await algolia_index_products(frame_records(chunk), supplier)
+            result["failed_count"] += chunk_result.get("failed_count", 0)
+            if chunk_result.get("success"):
+                result["success"] = True
+                result["indexed_count"] += chunk_result["indexed_count"]
+            elif not result["success"]:
+                result["error"] = chunk_result.get("error")
+        
+        if not row_count:
             raise HTTPException(status_code=400, detail="No products found in file")
         
-        # Index to Algolia
-        result = await algolia_index_products(products, supplier)
-        
         if result.get("success"):
             # Store upload record
             await db.catalog_uploads.insert_one({
@@ -2736,13 +1749,15 @@ async def upload_catalog_to_algolia(
                 "status": "completed"
             })
             
-            # Trigger product grouping update (async)
-            asyncio.create_task(update_product_grouping())
+            # Trigger product grouping update (debounced across back-to-back uploads)
+            schedule_product_grouping()
+            ALGOLIA_STATS_CACHE.clear()
             
             return {
                 "success": True,
                 "message": f"Successfully indexed {result['indexed_count']} products from {supplier}",
                 "indexed_count": result["indexed_count"],
+                "failed_count": result.get("failed_count", 0),
                 "supplier": supplier
             }
         else:
@@ -2753,129 +1768,109 @@ async def upload_catalog_to_algolia(
     except Exception as e:
         logging.error(f"Catalog upload error: {e}")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+    finally:
+        os.remove(path)
+
+
+# Facet counts and the product total only change when a catalog is uploaded or cleared,
+# so both stats endpoints share one rendered body for ALGOLIA_STATS_TTL_SECONDS
+ALGOLIA_STATS_TTL_SECONDS = 60
+ALGOLIA_STATS_CACHE = ResponseCache(maxsize=16, ttl=ALGOLIA_STATS_TTL_SECONDS)
+# Clients may reuse stats / countries for as long as the server does
+ALGOLIA_STATS_CACHE_CONTROL = f"public, max-age={ALGOLIA_STATS_TTL_SECONDS}"
+
+ALGOLIA_UNAVAILABLE_STATS = {
+    "algolia_available": False,
+    "total_products": 0,
+    "suppliers": [],
+    "categories": []
+}
 
+def facet_to_dict(f) -> Dict:
+    """Extract value/count from an Algolia facet hit (SDK object or dict)"""
+    if hasattr(f, 'value'):
+        return {"name": f.value, "count": getattr(f, 'count', 0)}
+    elif isinstance(f, dict):
+        return {"name": f.get("value"), "count": f.get("count", 0)}
+    return {"name": str(f), "count": 0}
+
+
+async def algolia_catalog_stats() -> Tuple[bytes, str]:
+    """Rendered catalog statistics; a cache miss queries the three facets and the total concurrently"""
+    rendered = ALGOLIA_STATS_CACHE.get("stats")
+    if rendered is not None:
+        return rendered
+    brand_facets, category_facets, supplier_facets, result = await asyncio.gather(
+        asyncio.to_thread(get_facet_values, "brand", max_hits=20),
+        asyncio.to_thread(get_facet_values, "category", max_hits=20),
+        asyncio.to_thread(get_facet_values, "supplier"),
+        # Quick search to get the total and the (same 100-capped) facet value counts
+        asyncio.to_thread(algolia_search_products, "", page=0, hits_per_page=1),
+    )
+    facet_counts = result.get("facets") or {}
+    rendered = dumps_with_etag({
+        "algolia_available": True,
+        "total_products": result.get("nbHits", 0),
+        "brand_count": len(facet_counts.get("brand") or {}),
+        "category_count": len(facet_counts.get("category") or {}),
+        "supplier_count": len(supplier_facets) if supplier_facets else 0,
+        "suppliers": [facet_to_dict(f) for f in (supplier_facets or [])],
+        "top_categories": [facet_to_dict(f) for f in (category_facets or [])],
+        "top_brands": [facet_to_dict(f) for f in (brand_facets or [])]
+    })
+    ALGOLIA_STATS_CACHE.put("stats", rendered)
+    return rendered
 
-@api_router.get("/algolia/catalog/stats")
-async def get_catalog_stats(current_user: dict = Depends(get_current_user)):
-    """Get catalog statistics - total products, suppliers, categories"""
+
+async def catalog_stats_response(request: Request, cache_control: str):
+    """Shared body of the admin and public stats endpoints"""
     if not ALGOLIA_AVAILABLE:
-        return {
-            "algolia_available": False,
-            "total_products": 0,
-            "suppliers": [],
-            "categories": []
-        }
+        return ALGOLIA_UNAVAILABLE_STATS
     
     try:
-        # Get facet counts
-        brand_facets = get_facet_values("brand")
-        category_facets = get_facet_values("category")
-        supplier_facets = get_facet_values("supplier")
-        
-        # Quick search to get total count
-        result = algolia_search_products("", page=0, hits_per_page=1)
-        
-        # Helper to extract value/count from facet objects
-        def facet_to_dict(f):
-            if hasattr(f, 'value'):
-                return {"name": f.value, "count": getattr(f, 'count', 0)}
-            elif isinstance(f, dict):
-                return {"name": f.get("value"), "count": f.get("count", 0)}
-            return {"name": str(f), "count": 0}
-        
-        return {
-            "algolia_available": True,
-            "total_products": result.get("nbHits", 0),
-            "brand_count": len(brand_facets) if brand_facets else 0,
-            "category_count": len(category_facets) if category_facets else 0,
-            "supplier_count": len(supplier_facets) if supplier_facets else 0,
-            "suppliers": [facet_to_dict(f) for f in (supplier_facets or [])],
-            "top_categories": [facet_to_dict(f) for f in (category_facets or [])[:20]],
-            "top_brands": [facet_to_dict(f) for f in (brand_facets or [])[:20]]
-        }
+        return cached_json_response(request, await algolia_catalog_stats(), cache_control)
     except Exception as e:
         logging.error(f"Stats retrieval error: {e}")
         return {"algolia_available": True, "error": str(e)}
 
 
+@api_router.get("/algolia/catalog/stats")
+async def get_catalog_stats(request: Request, current_user: dict = Depends(get_current_user)):
+    """Get catalog statistics - total products, suppliers, categories"""
+    return await catalog_stats_response(request, f"private, max-age={ALGOLIA_STATS_TTL_SECONDS}")
+
+
 @api_router.get("/algolia/catalog/public-stats")
-async def get_public_catalog_stats():
+async def get_public_catalog_stats(request: Request):
     """Get public catalog statistics (no auth required) - for PunchOut and standalone catalogs"""
-    if not ALGOLIA_AVAILABLE:
-        return {
-            "algolia_available": False,
-            "total_products": 0,
-            "suppliers": [],
-            "categories": []
-        }
-    
-    try:
-        # Get facet counts
-        brand_facets = get_facet_values("brand")
-        category_facets = get_facet_values("category")
-        supplier_facets = get_facet_values("supplier")
-        
-        # Quick search to get total count
-        result = algolia_search_products("", page=0, hits_per_page=1)
-        
-        # Helper to extract value/count from facet objects
-        def facet_to_dict(f):
-            if hasattr(f, 'value'):
-                return {"name": f.value, "count": getattr(f, 'count', 0)}
-            elif isinstance(f, dict):
-                return {"name": f.get("value"), "count": f.get("count", 0)}
-            return {"name": str(f), "count": 0}
-        
-        return {
-            "algolia_available": True,
-            "total_products": result.get("nbHits", 0),
-            "brand_count": len(brand_facets) if brand_facets else 0,
-            "category_count": len(category_facets) if category_facets else 0,
-            "supplier_count": len(supplier_facets) if supplier_facets else 0,
-            "suppliers": [facet_to_dict(f) for f in (supplier_facets or [])],
-            "top_categories": [facet_to_dict(f) for f in (category_facets or [])[:20]],
-            "top_brands": [facet_to_dict(f) for f in (brand_facets or [])[:20]]
-        }
-    except Exception as e:
-        logging.error(f"Public stats retrieval error: {e}")
-        return {"algolia_available": True, "error": str(e)}
+    return await catalog_stats_response(request, ALGOLIA_STATS_CACHE_CONTROL)
 
 
 @api_router.get("/algolia/catalog/product/{object_id}")
-async def get_product_details(object_id: str):
-    """Get detailed product information including related products from other suppliers"""
+async def get_product_details(object_id: str, group_id: Optional[str] = None):
+    """Get detailed product information including related products from other suppliers.
+    Opt-in: callers that pass the hit's product_group_id as group_id get both in a single Algolia
+    round trip. Without it this still takes two (the group is not derivable from the objectID),
+    and the bundled frontend does not call this endpoint, so current traffic is unchanged."""
     if not ALGOLIA_AVAILABLE:
         raise HTTPException(status_code=503, detail="Algolia service not available")
     
     try:
-        from algolia_service import algolia_client, PRODUCTS_INDEX
-        
-        # Get the product
-        product = algolia_client.get_object(PRODUCTS_INDEX, object_id)
+        # Get the product and related products from other suppliers (same product_group_id)
+        product, related_products = await asyncio.to_thread(get_product_with_related, object_id, group_id)
         
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
         
-        # Find related products from other suppliers (same product_group_id)
-        related_products = []
-        if product.get("product_group_id"):
-            search_result = algolia_search_products(
-                query="",
-                filters={"product_group_id": product["product_group_id"]},
-                hits_per_page=10
-            )
-            related_products = [
-                hit for hit in search_result.get("hits", [])
-                if hit.get("objectID") != object_id
-            ]
-        
-        return {
+        return ORJSONResponse({
             "success": True,
             "product": product,
             "related_suppliers": related_products,
             "supplier_count": len(related_products) + 1
-        }
+        })
         
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Product details error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2892,19 +1887,24 @@ async def clear_algolia_catalog(current_user: dict = Depends(get_current_user)):
     
     try:
         success = clear_index()
+        ALGOLIA_STATS_CACHE.clear()
         return {"success": success, "message": "Catalog cleared" if success else "Failed to clear"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Environment is fixed for the process lifetime: render the frontend config once
+ALGOLIA_CONFIG_RESPONSE = dumps_with_etag({
+    "app_id": os.environ.get("ALGOLIA_APP_ID", ""),
+    "search_key": os.environ.get("ALGOLIA_SEARCH_KEY", ""),
+    "index_name": "omnisupply_products"
+})
+
+
 @api_router.get("/algolia/config")
-async def get_algolia_config():
+async def get_algolia_config(request: Request):
     """Get Algolia configuration for frontend (search-only key)"""
-    return {
-        "app_id": os.environ.get("ALGOLIA_APP_ID", ""),
-        "search_key": os.environ.get("ALGOLIA_SEARCH_KEY", ""),
-        "index_name": "omnisupply_products"
-    }
+    return cached_json_response(request, ALGOLIA_CONFIG_RESPONSE, PUBLIC_CACHE_CONTROL)
 
 
 # ============================================
@@ -2930,14 +1930,12 @@ async def upload_supplier_contract(
     if current_user.get("role") != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    if not file.filename.endswith(('.xlsx', '.xls')):
-        raise HTTPException(status_code=400, detail="Only Excel files are supported")
+    await upload_format(file, EXCEL_FORMATS, "Only Excel files are supported")
+    content = await read_upload(file)
     
     try:
         from pricing_engine import parse_discount_file, save_supplier_contract
         
-        content = await file.read()
-        
         # Parse discount percentages
         discounts = await parse_discount_file(content, file.filename)
         
@@ -2969,24 +1967,31 @@ async def upload_supplier_contract(
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+# Projected contract rows are tiny: one batch (one round trip) covers every active supplier
+CONTRACT_LIST_BATCH_SIZE = 1000
+
+
 @api_router.get("/algolia/contracts")
 async def get_supplier_contracts(current_user: dict = Depends(get_current_user)):
     """Get all active supplier contracts"""
     if current_user.get("role") != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    contracts = []
-    cursor = db.supplier_contracts.find({"status": "active"}, {"_id": 0})
-    async for contract in cursor:
-        contracts.append({
-            "supplier_name": contract.get("supplier_name"),
-            "categories_count": len(contract.get("category_discounts", {})),
-            "countries": contract.get("countries", []),
-            "effective_date": contract.get("effective_date"),
-            "updated_at": contract.get("updated_at")
-        })
+    # Count discount categories in Mongo instead of shipping every discount table
+    cursor = db.supplier_contracts.aggregate([
+        {"$match": {"status": "active"}},
+        {"$project": {
+            "_id": 0,
+            "supplier_name": 1,
+            "categories_count": {"$size": {"$objectToArray": {"$ifNull": ["$category_discounts", {}]}}},
+            "countries": {"$ifNull": ["$countries", []]},
+            "effective_date": {"$ifNull": ["$effective_date", None]},
+            "updated_at": {"$ifNull": ["$updated_at", None]}
+        }}
+    ], batchSize=CONTRACT_LIST_BATCH_SIZE)
+    contracts = await cursor.to_list(None)
     
-    return {"contracts": contracts}
+    return ORJSONResponse({"contracts": contracts})
 
 
 @api_router.get("/algolia/contracts/{supplier_name}")
@@ -2996,14 +2001,14 @@ async def get_contract_details(supplier_name: str, current_user: dict = Depends(
         raise HTTPException(status_code=403, detail="Admin access required")
     
     contract = await db.supplier_contracts.find_one(
-        {"supplier_name": {"$regex": f"^{supplier_name}$", "$options": "i"}},
-        {"_id": 0}
+        {"supplier_name_lc": supplier_name.lower()},
+        {"_id": 0, "supplier_name_lc": 0}
     )
     
     if not contract:
         raise HTTPException(status_code=404, detail="Contract not found")
     
-    return contract
+    return ORJSONResponse(contract)
 
 
 @api_router.post("/algolia/catalog/upload-with-pricing")
@@ -3025,17 +2030,14 @@ async def upload_catalog_with_pricing(
     if not ALGOLIA_AVAILABLE:
         raise HTTPException(status_code=503, detail="Algolia service not available")
     
-    if not file.filename.endswith(('.xlsx', '.xls', '.csv')):
-        raise HTTPException(status_code=400, detail="Only Excel and CSV files are supported")
+    await upload_format(file, SPREADSHEET_FORMATS, "Only Excel and CSV files are supported")
     
+    path = await spool_upload(file)
     try:
-        from algolia_service import index_products_from_file, update_product_grouping
-        
-        content = await file.read()
         country_list = [c.strip() for c in countries.split(",") if c.strip()]
         
-        # Index products with pricing
-        result = await index_products_from_file(content, file.filename, supplier, country_list)
+        # Index products with pricing, one chunk of rows at a time
+        result = await index_product_chunks(stream_file_chunks(path), file.filename, supplier, country_list)
         
         if result.get("success"):
             # Store upload record
@@ -3051,13 +2053,15 @@ async def upload_catalog_with_pricing(
                 "pricing_applied": True
             })
             
-            # Update product grouping
-            asyncio.create_task(update_product_grouping())
+            # Update product grouping (debounced across back-to-back uploads)
+            schedule_product_grouping()
+            ALGOLIA_STATS_CACHE.clear()
             
             return {
                 "success": True,
                 "message": f"Successfully indexed {result['indexed_count']} products from {supplier}",
                 "indexed_count": result["indexed_count"],
+                "failed_count": result.get("failed_count", 0),
                 "supplier": supplier,
                 "countries": country_list,
                 "pricing_applied": True
@@ -3068,22 +2072,26 @@ async def upload_catalog_with_pricing(
     except Exception as e:
         logging.error(f"Catalog upload error: {e}")
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+    finally:
+        os.remove(path)
 
 
 @api_router.get("/algolia/countries")
-async def get_available_countries():
+async def get_available_countries(request: Request):
     """Get list of countries with products in the catalog"""
     if not ALGOLIA_AVAILABLE:
         return {"countries": []}
     
     try:
-        country_facets = get_facet_values("country")
-        return {
-            "countries": [
-                {"code": f.get("value"), "name": f.get("value"), "count": f.get("count", 0)}
-                for f in (country_facets or [])
-            ]
-        }
+        rendered = ALGOLIA_STATS_CACHE.get("countries")
+        if rendered is None:
+            country_facets = await asyncio.to_thread(get_facet_values, "country")
+            countries = [facet_to_dict(f) for f in (country_facets or [])]
+            rendered = dumps_with_etag({
+                "countries": [{"code": c["name"], "name": c["name"], "count": c["count"]} for c in countries]
+            })
+            ALGOLIA_STATS_CACHE.put("countries", rendered)
+        return cached_json_response(request, rendered, ALGOLIA_STATS_CACHE_CONTROL)
     except Exception as e:
         logging.error(f"Countries retrieval error: {e}")
         return {"countries": []}
@@ -3122,52 +2130,67 @@ async def calculate_product_pricing(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+CATALOG_UPLOAD_PROJECTION = {
+    "_id": 0, "upload_id": 1, "supplier": 1, "filename": 1, "product_count": 1, "countries": 1,
+    "uploaded_by": 1, "uploaded_at": 1, "status": 1, "pricing_applied": 1
+}
+
+
 @api_router.get("/algolia/catalog/uploads")
 async def get_catalog_uploads(current_user: dict = Depends(get_current_user)):
     """Get history of catalog uploads"""
     if current_user.get("role") != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    uploads = []
-    cursor = db.catalog_uploads.find({}, {"_id": 0}).sort("uploaded_at", -1).limit(50)
-    async for upload in cursor:
-        uploads.append(upload)
+    uploads = await db.catalog_uploads.find({}, CATALOG_UPLOAD_PROJECTION).sort("uploaded_at", -1).to_list(50)
     
-    return {"uploads": uploads}
+    return ORJSONResponse({"uploads": uploads})
 
 
 # Cart Routes
+# Cart items are one document each in db.cart_items, keyed by (user_id, id); _id keeps insertion order
+CART_ITEM_PROJECTION = {"_id": 0, "user_id": 0}
+
+
+async def cart_items(user_id: str) -> List[Dict]:
+    """A user's cart items in the order they were added"""
+    return await db.cart_items.find({"user_id": user_id}, CART_ITEM_PROJECTION).sort("_id", 1).to_list(None)
+
+
 @api_router.get("/cart")
 async def get_cart(current_user: dict = Depends(get_current_user)):
-    cart = await db.carts.find_one({"user_id": current_user["id"]}, {"_id": 0})
-    return {"items": cart.get("items", []) if cart else [], "total": sum(item.get("total_price", 0) for item in (cart.get("items", []) if cart else []))}
-
-@api_router.post("/cart/add")
-async def add_to_cart(item: CartItem, current_user: dict = Depends(get_current_user)):
-    cart = await db.carts.find_one({"user_id": current_user["id"]})
-    item_dict = item.model_dump()
-    
-    if cart:
-        await db.carts.update_one({"user_id": current_user["id"]}, {"$push": {"items": item_dict}})
-    else:
-        await db.carts.insert_one({"user_id": current_user["id"], "items": [item_dict]})
-    
+    # Items and total come back from Mongo in one grouped document
+    grouped = await db.cart_items.aggregate([
+        {"$match": {"user_id": current_user["id"]}},
+        {"$sort": {"_id": 1}},
+        {"$project": CART_ITEM_PROJECTION},
+        {"$group": {"_id": None, "items": {"$push": "$$ROOT"}, "total": {"$sum": "$total_price"}}}
+    ]).to_list(1)
+    if not grouped:
+        return {"items": [], "total": 0}
+    return {"items": grouped[0]["items"], "total": grouped[0]["total"]}
+
+@api_router.post("/cart/add", openapi_extra=json_body_schema(CART_ITEM_ADAPTER))
+async def add_to_cart(item: CartItem = Depends(cart_item_body), current_user: dict = Depends(get_current_user)):
+    await db.cart_items.update_one(
+        {"user_id": current_user["id"], "id": item.id}, {"$set": item.model_dump()}, upsert=True
+    )
     return {"message": "Item added to cart", "item_id": item.id}
 
 @api_router.delete("/cart/remove/{item_id}")
 async def remove_from_cart(item_id: str, current_user: dict = Depends(get_current_user)):
-    await db.carts.update_one({"user_id": current_user["id"]}, {"$pull": {"items": {"id": item_id}}})
+    await db.cart_items.delete_one({"user_id": current_user["id"], "id": item_id})
     return {"message": "Item removed from cart"}
 
 @api_router.post("/cart/transfer")
 async def transfer_cart(transfer: CartTransfer, current_user: dict = Depends(get_current_user)):
     """Transfer cart to PunchOut system (Coupa, Ariba, SAP, etc.)"""
-    cart = await db.carts.find_one({"user_id": current_user["id"]}, {"_id": 0})
-    if not cart or not cart.get("items"):
+    items = await cart_items(current_user["id"])
+    if not items:
         raise HTTPException(status_code=400, detail="Cart is empty")
     
     # Get system info
-    system_info = next((s for s in PUNCHOUT_SYSTEMS if s["name"] == transfer.system), None)
+    system_info = PUNCHOUT_SYSTEM_BY_NAME.get(transfer.system)
     if not system_info:
         raise HTTPException(status_code=400, detail="Invalid PunchOut system")
     
@@ -3177,16 +2200,16 @@ async def transfer_cart(transfer: CartTransfer, current_user: dict = Depends(get
         "user_id": current_user["id"],
         "system": transfer.system,
         "system_logo": system_info["logo"],
-        "items": cart["items"],
-        "total_amount": sum(item.get("total_price", 0) for item in cart["items"]),
+        "items": items,
+        "total_amount": sum(item.get("total_price", 0) for item in items),
         "status": "Pending Customer PO",
         "transferred_at": datetime.now(timezone.utc).isoformat()
     }
     
     await db.cart_transfers.insert_one(transfer_record)
     
-    # Clear cart
-    await db.carts.update_one({"user_id": current_user["id"]}, {"$set": {"items": []}})
+    # Clear the transferred items (anything added meanwhile stays in the cart)
+    await db.cart_items.delete_many({"user_id": current_user["id"], "id": {"$in": [item["id"] for item in items]}})
     
     return {
         "message": f"Cart transferred to {transfer.system}",
@@ -3201,8 +2224,8 @@ async def get_cart_transfers(current_user: dict = Depends(get_current_user)):
     return {"transfers": transfers}
 
 @api_router.get("/punchout/systems")
-async def get_punchout_systems():
-    return {"systems": PUNCHOUT_SYSTEMS}
+async def get_punchout_systems(request: Request):
+    return cached_json_response(request, PUNCHOUT_SYSTEMS_RESPONSE, PUBLIC_CACHE_CONTROL)
 
 # ============================================
 # Coupa cXML PunchOut Integration Routes
@@ -3222,13 +2245,12 @@ async def punchout_setup(request: Request):
     try:
         # Get raw XML body
         body = await request.body()
-        xml_content = body.decode("utf-8")
         
-        logger.info(f"PunchOut setup request received, length: {len(xml_content)}")
+        logger.info(f"PunchOut setup request received, length: {len(body)}")
         
-        # Parse the cXML request
+        # Parse the cXML request (raw bytes; the parser honours the declared encoding)
         try:
-            parsed = parse_punchout_setup_request(xml_content)
+            parsed = parse_punchout_setup_request(body)
         except ValueError as e:
             error_response = create_punchout_setup_response(
                 success=False,
@@ -3245,7 +2267,7 @@ async def punchout_setup(request: Request):
             logger.warning(f"PunchOut authentication failed for {parsed.get('from_identity', 'unknown')}")
             
             # Log the failed attempt
-            await log_punchout_transaction(
+            log_punchout_transaction(
                 db,
                 transaction_type="setup_failed",
                 session_token="",
@@ -3279,7 +2301,7 @@ async def punchout_setup(request: Request):
             await save_punchout_session_to_db(db, session_token, session_data)
         
         # Log successful setup
-        await log_punchout_transaction(
+        log_punchout_transaction(
             db,
             transaction_type="setup_success",
             session_token=session_token,
@@ -3330,12 +2352,8 @@ async def get_punchout_session_info(session_token: str):
     Get PunchOut session information.
     Used by the frontend to verify punchout mode and get session details.
     """
-    # Try memory first
-    session = get_punchout_session(session_token)
-    
-    # Fall back to database
-    if not session:
-        session = await get_punchout_session_from_db(db, session_token)
+    # This worker's cache first, then the database
+    session = await load_punchout_session(db, session_token)
     
     if not session:
         raise HTTPException(status_code=404, detail="PunchOut session not found or expired")
@@ -3378,9 +2396,7 @@ async def update_punchout_session_cart(cart_update: PunchOutCartUpdate):
     session_token = cart_update.session_token
     
     # Get session from memory or database
-    session = get_punchout_session(session_token)
-    if not session:
-        session = await get_punchout_session_from_db(db, session_token)
+    session = await load_punchout_session(db, session_token)
     
     if not session:
         raise HTTPException(status_code=404, detail="PunchOut session not found")
@@ -3388,14 +2404,17 @@ async def update_punchout_session_cart(cart_update: PunchOutCartUpdate):
     # Convert items to dict format
     cart_items = [item.model_dump() for item in cart_update.items]
     
-    # Update in memory
-    update_punchout_cart(session_token, cart_items)
-    
-    # Update in database
-    await db.punchout_sessions.update_one(
+    # Update in database; another worker may have closed the session since it was cached here
+    result = await db.punchout_sessions.update_one(
         {"session_token": session_token},
         {"$set": {"cart_items": cart_items, "updated_at": datetime.now(timezone.utc).isoformat()}}
     )
+    if result.matched_count == 0:
+        close_punchout_session(session_token)
+        raise HTTPException(status_code=404, detail="PunchOut session not found")
+    
+    # Update in memory
+    update_punchout_cart(session_token, cart_items)
     
     # Calculate total
     total = sum(item["unit_price"] * item["quantity"] for item in cart_items)
@@ -3416,10 +2435,8 @@ async def create_punchout_order(request: Request, session_token: str = Query(...
     This is called when user clicks "Transfer to Coupa" button.
     Returns cXML that gets POSTed to Coupa's BrowserFormPost URL.
     """
-    # Get session
-    session = get_punchout_session(session_token)
-    if not session:
-        session = await get_punchout_session_from_db(db, session_token)
+    # Get session (from the database: the cart may have been updated through another worker)
+    session = await load_punchout_session(db, session_token, fresh=True)
     
     if not session:
         raise HTTPException(status_code=404, detail="PunchOut session not found or expired")
@@ -3442,8 +2459,14 @@ async def create_punchout_order(request: Request, session_token: str = Query(...
         currency="USD"
     )
     
+    # Close the session; only the request that deletes it transfers the cart
+    close_punchout_session(session_token)
+    deleted = await db.punchout_sessions.delete_one({"session_token": session_token})
+    if deleted.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="PunchOut session not found or expired")
+    
     # Log the order
-    await log_punchout_transaction(
+    log_punchout_transaction(
         db,
         transaction_type="order_created",
         session_token=session_token,
@@ -3456,10 +2479,6 @@ async def create_punchout_order(request: Request, session_token: str = Query(...
         }
     )
     
-    # Close the session
-    close_punchout_session(session_token)
-    await db.punchout_sessions.delete_one({"session_token": session_token})
-    
     return {
         "success": True,
         "cxml": order_message,
@@ -3519,6 +2538,7 @@ async def submit_rfq(rfq: RFQCreate, current_user: dict = Depends(get_current_us
     
     await db.rfqs.insert_one(rfq_doc)
     await db.users.update_one({"id": current_user["id"]}, {"$inc": {"info_coins": 50}})
+    forget_cached_user(current_user["id"])
     
     return {"message": "RFQ submitted successfully", "rfq_id": rfq_doc["id"], "coins_earned": 50}
 
@@ -3604,8 +2624,8 @@ async def respond_to_quotation(quotation_id: str, response: QuotationResponse, c
     raise HTTPException(status_code=400, detail="Invalid action")
 
 # Order Routes
-@api_router.post("/orders/create")
-async def create_order(items: List[CartItem], current_user: dict = Depends(get_current_user)):
+@api_router.post("/orders/create", openapi_extra=json_body_schema(CART_ITEMS_ADAPTER))
+async def create_order(items: List[CartItem] = Depends(cart_items_body), current_user: dict = Depends(get_current_user)):
     currency = COUNTRY_CURRENCIES.get(current_user.get("country", "USA"), COUNTRY_CURRENCIES["USA"])
     total = sum(item.total_price for item in items)
     
@@ -3623,6 +2643,7 @@ async def create_order(items: List[CartItem], current_user: dict = Depends(get_c
     await db.orders.insert_one(order)
     coins = int(total / 10)
     await db.users.update_one({"id": current_user["id"]}, {"$inc": {"info_coins": coins}})
+    forget_cached_user(current_user["id"])
     
     return {"message": "Order placed successfully", "order_id": order["id"], "coins_earned": coins}
 
@@ -3764,7 +2785,7 @@ async def bulk_upload(file: UploadFile = File(...), current_user: dict = Depends
     import openpyxl
     from io import BytesIO
     
-    content = await file.read()
+    content = await read_upload(file)
     wb = openpyxl.load_workbook(BytesIO(content))
     sheet = wb.active
     
@@ -3780,7 +2801,7 @@ async def bulk_upload(file: UploadFile = File(...), current_user: dict = Depends
         quantity = int(row[1]) if len(row) > 1 and row[1] else 1
         
         if random.random() < 0.70:
-            product = generate_product_data(random.randint(1, 10000), random.choice([c["name"] for c in MRO_CATEGORIES]), random.choice([b["name"] for b in MRO_BRANDS]))
+            product = generate_product_data(random.randint(1, 10000), random.choice(MRO_CATEGORY_NAMES), random.choice(MRO_BRAND_NAMES))
             results.append({
                 "search_term": product_name, "found": True,
                 "product": {"id": product["id"], "name": product["name"], "price": round(product["base_price"] * currency["rate"], 2),
@@ -3800,12 +2821,12 @@ async def get_infocoin_balance(current_user: dict = Depends(get_current_user)):
     return {"balance": user.get("info_coins", 0)}
 
 @api_router.get("/infocoins/rewards")
-async def get_rewards():
-    return {"rewards": INFOCOIN_REWARDS}
+async def get_rewards(request: Request):
+    return cached_json_response(request, INFOCOIN_REWARDS_RESPONSE)
 
 @api_router.post("/infocoins/redeem/{reward_id}")
 async def redeem_reward(reward_id: str, current_user: dict = Depends(get_current_user)):
-    reward = next((r for r in INFOCOIN_REWARDS if r["id"] == reward_id), None)
+    reward = REWARD_BY_ID.get(reward_id)
     if not reward:
         raise HTTPException(status_code=404, detail="Reward not found")
     
@@ -3814,6 +2835,7 @@ async def redeem_reward(reward_id: str, current_user: dict = Depends(get_current
         raise HTTPException(status_code=400, detail="Insufficient InfoCoins")
     
     await db.users.update_one({"id": current_user["id"]}, {"$inc": {"info_coins": -reward["coins_required"]}})
+    forget_cached_user(current_user["id"])
     
     redemption = {
         "id": str(uuid.uuid4()), "user_id": current_user["id"], "reward_id": reward_id,
@@ -3883,6 +2905,7 @@ DELIVERY_PARTNERS = [
     {"id": "zoro", "name": "Zoro", "logo": None, "color": "#FF6600"},
     {"id": "uline", "name": "Uline", "logo": None, "color": "#003366"},
 ]
+DELIVERY_PARTNER_BY_ID = {partner["id"]: partner for partner in DELIVERY_PARTNERS}
 
 class AdminLogin(BaseModel):
     username: str
@@ -3927,25 +2950,24 @@ async def upload_vendor_catalog(
     Accepts CSV/Excel files with product or service data
     """
     # Validate partner
-    partner = next((p for p in DELIVERY_PARTNERS if p["id"] == partner_id), None)
+    partner = DELIVERY_PARTNER_BY_ID.get(partner_id)
     if not partner:
         raise HTTPException(status_code=400, detail=f"Invalid delivery partner: {partner_id}")
     
     # Validate file type
-    allowed_extensions = ['.csv', '.xlsx', '.xls']
-    file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in allowed_extensions:
-        raise HTTPException(status_code=400, detail=f"File type not supported. Allowed: {', '.join(allowed_extensions)}")
+    file_format = await upload_format(
+        file, SPREADSHEET_FORMATS, f"File type not supported. Allowed: {', '.join(SPREADSHEET_FORMATS)}"
+    )
     
     # Read file content
-    content = await file.read()
+    content = await read_upload(file)
     
     products_imported = 0
     services_imported = 0
     errors = []
     
     try:
-        if file_ext == '.csv':
+        if file_format == '.csv':
             import csv
             import io
             
@@ -4657,9 +3679,9 @@ async def upload_quotation(
     current_user: dict = Depends(get_current_user)
 ):
     """Upload a quotation document for AI-powered analysis"""
+    # Read file content
+    file_content = await read_upload(file)
     try:
-        # Read file content
-        file_content = await file.read()
         file_size = len(file_content)
         
         # Generate unique quotation ID
@@ -4737,9 +3759,9 @@ async def upload_quotation_with_real_ai(
     current_user: dict = Depends(get_current_user)
 ):
     """Upload a quotation and perform REAL AI-powered analysis using GPT-5.2, Claude, and Gemini"""
+    # Read file content
+    file_content = await read_upload(file)
     try:
-        # Read file content
-        file_content = await file.read()
         file_size = len(file_content)
         
         # Generate unique quotation ID
@@ -5342,7 +4364,8 @@ async def add_quotation_to_cart(
     items_added = 0
     for item in quotation.get("extracted_data", {}).get("line_items", []):
         cart_item = {
-            "user_id": current_user.get("email"),
+            "id": new_uuid4(),
+            "user_id": current_user["id"],
             "product_id": f"QUP-ITEM-{uuid.uuid4().hex[:8]}",
             "product_name": item["description"],
             "brand": quotation.get("supplier_name", "Unknown"),
@@ -5358,7 +4381,7 @@ async def add_quotation_to_cart(
             "quotation_id": quotation_id,
             "added_at": datetime.now(timezone.utc).isoformat()
         }
-        await db.carts.insert_one(cart_item)
+        await db.cart_items.insert_one(cart_item)
         items_added += 1
     
     await db.quotation_uploads.update_one(
@@ -6499,41 +5522,12 @@ async def search_catalog_for_agent(query: str, search_type: str, user: dict, lim
         matched_products = []
         seen_ids = set()
         
-        # 1. First search in-memory catalogs (IT_PRODUCTS_CATALOG + NEW_VENDOR_PRODUCTS)
-        for product in IT_PRODUCTS_CATALOG + NEW_VENDOR_PRODUCTS:
-            name_lower = product.get("name", "").lower()
-            desc_lower = product.get("short_description", "").lower()
-            brand_lower = product.get("brand", "").lower()
-            category_lower = product.get("category", "").lower()
-            sku_lower = product.get("sku", "").lower()
-            
-            # Calculate match score for ranking
-            score = 0
-            
-            # Exact phrase match (highest priority)
-            if query_lower in name_lower:
-                score += 100
-            if query_lower in sku_lower:
-                score += 90  # SKU/Part number match is very important
-            if query_lower in brand_lower:
-                score += 80
-            
-            # Term-by-term matching
-            for term in query_terms:
-                if term in name_lower:
-                    score += 30
-                if term in brand_lower:
-                    score += 25
-                if term in category_lower:
-                    score += 20
-                if term in desc_lower:
-                    score += 10
-                if term in sku_lower:
-                    score += 35
-            
-            if score > 0:
-                matched_products.append((score, product))
-                seen_ids.add(product["id"])
+        # 1. First search in-memory catalogs (IT_PRODUCTS_CATALOG + NEW_VENDOR_PRODUCTS), scored column-wise
+        catalog_index = get_product_index()
+        for row, score in catalog_index.match_scores(query_lower, query_terms):
+            product = catalog_index.products[row]
+            matched_products.append((score, product))
+            seen_ids.add(product["id"])
         
         # 2. Search MongoDB vendor_products collection (uploaded catalogs)
         try:
@@ -7004,16 +5998,11 @@ async def upload_partner_discounts(file: UploadFile = File(...), vendor: str = F
     Upload category discounts for a vendor
     Excel format: Category Name, Discount %
     """
-    if not file.filename.endswith(('.xlsx', '.xls', '.csv')):
-        raise HTTPException(status_code=400, detail="File must be Excel (.xlsx, .xls) or CSV (.csv)")
+    file_format = await upload_format(file, SPREADSHEET_FORMATS, "File must be Excel (.xlsx, .xls) or CSV (.csv)")
+    content = await read_upload(file)
     
     try:
-        content = await file.read()
-        
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(io.BytesIO(content))
-        else:
-            df = pd.read_excel(io.BytesIO(content))
+        df = read_frame(content, file_format)
         
         # Find category and discount columns
         category_col = None
@@ -7131,8 +6120,7 @@ async def upload_infoshop_catalog(
     - Auto-classifies UNSPSC codes
     - Validates images
     """
-    if not file.filename.endswith(('.xlsx', '.xls', '.csv')):
-        raise HTTPException(status_code=400, detail="File must be Excel (.xlsx, .xls) or CSV (.csv)")
+    file_format = await upload_format(file, SPREADSHEET_FORMATS, "File must be Excel (.xlsx, .xls) or CSV (.csv)")
     
     if vendor.lower() not in [p.lower() for p in ACTIVE_PARTNERS]:
         raise HTTPException(
@@ -7140,13 +6128,10 @@ async def upload_infoshop_catalog(
             detail=f"Vendor '{vendor}' not in active partners: {ACTIVE_PARTNERS}"
         )
     
+    content = await read_upload(file)
+    
     try:
-        content = await file.read()
-        
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(io.BytesIO(content))
-        else:
-            df = pd.read_excel(io.BytesIO(content))
+        df = read_frame(content, file_format)
         
         logger.info(f"Processing {len(df)} products from {vendor}")
         
@@ -7264,8 +6249,7 @@ async def upload_large_catalog(
     
     Returns job_id for tracking progress via /api/infoshop/jobs/{job_id}
     """
-    if not file.filename.endswith(('.xlsx', '.xls', '.csv')):
-        raise HTTPException(status_code=400, detail="File must be Excel (.xlsx, .xls) or CSV (.csv)")
+    await upload_format(file, SPREADSHEET_FORMATS, "File must be Excel (.xlsx, .xls) or CSV (.csv)")
     
     if vendor.lower() not in [p.lower() for p in ACTIVE_PARTNERS]:
         raise HTTPException(
@@ -7284,9 +6268,12 @@ async def upload_large_catalog(
         file_path = upload_dir / safe_filename
         
         # Stream file to disk
-        with open(file_path, "wb") as f:
-            while chunk := await file.read(1024 * 1024):  # 1MB chunks
-                f.write(chunk)
+        try:
+            with open(file_path, "wb") as f:
+                await copy_upload(file, f, MAX_CATALOG_UPLOAD_BYTES)
+        except HTTPException:
+            file_path.unlink(missing_ok=True)
+            raise
         
         logger.info(f"Saved large file: {file_path}")
         
@@ -7518,10 +6505,8 @@ async def prepare_cart_transfer(request: InfoShopCartTransfer):
             detail="Delivery attention (recipient name) is required"
         )
     
-    # Verify PunchOut session
-    session = get_punchout_session(request.session_token)
-    if not session:
-        session = await get_punchout_session_from_db(db, request.session_token)
+    # Verify PunchOut session (from MongoDB: it may have been transferred through another worker)
+    session = await load_punchout_session(db, request.session_token, fresh=True)
     
     if not session:
         raise HTTPException(status_code=404, detail="PunchOut session not found or expired")
@@ -7544,8 +6529,14 @@ async def prepare_cart_transfer(request: InfoShopCartTransfer):
     session["cart_total"] = total_amount
     session["ready_for_transfer"] = True
     
-    # Save to database
-    await save_punchout_session_to_db(db, session)
+    # Save to database without upsert, so a session closed meanwhile is not brought back
+    result = await db.punchout_sessions.update_one(
+        {"session_token": request.session_token},
+        {"$set": {key: session[key] for key in ("cart_items", "shipping_info", "cart_total", "ready_for_transfer")}}
+    )
+    if result.matched_count == 0:
+        close_punchout_session(request.session_token)
+        raise HTTPException(status_code=404, detail="PunchOut session not found or expired")
     
     return {
         "success": True,
@@ -7750,6 +6741,61 @@ async def startup_db_client():
     except Exception as e:
         logger.warning(f"Index creation warning (may already exist): {e}")
 
+@app.on_event("startup")
+async def create_user_indexes():
+    """Index the users collection for the login upsert (by email) and token lookups (by id)"""
+    try:
+        await db.users.create_index("email", unique=True, name="users_email")
+        await db.users.create_index("id", name="users_id")
+    except Exception as e:
+        logger.warning(f"User index creation warning: {e}")
+
+@app.on_event("startup")
+async def create_cart_indexes():
+    """Index cart items by (user_id, id) and move items out of legacy per-user cart arrays"""
+    try:
+        await db.cart_items.create_index([("user_id", 1), ("id", 1)], unique=True, name="cart_items_user_id")
+        async for cart in db.carts.find({"items.0": {"$exists": True}}, {"user_id": 1, "items": 1}):
+            moves = [
+                UpdateOne({"user_id": cart["user_id"], "id": item["id"]}, {"$setOnInsert": item}, upsert=True)
+                for item in cart["items"] if item.get("id")
+            ]
+            if moves:
+                await db.cart_items.bulk_write(moves)
+            await db.carts.update_one({"_id": cart["_id"]}, {"$set": {"items": []}})
+    except Exception as e:
+        logger.warning(f"Cart index creation warning: {e}")
+
+@app.on_event("startup")
+async def create_contract_indexes():
+    """Backfill the lowercased supplier name on older contracts and index it for exact lookups.
+
+    Contracts that share a lowercased name (case variants left by the old regex upsert, or
+    several contracts without a supplier name) would break the unique index, so they are
+    reported and startup fails until they are merged.
+    """
+    try:
+        await db.supplier_contracts.update_many(
+            {"supplier_name_lc": {"$exists": False}, "supplier_name": {"$type": "string"}},
+            [{"$set": {"supplier_name_lc": {"$toLower": "$supplier_name"}}}]
+        )
+        collisions = await db.supplier_contracts.aggregate([
+            {"$group": {"_id": "$supplier_name_lc", "names": {"$push": "$supplier_name"}, "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+        ]).to_list(None)
+    except ConnectionFailure as e:
+        logger.warning(f"Contract index creation warning: {e}")
+        return
+    if collisions:
+        report = "; ".join(
+            f"{'(no supplier name)' if c['_id'] is None else repr(c['_id'])}: {c['count']} contracts {c['names']}"
+            for c in collisions
+        )
+        logger.error(f"Duplicate supplier contracts block the supplier_name_lc unique index: {report}")
+        raise RuntimeError(f"Merge duplicate supplier contracts before starting: {report}")
+    await db.supplier_contracts.create_index("supplier_name_lc", unique=True, name="supplier_contracts_name_lc")
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await flush_punchout_logs(db)
     client.close()
@@ -0,0 +1,39 @@
+"""
+Static Catalog Backend Tests
+Tests for: ETag revalidation and precompression of the preserialized static bodies
+"""
+
+import requests
+import os
+
+# Get BASE_URL from environment
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+class TestCatalogETag:
+    """Test ETag revalidation and precompression on the preserialized responses"""
+
+    def test_categories_not_modified(self):
+        """Repeating the categories request with If-None-Match returns 304"""
+        response = requests.get(f"{BASE_URL}/api/products/categories")
+        etag = response.headers.get("ETag")
+        assert etag
+        cached = requests.get(f"{BASE_URL}/api/products/categories", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+    def test_categories_precompressed(self):
+        """gzip clients get the precompressed categories body with its own ETag"""
+        plain = requests.get(f"{BASE_URL}/api/products/categories", headers={"Accept-Encoding": "identity"})
+        compressed = requests.get(f"{BASE_URL}/api/products/categories", headers={"Accept-Encoding": "gzip"})
+        assert compressed.headers.get("Content-Encoding") == "gzip"
+        assert "Content-Encoding" not in plain.headers
+        assert compressed.json() == plain.json()
+        assert compressed.headers["ETag"] != plain.headers["ETag"]
+
+    def test_categories_brotli(self):
+        """br clients get the Brotli body in preference to gzip"""
+        plain = requests.get(f"{BASE_URL}/api/products/categories", headers={"Accept-Encoding": "identity"})
+        compressed = requests.get(f"{BASE_URL}/api/products/categories", headers={"Accept-Encoding": "gzip, br"})
+        assert compressed.headers.get("Content-Encoding") == "br"
+        assert compressed.json() == plain.json()